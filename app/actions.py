@@ -990,7 +990,7 @@ def resolve_trade_actions(game_id: str) -> None:
         print(f"Trade Between {nation1.name} and {nation2.name}")
         print("{:<21s}{:<33s}{:<33s}".format("Resource", nation1.name, nation2.name))
         for resource_name in trade_resources:
-            print("{:<21s}{:<33s}{:<33s}".format(resource_name, nation1.get_stockpile(resource_name), nation2.get_stockpile(resource_name)))
+            print("{:<21s}{:<33.2f}{:<33.2f}".format(resource_name, nation1.get_stockpile(resource_name), nation2.get_stockpile(resource_name)))
         
         # create trade deal dict
         trade_valid = True
@@ -1058,10 +1058,10 @@ def resolve_trade_actions(game_id: str) -> None:
                 nation2.update_stockpile("Dollars", -1 * abs(amount) * nation2_fee)
 
             # validate transaction
-            if float(nation1.get_stockpile("Dollars")) < 0 or float(nation2.get_stockpile("Dollars")) < 0:
+            if nation1.get_stockpile("Dollars") < 0 or nation2.get_stockpile("Dollars") < 0:
                 trade_valid = False
                 break
-            if float(nation1.get_stockpile(resource_name)) < 0 or float(nation2.get_stockpile(resource_name)) < 0:
+            if nation1.get_stockpile(resource_name) < 0 or nation2.get_stockpile(resource_name) < 0:
                 trade_valid = False
                 break
 
@@ -1202,7 +1202,7 @@ def resolve_research_actions(game_id: str, actions_list: list[ResearchAction]) -
 
             cost += nation.calculate_agenda_cost_adjustment(action.research_name)
 
-            if float(nation.get_stockpile("Political Power")) - cost < 0:
+            if nation.get_stockpile("Political Power") - cost < 0:
                 nation.action_log.append(f"Failed to research {action.research_name}. Not enough political power.")
                 continue
 
@@ -1221,22 +1221,21 @@ def resolve_research_actions(game_id: str, actions_list: list[ResearchAction]) -
                 continue
 
             multiplier = 1.0
-            for alliance in Alliances:
-                if alliance.is_active and nation.name in alliance.current_members and alliance.type == "Research Agreement":
-                    for ally_name in alliance.current_members:
-                        ally_nation = Nations.get(ally_name)
-                        if ally_name == nation.name:
-                            continue
-                        if action.research_name in ally_nation.completed_research:
-                            multiplier -= 0.2
-                            break
+            for alliance in Alliances.memberships(nation.name, "Research Agreement"):
+                for ally_name in alliance.current_members:
+                    ally_nation = Nations.get(ally_name)
+                    if ally_name == nation.name:
+                        continue
+                    if action.research_name in ally_nation.completed_research:
+                        multiplier -= 0.2
+                        break
             if multiplier < 0:
                 multiplier = 0.2
             if multiplier != 1.0:
                 cost *= multiplier
                 cost = int(cost)
 
-            if float(nation.get_stockpile("Research")) - cost < 0:
+            if nation.get_stockpile("Research") - cost < 0:
                 nation.action_log.append(f"Failed to research {action.research_name}. Not enough technology.")
                 continue
 
@@ -1393,7 +1392,7 @@ def resolve_claim_actions(game_id: str, actions_list: list[ClaimAction]) -> None
             continue
 
         minimum_spend[nation.id] += target_region.calculate_region_claim_cost(nation)
-        if float(nation.get_stockpile("Dollars")) - minimum_spend[nation.id] < 0:
+        if nation.get_stockpile("Dollars") - minimum_spend[nation.id] < 0:
             nation.action_log.append(f"Failed to claim {target_region.id}. Insufficient dollars.")
             continue
         
@@ -1480,7 +1479,7 @@ def _check_all_claims(game_id: str, claimed_regions: set[str]) -> set:
             continue
 
         cost = target_region.calculate_region_claim_cost(nation)
-        if float(nation.get_stockpile("Dollars")) - cost < 0:
+        if nation.get_stockpile("Dollars") - cost < 0:
             # nation could not afford region
             nation.action_log.append(f"Failed to claim {target_region.id}. Insufficient dollars.")
             failed.add(target_region.id)
@@ -1608,7 +1607,7 @@ def _resolve_all_claims(game_id: str, verified_claim_actions: set[str]) -> None:
                 continue
             encircled_cost += encircled_region.calculate_region_claim_cost(nation)
         
-        if float(nation.get_stockpile("Dollars")) - encircled_cost < 0:
+        if nation.get_stockpile("Dollars") - encircled_cost < 0:
             # player cannot afford to claim the unclaimed regions it has encircled
             nation.update_stockpile("Dollars", target_region.calculate_region_claim_cost(nation))
             nation.action_log.append(f"Failed to claim {target_region.id}. You could not afford to pay for the unclaimed regions this claim action encircled.")
@@ -1791,7 +1790,7 @@ def resolve_improvement_build_actions(game_id: str, actions_list: list[Improveme
 
         valid = True
         for resource_name, cost in build_cost_dict.items():
-            if float(nation.get_stockpile(resource_name)) - cost < 0:
+            if nation.get_stockpile(resource_name) - cost < 0:
                 valid = False
                 break
         if not valid:
@@ -1830,7 +1829,7 @@ def resolve_missile_make_actions(game_id: str, actions_list: list[MissileMakeAct
         valid = True
         for resource_name, cost in build_cost_dict.items():
             total_cost = cost * action.quantity
-            if float(nation.get_stockpile(resource_name)) - total_cost < 0:
+            if nation.get_stockpile(resource_name) - total_cost < 0:
                 valid = False
                 break
         if not valid:
@@ -1866,7 +1865,7 @@ def resolve_government_actions(game_id: str, actions_list: list[RepublicAction])
             continue
         
         cost = 5
-        if float(nation.get_stockpile("Political Power")) - cost < 0:
+        if nation.get_stockpile("Political Power") - cost < 0:
             nation.action_log.append(f"Failed to execute Republic government action. Insufficient political power.")
             continue
 
@@ -1876,7 +1875,7 @@ def resolve_government_actions(game_id: str, actions_list: list[RepublicAction])
             f"{action.resource_name} Rate": 20,
             "Expire Turn": 99999
         }
-        nation.tags["Republic Bonus"] = new_tag
+        nation.add_tag("Republic Bonus", new_tag)
         nation.action_log.append(f"Used Republic government action to boost {action.resource_name} income.")
         Notifications.add(f"{nation.name} used Republic government action to boost {action.resource_name} income.", 9)
 
@@ -1936,19 +1935,14 @@ def resolve_market_actions(game_id: str, crime_list: list[CrimeSyndicateAction],
         
         nation = Nations.get(action.id)
         price = data[action.resource_name]["Current Price"]
-        rate = 1.0
+        rate = nation.modifiers.market_buy_rate
         
         if "Embargo" in nation.tags:
             nation.action_log.append(f"Failed to buy {action.quantity} {action.resource_name}. Your nation is currently under an embargo.")
             continue
 
-        for tag_name, tag_data in nation.tags.items():
-            rate -= float(tag_data.get("Market Buy Modifier", 0))
-        if "Improved Logistics" in nation.completed_research:
-            rate -= 0.2
-
         cost = round(action.quantity * price * rate, 2)
-        if float(nation.get_stockpile("Dollars")) - cost < 0:
+        if nation.get_stockpile("Dollars") - cost < 0:
             nation.action_log.append(f"Failed to buy {action.quantity} {action.resource_name}. Insufficient dollars.")
             continue
 
@@ -1963,16 +1957,13 @@ def resolve_market_actions(game_id: str, crime_list: list[CrimeSyndicateAction],
         
         nation = Nations.get(action.id)
         price = float(data[action.resource_name]["Current Price"] * 0.5)
-        rate = 1.0
+        rate = nation.modifiers.market_sell_rate
 
         if "Embargo" in nation.tags:
             nation.action_log.append(f"Failed to sell {action.quantity} {action.resource_name}. Your nation is currently under an embargo.")
             continue
 
-        for tag_name, tag_data in nation.tags.items():
-            rate += float(tag_data.get("Market Sell Modifier", 0))
-
-        if float(nation.get_stockpile(action.resource_name)) - action.quantity < 0:
+        if nation.get_stockpile(action.resource_name) - action.quantity < 0:
             nation.action_log.append(f"Failed to sell {action.quantity} {action.resource_name}. Insufficient resources in stockpile.")
             continue
 
@@ -2081,7 +2072,7 @@ def resolve_unit_deployment_actions(game_id: str, actions_list: list[UnitDeployA
 
         valid = True
         for resource_name, cost in build_cost_dict.items():
-            if float(nation.get_stockpile(resource_name)) - cost < 0:
+            if nation.get_stockpile(resource_name) - cost < 0:
                 valid = False
                 break
         if not valid:
@@ -2133,7 +2124,7 @@ def resolve_war_actions(game_id: str, actions_list: list[WarAction]) -> None:
             
             manage_claims = ManageWarClaims(attacker_nation.name, action.war_justification)
             claim_cost, region_claims_list = manage_claims.get_war_claims()
-            if float(attacker_nation.get_stockpile("Political Power")) - claim_cost < 0:
+            if attacker_nation.get_stockpile("Political Power") - claim_cost < 0:
                 attacker_nation.action_log.append(f"Failed to declare a {action.war_justification} war on {defender_nation.name}. Not enough political power for war claims.")
                 continue
 
@@ -2164,7 +2155,7 @@ def resolve_war_join_actions(game_id: str, actions_list: list[WarJoinAction]) ->
             
             manage_claims = ManageWarClaims(nation.name, action.war_justification)
             claim_cost, region_claims_list = manage_claims.get_war_claims()
-            if float(nation.get_stockpile("Political Power")) - claim_cost < 0:
+            if nation.get_stockpile("Political Power") - claim_cost < 0:
                 nation.action_log.append(f"Error: Not enough political power for war claims.")
                 continue
             
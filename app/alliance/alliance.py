@@ -16,7 +16,9 @@ class Alliance:
 
     @type.setter
     def type(self, value: str) -> None:
+        from .alliances import Alliances
         self._data["allianceType"] = value
+        Alliances.reindex()
     
     @property
     def turn_created(self) -> int:
@@ -32,7 +34,9 @@ class Alliance:
     
     @turn_ended.setter
     def turn_ended(self, value: int) -> None:
+        from .alliances import Alliances
         self._data["turnEnded"] = value
+        Alliances.reindex()
     
     @property
     def is_active(self) -> bool:
@@ -52,7 +56,9 @@ class Alliance:
 
     @current_members.setter
     def current_members(self, value: dict) -> None:
+        from .alliances import Alliances
         self._data["currentMembers"] = value
+        Alliances.reindex()
 
     @property
     def founding_members(self) -> dict[str, int]:
@@ -71,14 +77,19 @@ class Alliance:
         self._data["formerMembers"] = value
 
     def add_member(self, nation_name: str) -> None:
+        from .alliances import Alliances
         game = Games.load(self._game_id)
         if nation_name in self.former_members:
             del self.former_members[nation_name]
+        is_new_member = nation_name not in self.current_members
         self.current_members[nation_name] = game.turn
+        if is_new_member:
+            Alliances.index_member(self, nation_name)
 
     def remove_member(self, nation_name: str) -> None:
         from app.nation.nations import Nations
         from app.truce.truces import Truces
+        from .alliances import Alliances
         
         game = Games.load(self._game_id)
 
@@ -91,6 +102,7 @@ class Alliance:
             allied_nation = Nations.get(allied_nation_name)
             Truces.create([nation.id, allied_nation.id], 2)
         
+        Alliances.unindex_member(self, nation_name)
         del self.current_members[nation_name]
         self.former_members[nation_name] = game.turn
 
@@ -3,6 +3,7 @@ import os
 from dataclasses import dataclass
 from typing import ClassVar, Iterator, Tuple
 
+from app import storage
 from app.game.games import Games
 from .alliance import Alliance
 
@@ -20,6 +21,8 @@ class Alliances(metaclass=AlliancesMeta):
     
     game_id: ClassVar[str] = None
     _data: ClassVar[dict[str, dict]] = None
+    _memberships: ClassVar[dict[str, dict[str, dict[str, None]]]] = {}
+    _allied_pairs: ClassVar[dict[frozenset, int]] = {}
 
     @classmethod
     def _gamedata_path(cls) -> str:
@@ -37,7 +40,72 @@ class Alliances(metaclass=AlliancesMeta):
         with open(path, 'r') as file:
             gamedata_dict = json.load(file)
 
-        cls._data = gamedata_dict["alliances"]
+        cls.attach(game_id, gamedata_dict["alliances"])
+
+    @classmethod
+    def attach(cls, game_id: str, data: dict) -> None:
+        """
+        Binds this class to alliances data that has already been read from gamedata.json.
+        """
+        cls.game_id = game_id
+        cls._data = data
+        cls.reindex()
+
+    @classmethod
+    def reindex(cls) -> None:
+        """
+        Rebuilds the alliance membership lookup tables from scratch.
+        """
+        cls._memberships = {}
+        cls._allied_pairs = {}
+        for alliance in cls:
+            for nation_name in alliance.current_members:
+                cls.index_member(alliance, nation_name)
+
+    @classmethod
+    def index_member(cls, alliance: Alliance, nation_name: str) -> None:
+        """
+        Adds a current member of an active alliance to the lookup tables. Call after the member has been added to the alliance.
+
+        Params:
+            alliance (Alliance): Alliance the nation is a member of.
+            nation_name (str): Name of the member nation.
+        """
+        if not alliance.is_active:
+            return
+
+        alliances_by_type = cls._memberships.setdefault(nation_name, {})
+        alliances_by_type.setdefault(alliance.type, {})[alliance.name] = None
+        
+        for member_name in alliance.current_members:
+            if member_name != nation_name:
+                pair = frozenset((nation_name, member_name))
+                cls._allied_pairs[pair] = cls._allied_pairs.get(pair, 0) + 1
+
+    @classmethod
+    def unindex_member(cls, alliance: Alliance, nation_name: str) -> None:
+        """
+        Removes a member of an active alliance from the lookup tables. Call before the member is removed from the alliance.
+
+        Params:
+            alliance (Alliance): Alliance the nation is leaving.
+            nation_name (str): Name of the member nation.
+        """
+        if not alliance.is_active:
+            return
+
+        alliances_by_type = cls._memberships.get(nation_name, {})
+        alliances_by_type.get(alliance.type, {}).pop(alliance.name, None)
+
+        for member_name in alliance.current_members:
+            if member_name == nation_name:
+                continue
+            pair = frozenset((nation_name, member_name))
+            count = cls._allied_pairs.get(pair, 0) - 1
+            if count > 0:
+                cls._allied_pairs[pair] = count
+            else:
+                cls._allied_pairs.pop(pair, None)
 
     @classmethod
     def save(cls) -> None:
@@ -46,12 +114,10 @@ class Alliances(metaclass=AlliancesMeta):
             raise RuntimeError("Error: Alliances has not been loaded.")
         
         gamedata_filepath = f"gamedata/{cls.game_id}/gamedata.json"
-        with open(gamedata_filepath, 'r') as json_file:
-            gamedata_dict = json.load(json_file)
-
+        gamedata_dict = storage.load_json(gamedata_filepath)
         gamedata_dict["alliances"] = cls._data
-        with open(gamedata_filepath, 'w') as json_file:
-            json.dump(gamedata_dict, json_file, indent=4)
+        storage.save_json(gamedata_filepath, gamedata_dict)
+        storage.bump_state_version(cls.game_id)
 
     @classmethod
     def create(cls, alliance_name: str, alliance_type: str, founding_members: list[str]) -> None:
@@ -72,6 +138,9 @@ class Alliances(metaclass=AlliancesMeta):
             new_alliance_data["foundingMembers"][nation_name] = game.turn
 
         cls._data[alliance_name] = new_alliance_data
+        new_alliance = cls.get(alliance_name)
+        for nation_name in new_alliance.current_members:
+            cls.index_member(new_alliance, nation_name)
     
     @classmethod
     def get(cls, alliance_name: str) -> "Alliance":
@@ -79,14 +148,28 @@ class Alliances(metaclass=AlliancesMeta):
             return Alliance(alliance_name, cls._data[alliance_name], cls.game_id)
         return None
     
+    @classmethod
+    def memberships(cls, nation_name: str, type_to_search = "ALL") -> list["Alliance"]:
+        """
+        Returns all active alliances a nation is a member of.
+
+        Params:
+            nation_name (str): Name of the nation.
+            type_to_search (str): Only return alliances of this type. Defaults to all alliance types.
+        """
+        
+        alliances_by_type = cls._memberships.get(nation_name, {})
+        
+        if type_to_search == "ALL":
+            alliance_names = [name for names in alliances_by_type.values() for name in names]
+        else:
+            alliance_names = list(alliances_by_type.get(type_to_search, {}))
+        
+        return [cls.get(alliance_name) for alliance_name in alliance_names]
+
     @classmethod
     def are_allied(cls, nation_name_1: str, nation_name_2: str) -> bool:
-        for alliance in cls:
-            if (alliance.is_active
-                and nation_name_1 in alliance.current_members
-                and nation_name_2 in alliance.current_members):
-                return True
-        return False
+        return frozenset((nation_name_1, nation_name_2)) in cls._allied_pairs
 
     @classmethod
     def allies(cls, nation_name: str, type_to_search = "ALL") -> list:
@@ -94,13 +177,10 @@ class Alliances(metaclass=AlliancesMeta):
         from app.nation.nations import Nations
 
         allies_set = set()
-        for alliance in cls:
-            if alliance.is_active and nation_name in alliance.current_members:
-                if type_to_search != "ALL" and type_to_search != alliance.type:
-                    continue
-                for alliance_member_name in alliance.current_members:
-                    if alliance_member_name != nation_name:
-                        allies_set.add(alliance_member_name)
+        for alliance in cls.memberships(nation_name, type_to_search):
+            for alliance_member_name in alliance.current_members:
+                if alliance_member_name != nation_name:
+                    allies_set.add(alliance_member_name)
 
         allies_list = []
         for nation_name in allies_set:
@@ -12,7 +12,7 @@ def gain_income() -> None:
         for resource_name in nation._resources:
             if resource_name in ["Energy", "Military Capacity"]:
                 continue
-            amount = float(nation.get_income(resource_name))
+            amount = nation.get_income(resource_name)
             nation.update_stockpile(resource_name, amount)
 
 def gain_market_income(market_results: dict) -> None:
@@ -40,7 +40,7 @@ def resolve_military_capacity_shortages(game_id: str) -> None:
 
     for nation in Nations:
         
-        while float(nation.get_used_mc()) > float(nation.get_max_mc()):
+        while nation.get_used_mc() > nation.get_max_mc():
             
             region_id, victim = destroy.search_and_destroy_unit(nation.id, 'ANY')
             nation.unit_counts[victim] -= 1
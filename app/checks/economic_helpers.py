@@ -1,5 +1,4 @@
 
-from app.scenario.scenario import ScenarioInterface as SD
 from app.nation.nation import Nation
 
 def create_player_yield_dict(nation: Nation) -> dict:
@@ -14,44 +13,15 @@ def create_player_yield_dict(nation: Nation) -> dict:
         dict: Yield dictionary detailing income and multiplier for every improvement.
     """
     
-    # build yield dict
+    # yields from research are compiled once per nation, only copy the improvements the player has
     yield_dict = {}
-    for improvement_name, improvement_data in SD.improvements:
+    for improvement_name, resource_yields in nation.modifiers.improvement_yields.items():
         
         # no point in tracking the data for improvements the player does not have any of
         if nation.improvement_counts[improvement_name] == 0:
             continue
         
-        yield_dict[improvement_name] = {}
-        for resource_name in nation._resources:
-            yield_dict[improvement_name][resource_name] = {
-                "Income": 0,
-                "Income Multiplier": 1
-            }
-
-        for resource_name, amount in improvement_data.income.items():
-            yield_dict[improvement_name][resource_name]["Income"] = amount
-    
-    # get modifiers from each technology and agenda
-    for tech_name in nation.completed_research:   
-
-        if tech_name in SD.agendas:
-            tech_dict = SD.agendas[tech_name]
-        else:
-            tech_dict = SD.technologies[tech_name]
-        
-        for target in tech_dict.modifiers: 
-
-            # skip over modifiers that are not affecting improvements
-            if target not in yield_dict:
-                continue
-            
-            improvement_name = target
-            for resource_name, modifier_dict in tech_dict.modifiers[improvement_name].items():
-                if "Income" in modifier_dict:
-                    yield_dict[improvement_name][resource_name]["Income"] += modifier_dict["Income"]
-                elif "Income Multiplier" in modifier_dict:
-                    yield_dict[improvement_name][resource_name]["Income Multiplier"] += modifier_dict["Income Multiplier"]
+        yield_dict[improvement_name] = {resource_name: dict(values) for resource_name, values in resource_yields.items()}
 
     return yield_dict
 
@@ -67,59 +37,15 @@ def create_player_upkeep_dict(nation: Nation) -> dict:
         dict: Upkeep dictionary detailing upkeep and upkeep multiplier for every improvement.
     """
 
+    # upkeep from research is compiled once per nation, only copy the improvements and units the player has
     upkeep_dict = {}
+    for target_name, resource_upkeep in nation.modifiers.upkeep.items():
 
-    for improvement_name, improvement_data in SD.improvements:
-
-        # no point in tracking the data for improvements the player does not have any of
-        if nation.improvement_counts[improvement_name] == 0:
+        # no point in tracking the data for improvements or units the player does not have any of
+        if nation.improvement_counts.get(target_name, 0) == 0 and nation.unit_counts.get(target_name, 0) == 0:
             continue
         
-        upkeep_dict[improvement_name] = {}
-        for resource_name in ["Dollars", "Food", "Energy", "Coal", "Oil", "Uranium"]:  # tba - pull list from scenario files
-            upkeep_dict[improvement_name][resource_name] = {
-                "Upkeep": 0,
-                "Upkeep Multiplier": 1
-            }
-
-        for resource_name, amount in improvement_data.upkeep.items():
-            upkeep_dict[improvement_name][resource_name]["Upkeep"] = amount
-
-    for unit_name, unit_data in SD.units:
-
-        # no point in tracking the data for units the player does not have any of
-        if nation.unit_counts[unit_name] == 0:
-            continue
-        
-        upkeep_dict[unit_name] = {}
-        for resource_name in ["Dollars", "Food", "Energy", "Coal", "Oil", "Uranium"]:  # tba - pull list from scenario files
-            upkeep_dict[unit_name][resource_name] = {
-                "Upkeep": 0,
-                "Upkeep Multiplier": 1
-            }
-
-        for resource_name, amount in unit_data.upkeep.items():
-            upkeep_dict[unit_name][resource_name]["Upkeep"] = amount
-    
-    # get modifiers from each technology and agenda
-    for tech_name in nation.completed_research:
-        
-        if tech_name in SD.agendas:
-            tech_dict = SD.agendas[tech_name]
-        else:
-            tech_dict = SD.technologies[tech_name]
-
-        for target in tech_dict.modifiers: 
-            
-            # skip over effects that are not improvements or units
-            if target not in upkeep_dict:
-                continue
-            
-            for resource_name, modifier_dict in tech_dict.modifiers[target].items():
-                if "Upkeep" in modifier_dict:
-                    upkeep_dict[target][resource_name]["Upkeep"] += modifier_dict["Upkeep"]
-                elif "Upkeep Multiplier" in modifier_dict:
-                    upkeep_dict[target][resource_name]["Upkeep Multiplier"] += modifier_dict["Upkeep Multiplier"]
+        upkeep_dict[target_name] = {resource_name: dict(values) for resource_name, values in resource_upkeep.items()}
 
     return upkeep_dict
 
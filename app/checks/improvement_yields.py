@@ -0,0 +1,132 @@
+from app.game.games import Games
+from app.nation.nation import Nation
+from app.region.region import Region
+from app.region.regions import Regions
+
+# research required before a capital produces the resource of its region, None if no research is needed
+CAPITAL_RESOURCE_RESEARCH = {
+    "Coal": "Coal Mining",
+    "Oil": "Oil Drilling",
+    "Basic Materials": None,
+    "Common Metals": "Metal Extraction",
+    "Advanced Metals": "Metallurgy",
+    "Uranium": "Uranium Mining",
+    "Rare Earth Elements": "Rare Earth Mining"
+}
+
+class ImprovementYields:
+    """
+    Calculates the yield of every improvement during an income update.
+
+    Everything that only depends on the nation and the improvement type is worked out once per update, and the regions
+    next to a Central Bank or Capital are looked up from a single pass over the map. Only the Central Bank, capital boost,
+    pandemic, and capital resource bonuses are left to check per region.
+    """
+
+    def __init__(self, game_id: str, yield_dicts: dict[str, dict]):
+        """
+        Params:
+            game_id (str): Game ID string.
+            yield_dicts (dict): Yield dictionary of each nation keyed by nation name, see economic_helpers.create_player_yield_dict().
+        """
+
+        game = Games.load(game_id)
+        self.pandemic = "Pandemic" in game.active_events
+        self.yield_dicts = yield_dicts
+        self._tables: dict[tuple[str, str], tuple] = {}
+
+        # owner of every region holding an improvement that boosts its neighbours
+        self.central_bank_owners: dict[str, str] = {}
+        self.capital_owners: dict[str, str] = {}
+        for region in Regions:
+            if region.improvement.name == "Central Bank":
+                self.central_bank_owners[region.id] = region.data.owner_id
+            elif region.improvement.name == "Capital":
+                self.capital_owners[region.id] = region.data.owner_id
+
+    def _table(self, nation: Nation, improvement_name: str) -> tuple:
+        """
+        Returns the income and multiplier of each resource for an improvement type owned by a nation before any region bonuses,
+        along with the multiplier modifiers from tags that are applied after them.
+        """
+
+        key = (nation.name, improvement_name)
+        if key in self._tables:
+            return self._tables[key]
+
+        improvement_income_dict = self.yield_dicts[nation.name][improvement_name]
+        income = {resource_name: values["Income"] for resource_name, values in improvement_income_dict.items()}
+        multiplier = {resource_name: values["Income Multiplier"] for resource_name, values in improvement_income_dict.items()}
+
+        for resource_name, income_modifiers in nation.modifiers.tag_improvement_income.get(improvement_name, {}).items():
+            for income_modifier in income_modifiers:
+                income[resource_name] += income_modifier
+        tag_multipliers = nation.modifiers.tag_improvement_multipliers.get(improvement_name, {})
+
+        # multiplier when the region gets no bonuses of its own, tag modifiers are always added after the region bonuses
+        final_multiplier = {}
+        for resource_name, value in multiplier.items():
+            for income_modifier in tag_multipliers.get(resource_name, ()):
+                value += income_modifier
+            final_multiplier[resource_name] = value
+
+        self._tables[key] = (income, multiplier, tag_multipliers, final_multiplier)
+        return self._tables[key]
+
+    @staticmethod
+    def _is_adjacent(region: Region, improvement_owners: dict[str, str]) -> bool:
+        owner_id = region.data.owner_id
+        for region_id in region.graph.adjacent_regions:
+            if improvement_owners.get(region_id) == owner_id:
+                return True
+        return False
+
+    def calculate(self, region: Region, nation: Nation) -> dict[str, float]:
+        """
+        Calculates the final yield of the improvement in a region.
+
+        Returns:
+            dict: Contains all yields from this improvement.
+        """
+
+        improvement_name = region.improvement.name
+        income, multiplier, tag_multipliers, final_multiplier = self._table(nation, improvement_name)
+
+        central_bank_bonus = improvement_name != "Capital" and self._is_adjacent(region, self.central_bank_owners)
+        capital_bonus = nation.modifiers.capital_boost and self._is_adjacent(region, self.capital_owners)
+
+        if central_bank_bonus or capital_bonus or self.pandemic:
+            final_multiplier = {}
+            for resource_name, value in multiplier.items():
+                if central_bank_bonus:
+                    value += 0.2
+                if capital_bonus and resource_name not in ["Political Power", "Military Capacity"]:
+                    value += 1.0
+                if self.pandemic:
+                    penalty = 0
+                    if region.data.infection > 0:
+                        penalty += region.data.infection * 0.1
+                    if region.data.quarantine:
+                        penalty += 0.5
+                    value -= penalty
+                    if value < 0:
+                        value = 0
+                for income_modifier in tag_multipliers.get(resource_name, ()):
+                    value += income_modifier
+                final_multiplier[resource_name] = value
+
+        # get capital resource if able
+        region_resource = region.data.resource
+        capital_resource_bonus = (
+            improvement_name == "Capital"
+            and region_resource in CAPITAL_RESOURCE_RESEARCH
+            and (CAPITAL_RESOURCE_RESEARCH[region_resource] is None or CAPITAL_RESOURCE_RESEARCH[region_resource] in nation.completed_research)
+        )
+
+        final_yield_dict = {}
+        for resource_name, value in income.items():
+            if capital_resource_bonus and resource_name == region_resource:
+                value += 1
+            final_yield_dict[resource_name] = value * final_multiplier[resource_name]
+
+        return final_yield_dict
\ No newline at end of file
@@ -0,0 +1,121 @@
+from typing import ClassVar, Iterable
+
+from app.game.games import Games
+from app.nation.nation import Nation
+from app.nation.nations import Nations
+from app.region.region import Region
+from app.region.regions import Regions
+from .improvement_yields import ImprovementYields
+
+class RegionIncome:
+    """
+    Improvement income and region statistics of every region, kept between income updates.
+
+    UpdateIncomeProcess runs several times per turn and most regions do not change in between. Each region has an entry
+    holding its owner, whether it is occupied or on the map edge, and the name and yields of its improvement. An entry is only
+    recalculated when something it depends on changed since the last update:
+        - the region or one of its neighbours changed (ownership, improvement, health, infection...), see Regions.mark_changed()
+        - the research, tags, or improvement yields of the owner changed
+        - a Pandemic started or ended
+    Everything is recalculated when different region data is loaded.
+    """
+
+    _regions_data: ClassVar[dict] = None
+    _pandemic: ClassVar[bool] = None
+    _entries: ClassVar[dict[str, tuple]] = {}
+    _nation_keys: ClassVar[dict[str, tuple]] = {}
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Discards every entry so the next update recalculates all regions.
+        """
+        cls._regions_data = None
+
+    @staticmethod
+    def _nation_key(nation: Nation, yield_dict: dict) -> tuple:
+        modifiers = nation.modifiers
+        return (yield_dict, modifiers.tag_improvement_income, modifiers.tag_improvement_multipliers, modifiers.capital_boost, frozenset(nation.completed_research))
+
+    @classmethod
+    def update(cls, game_id: str, yield_dicts: dict[str, dict]) -> int:
+        """
+        Recalculates the entries of regions that may have changed since the last update.
+
+        Params:
+            game_id (str): Game ID string.
+            yield_dicts (dict): Yield dictionary of each nation keyed by nation name, see economic_helpers.create_player_yield_dict().
+
+        Returns:
+            int: Number of regions recalculated.
+        """
+
+        game = Games.load(game_id)
+        pandemic = "Pandemic" in game.active_events
+
+        if cls._regions_data is not Regions._data or cls._pandemic != pandemic:
+            cls._regions_data = Regions._data
+            cls._pandemic = pandemic
+            cls._entries = dict.fromkeys(Regions.ids())
+            cls._nation_keys = {}
+
+        changed_nation_ids = set()
+        for nation in Nations:
+            nation_key = cls._nation_key(nation, yield_dicts[nation.name])
+            if cls._nation_keys.get(nation.id) != nation_key:
+                cls._nation_keys[nation.id] = nation_key
+                changed_nation_ids.add(nation.id)
+
+        # central banks and capitals also change the yields of the regions next to them
+        changed_region_ids = set()
+        for region_id in Regions.take_income_changes():
+            changed_region_ids.add(region_id)
+            changed_region_ids.update(Regions.adjacent_to(region_id))
+
+        stale_region_ids = [
+            region_id for region_id, entry in cls._entries.items()
+            if entry is None or region_id in changed_region_ids or entry[0] in changed_nation_ids
+        ]
+        if stale_region_ids:
+            improvement_yields = ImprovementYields(game_id, yield_dicts)
+            for region_id in stale_region_ids:
+                cls._entries[region_id] = cls._calculate(Regions.load(region_id), improvement_yields)
+
+        return len(stale_region_ids)
+
+    @classmethod
+    def entries(cls) -> Iterable[tuple]:
+        """
+        Returns the entry of every region in map order.
+
+        Returns:
+            Iterable: (owner id, is occupied, is on map edge, improvement name, yields) tuples. Yields is a tuple of (resource name, amount) tuples.
+        """
+        return cls._entries.values()
+
+    @staticmethod
+    def _calculate(region: Region, improvement_yields: ImprovementYields) -> tuple:
+
+        owner_id = region.data.owner_id
+        if owner_id in ["0", "99"]:
+            return (owner_id, False, False, None, ())
+
+        is_occupied = region.data.occupier_id != "0"
+        yields = []
+
+        # collect improvement income
+        if region.improvement.name is not None and region.improvement.health != 0 and not is_occupied:
+            nation = Nations.get(owner_id)
+            for resource_name, amount_gained in improvement_yields.calculate(region, nation).items():
+                if amount_gained == 0:
+                    continue
+                yields.append((resource_name, amount_gained))
+
+        if region.unit.name is not None:
+
+            # trigger boot camp ability
+            if region.improvement.name == "Boot Camp" and region.unit.xp < 10:
+                region.unit.xp = 10
+                region.unit.calculate_level()
+
+        return (owner_id, is_occupied, region.graph.is_edge, region.improvement.name, tuple(yields))
\ No newline at end of file
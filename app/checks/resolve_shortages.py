@@ -3,12 +3,73 @@ import random
 from app.nation.nation import Nation
 from app.nation.nations import Nations
 from app.notifications import Notifications
+from app.region.regions import Regions
 from . import economic_helpers
-from . import destroy
 
-RESOURCES = {"Oil", "Coal", "Energy", "Uranium", "Food", "Dollars"}
+RESOURCES = ["Oil", "Coal", "Energy", "Uranium", "Food", "Dollars"]
 
-def _resolve_shortage(resource_name: str, upkeep_dict: dict, nation: Nation) -> None:
+class ConsumerPool:
+    """
+    The regions holding each improvement and unit of every nation, used to pick the consumers removed by resource shortages.
+
+    The map is only searched once, the first time a consumer is removed. Removing a consumer picks one of the matching
+    regions uniformly at random, just like destroy.search_and_destroy_improvement() and destroy.search_and_destroy_unit().
+    """
+
+    def __init__(self, rng: random.Random = None):
+        """
+        Params:
+            rng (Random): Optional random number generator, e.g. a seeded one for tests. Uses the random module if not given.
+        """
+        self.rng = rng if rng is not None else random
+        self._improvements: dict[str, dict[str, list[str]]] = None
+        self._units: dict[str, dict[str, list[str]]] = None
+
+    def _build(self) -> None:
+        self._improvements = {}
+        self._units = {}
+        for region in Regions:
+            if region.improvement.name is not None:
+                self._improvements.setdefault(region.data.owner_id, {}).setdefault(region.improvement.name, []).append(region.id)
+            if region.unit.name is not None:
+                self._units.setdefault(region.unit.owner_id, {}).setdefault(region.unit.name, []).append(region.id)
+
+    def _take(self, region_ids: list[str]) -> str | None:
+        if not region_ids:
+            return None
+        i = self.rng.randrange(len(region_ids))
+        region_ids[i], region_ids[-1] = region_ids[-1], region_ids[i]
+        return region_ids.pop()
+
+    def destroy_improvement(self, nation_id: str, improvement_name: str) -> str | None:
+        """
+        Removes a random improvement of a given type from the regions owned by a nation.
+
+        Returns:
+            str: Region id the improvement was removed from, or None if the nation has none left.
+        """
+        if self._improvements is None:
+            self._build()
+        region_id = self._take(self._improvements.get(nation_id, {}).get(improvement_name))
+        if region_id is not None:
+            Regions.load(region_id).improvement.clear()
+        return region_id
+
+    def destroy_unit(self, nation_id: str, unit_name: str) -> str | None:
+        """
+        Removes a random unit of a given type belonging to a nation.
+
+        Returns:
+            str: Region id the unit was removed from, or None if the nation has none left.
+        """
+        if self._units is None:
+            self._build()
+        region_id = self._take(self._units.get(nation_id, {}).get(unit_name))
+        if region_id is not None:
+            Regions.load(region_id).unit.clear()
+        return region_id
+
+def _resolve_shortage(resource_name: str, upkeep_dict: dict, nation: Nation, pool: ConsumerPool) -> None:
     """
     Helper function for resolving a resource shortage.
     """
@@ -21,57 +82,54 @@ def _resolve_shortage(resource_name: str, upkeep_dict: dict, nation: Nation) ->
     
     # update stockpile variable
     if resource_name == "Energy":
-        resource_stockpile = float(nation.get_income(resource_name))
+        resource_stockpile = nation.get_income(resource_name)
     else:
-        resource_stockpile = float(nation.get_stockpile(resource_name))
+        resource_stockpile = nation.get_stockpile(resource_name)
 
     # prune until resource shortage eliminated or no consumers left
     while resource_stockpile < 0 and consumers_list != []:
         
         # select random consumer and identify if it is an improvement or unit
-        consumer_name = random.choice(consumers_list)
+        consumer_name = pool.rng.choice(consumers_list)
         if consumer_name in nation.unit_counts:
-            consumer_type = "unit"
+            count_dict = nation.unit_counts
+            region_id = pool.destroy_unit(nation.id, consumer_name)
         else:
-            consumer_type = "improvement"
+            count_dict = nation.improvement_counts
+            region_id = pool.destroy_improvement(nation.id, consumer_name)
         
-        # remove consumer
-        if consumer_type == "improvement":
-            region_id = destroy.search_and_destroy_improvement(nation.id, consumer_name)
-            nation.improvement_counts[consumer_name] -= 1
-        else:
-            region_id, victim = destroy.search_and_destroy_unit(nation.id, consumer_name)
-            nation.unit_counts[consumer_name] -= 1
+        # counts do not match the map, nothing left to remove
+        if region_id is None:
+            consumers_list.remove(consumer_name)
+            continue
+
+        count_dict[consumer_name] -= 1
         Notifications.add(f'{nation.name} lost a {consumer_name} in {region_id} due to {resource_name.lower()} shortages.', 7)
         
         # update stockpile
         consumer_upkeep = upkeep_dict[consumer_name][resource_name]["Upkeep"] * upkeep_dict[consumer_name][resource_name]["Upkeep Multiplier"]
-        resource_stockpile += consumer_upkeep
         if resource_name == "Energy":
             nation.update_income(resource_name, consumer_upkeep)
+            resource_stockpile = nation.get_income(resource_name)
         else:
             nation.update_stockpile(resource_name, consumer_upkeep)
-
-        # update stockpile variable
-        if resource_name == "Energy":
-            resource_stockpile = float(nation.get_income(resource_name))
-        else:
-            resource_stockpile = float(nation.get_stockpile(resource_name))
+            resource_stockpile = nation.get_stockpile(resource_name)
         
         # remove consumer from selection pool if no more of it remains
-        if consumer_type == "improvement":
-            count_dict = nation.improvement_counts
-        else:
-            count_dict = nation.unit_counts
         if count_dict[consumer_name] == 0:
             consumers_list.remove(consumer_name)
             del upkeep_dict[consumer_name]
 
-def resolve_resource_shortages() -> None:
+def resolve_resource_shortages(rng: random.Random = None) -> None:
     """
     Resolves resource shortages by pruning units and improvements that cost upkeep.
+
+    Params:
+        rng (Random): Optional random number generator used to pick what is removed. Uses the random module if not given.
     """
 
+    pool = ConsumerPool(rng)
+
     for nation in Nations:
 
         if nation.name == "Foreign Invasion":
@@ -80,4 +138,4 @@ def resolve_resource_shortages() -> None:
         upkeep_dict = economic_helpers.create_player_upkeep_dict(nation)
 
         for resource in RESOURCES:
-            _resolve_shortage(resource, upkeep_dict, nation)
\ No newline at end of file
+            _resolve_shortage(resource, upkeep_dict, nation, pool)
\ No newline at end of file
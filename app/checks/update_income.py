@@ -1,13 +1,12 @@
 import copy
-from collections import defaultdict
 
-from app.scenario.scenario import ScenarioInterface as SD
 from app.alliance.alliances import Alliances
+from app.nation.income_breakdown import IncomeBreakdown
 from app.nation.nation import Nation
 from app.nation.nations import Nations
-from app.region.regions import Regions
 from app.war.wars import Wars
 from . import economic_helpers
+from .region_income import RegionIncome
 
 class UpdateIncomeProcess:
 
@@ -15,7 +14,7 @@ class UpdateIncomeProcess:
         self.game_id = game_id
         self.yield_dict: dict[str, dict] = {}
         self.upkeep_dict: dict[str, dict] = {}
-        self.text_dict: dict[str, dict] = {}
+        self.income_details: dict[str, IncomeBreakdown] = {}
 
     def _prepare_nations(self) -> None:
         """
@@ -26,10 +25,9 @@ class UpdateIncomeProcess:
 
             self.yield_dict[nation.name] = economic_helpers.create_player_yield_dict(nation)
             self.upkeep_dict[nation.name] = economic_helpers.create_player_upkeep_dict(nation)
-            self.text_dict[nation.name] = {}
+            self.income_details[nation.name] = IncomeBreakdown()
             
             for resource_name in nation._resources:
-                self.text_dict[nation.name][resource_name] = defaultdict(int)
                 if resource_name == "Military Capacity":
                     nation.update_max_mc(0.00, overwrite=True)
                 else:
@@ -41,74 +39,38 @@ class UpdateIncomeProcess:
             nation.stats.regions_on_map_edge = 0
 
     def _calculate_gross_income(self) -> None:
-    
-        for region in Regions:
+
+        RegionIncome.update(self.game_id, self.yield_dict)
+
+        # update stats and collect improvement income from each region
+        for owner_id, is_occupied, is_edge, improvement_name, improvement_yields in RegionIncome.entries():
             
             # skip if region is unowned or controlled by an event
-            if region.data.owner_id in ["0", "99"]:
+            if owner_id in ["0", "99"]:
                 continue
             
-            # update stats based on region
-            nation = Nations.get(region.data.owner_id)
+            nation = Nations.get(owner_id)
             nation.stats.regions_owned += 1
-            if region.data.occupier_id != "0":
+            if is_occupied:
                 nation.stats.regions_occupied += 1
-            if region.graph.is_edge:
+            if is_edge:
                 nation.stats.regions_on_map_edge += 1
-            
-            # skip if region is empty
-            if region.improvement.name is None and region.unit.name is None:
-                continue
-            
-            # collect improvement income
-            if region.improvement.name is not None and region.improvement.health != 0 and region.data.occupier_id == "0":
-                
-                if region.improvement.name[-1] != 'y':
-                    plural_improvement_name = f"{region.improvement.name}s"
-                else:
-                    plural_improvement_name = f"{region.improvement.name[:-1]}ies"
-                
-                nation = Nations.get(region.data.owner_id)
-                improvement_income_dict = self.yield_dict[nation.name][region.improvement.name]
-                improvement_yield_dict = region.calculate_yield(self.game_id, nation, improvement_income_dict)
-                
-                for resource_name, amount_gained in improvement_yield_dict.items():
-                    if amount_gained == 0:
-                        continue
-                    nation.update_gross_income(resource_name, amount_gained)
-                    income_str = f"+{amount_gained:.2f} from {plural_improvement_name}"
-                    self.text_dict[nation.name][resource_name][income_str] += 1
 
-            if region.unit.name is not None:
-
-                # trigger boot camp ability
-                if region.improvement.name == "Boot Camp" and region.unit.xp < 10:
-                    region.unit.xp = 10
-                    region.unit.calculate_level()
+            for resource_name, amount_gained in improvement_yields:
+                nation.update_gross_income(resource_name, amount_gained)
+                self.income_details[nation.name].add("improvement", improvement_name, resource_name, amount_gained)
         
+        mediator_name = next((nation.name for nation in Nations if "Mediator" in nation.tags), None)
         for nation in Nations:
 
             # add political power income from alliances
-            for alliance in Alliances:
-                if nation.name not in alliance.current_members:
-                    continue
-                alliance_income = 0
-                for name in nation.completed_research:
-                    if name in SD.agendas:
-                        agenda_data = SD.agendas[name]
-                        alliance_income += agenda_data.modifiers.get("Alliance Political Power Bonus", 0)
-                    elif name in SD.technologies:
-                        technology_data = SD.technologies[name]
-                        alliance_income += technology_data.modifiers.get("Alliance Political Power Bonus", 0)
-                for tag_data in nation.tags.values():
-                    alliance_income += tag_data.get("Alliance Political Power Bonus", 0)
-                mediator_name = next((nation.name for nation in Nations if "Mediator" in nation.tags), None)
+            for alliance in Alliances.memberships(nation.name):
+                alliance_income = nation.modifiers.alliance_political_power_bonus
                 if mediator_name is not None and mediator_name in alliance.current_members:
                     alliance_income += 0.25
                 if alliance_income > 0:
                     nation.update_gross_income("Political Power", alliance_income)
-                    income_str = f"+{alliance_income:.2f} from {alliance.name}."
-                    self.text_dict[nation.name]["Political Power"][income_str] += 1
+                    self.income_details[nation.name].add("alliance", alliance.name, "Political Power", alliance_income)
 
             # add political power income from wars
             war_win_count = 0
@@ -118,18 +80,13 @@ class UpdateIncomeProcess:
             if war_win_count != 0 and "Early Expansion" in nation.completed_research:
                 nation.update_gross_income("Political Power", 0.5 * war_win_count)
                 for i in range(war_win_count):
-                    income_str = f"+0.5 from winning a war"
-                    self.text_dict[nation.name]["Political Power"][income_str] += 1
+                    self.income_details[nation.name].add("war", None, "Political Power", 0.5)
 
             # add income from tags
-            for resource_name in nation._resources:
-                for tag_name, tag_data in nation.tags.items():
-                    amount = float(tag_data.get(f"{resource_name} Income", 0))
-                    if amount == 0:
-                        continue
+            for resource_name, tag_incomes in nation.modifiers.tag_income.items():
+                for tag_name, amount in tag_incomes:
                     nation.update_gross_income(resource_name, amount)
-                    income_str = f"{amount:+.2f} from {tag_name}."
-                    self.text_dict[nation.name][resource_name][income_str] += 1
+                    self.income_details[nation.name].add("tag", tag_name, resource_name, amount)
 
         # alliance yields
         for alliance in Alliances:
@@ -144,36 +101,34 @@ class UpdateIncomeProcess:
                     nation.update_max_mc(amount)
                 else:
                     nation.update_gross_income(resource_name, amount)
-                income_str = f"+{amount:.2f} from {alliance.name}."
-                self.text_dict[nation.name][resource_name][income_str] += 1
+                self.income_details[nation.name].add("alliance", alliance.name, resource_name, amount)
 
         # apply income rate to gross income
         for nation in Nations:
             for resource_name in nation._resources:
                 
-                total = float(nation.get_gross_income(resource_name))
+                total = nation.get_gross_income(resource_name)
                 rate = float(nation.get_rate(resource_name)) / 100
                 final_gross_income = round(total * rate, 2)
                 rate_diff = round(final_gross_income - total, 2)
                 
                 if rate_diff != 0:
-                    income_str = f"{rate_diff:+.2f} from income rate."
-                    self.text_dict[nation.name][resource_name][income_str] += 1
+                    self.income_details[nation.name].add("rate", None, resource_name, rate_diff)
                 
                 nation.update_gross_income(resource_name, final_gross_income, overwrite=True)
 
     def _pay_energy(self, nation: Nation, resouce_name: str, income=True) -> None:
         
-        energy_income = float(nation.get_income("Energy"))
+        energy_income = nation.get_income("Energy")
         
         if income:
             source = "income"
-            resource_amount = float(nation.get_income(resouce_name))
+            resource_amount = nation.get_income(resouce_name)
         else:
             source = "reserves"
-            resource_amount = float(nation.get_stockpile(resouce_name))
+            resource_amount = nation.get_stockpile(resouce_name)
 
-        sum = float(energy_income) + float(resource_amount)
+        sum = energy_income + resource_amount
 
         if sum > 0:
             upkeep_payment = resource_amount - sum
@@ -184,11 +139,8 @@ class UpdateIncomeProcess:
             nation.update_income("Energy", upkeep_payment)
             nation.update_income(resouce_name, 0.00, overwrite=True)
             
-        income_str = f"+{upkeep_payment:.2f} from {resouce_name.lower()} {source}."
-        self.text_dict[nation.name]["Energy"][income_str] += 1
-        
-        income_str = f"-{upkeep_payment:.2f} from energy upkeep costs."
-        self.text_dict[nation.name][resouce_name][income_str] += 1
+        self.income_details[nation.name].add("energy payment", f"{resouce_name.lower()} {source}", "Energy", upkeep_payment)
+        self.income_details[nation.name].add("energy upkeep", None, resouce_name, -1 * upkeep_payment)
 
     def _calculate_net_income(self) -> None:
     
@@ -196,7 +148,7 @@ class UpdateIncomeProcess:
 
             # reset net income
             for resource_name in nation._resources:
-                gross_income = float(nation.get_gross_income(resource_name))
+                gross_income = nation.get_gross_income(resource_name)
                 nation.update_income(resource_name, gross_income, overwrite=True)
             
             # account for puppet state dues
@@ -216,12 +168,10 @@ class UpdateIncomeProcess:
                     tax_amount = round(tax_amount, 2)
                     
                     nation.update_income(resource_name, -1 * tax_amount)
-                    income_str = f"-{tax_amount:.2f} from tribute to {overlord.name}."
-                    self.text_dict[nation.name][resource_name][income_str] += 1
+                    self.income_details[nation.name].add("tribute paid", overlord.name, resource_name, -1 * tax_amount)
                     
                     overlord.update_income(resource_name, tax_amount)
-                    income_str = f"{tax_amount:.2f} from puppet state tribute."
-                    self.text_dict[nation.name][resource_name][income_str] += 1
+                    self.income_details[nation.name].add("tribute received", None, resource_name, tax_amount)
 
             # calculate player upkeep costs
             player_upkeep_costs_dict = {}
@@ -240,71 +190,47 @@ class UpdateIncomeProcess:
                 upkeep = player_upkeep_costs_dict[resource_name]["From Units"] + player_upkeep_costs_dict[resource_name]["From Improvements"]
                 if upkeep > 0:
                     nation.update_income(resource_name, -1 * upkeep)
-                    income_str = f'-{upkeep:.2f} from upkeep costs.'
-                    self.text_dict[nation.name][resource_name][income_str] += 1
+                    self.income_details[nation.name].add("upkeep", None, resource_name, -1 * upkeep)
 
             # add energy upkeep to net income
             energy_upkeep = player_upkeep_costs_dict["Energy"]["From Units"] + player_upkeep_costs_dict["Energy"]["From Improvements"]
             nation.update_income("Energy", -1 * energy_upkeep)
             if energy_upkeep > 0:
-                income_str = f"-{energy_upkeep:.2f} from energy upkeep costs."
-                self.text_dict[nation.name][resource_name][income_str] += 1
+                self.income_details[nation.name].add("energy upkeep", None, "Energy", -1 * energy_upkeep)
             
             # attempt to spend coal income to pay remaining energy upkeep
-            energy_income = float(nation.get_income("Energy"))
-            coal_income = float(nation.get_income("Coal"))
+            energy_income = nation.get_income("Energy")
+            coal_income = nation.get_income("Coal")
             if energy_income < 0 and coal_income > 0:
                 self._pay_energy(nation, "Coal")
             
             # attempt to spend oil income to pay remaining energy upkeep
-            energy_income = float(nation.get_income("Energy"))
-            oil_income = float(nation.get_income("Oil"))
+            energy_income = nation.get_income("Energy")
+            oil_income = nation.get_income("Oil")
             if energy_income < 0 and oil_income > 0:
                 self._pay_energy(nation, "Oil")
             
             # attempt to spend coal reserves to pay remaining energy upkeep
-            energy_income = float(nation.get_income("Energy"))
-            coal_reserves = float(nation.get_stockpile("Coal"))
+            energy_income = nation.get_income("Energy")
+            coal_reserves = nation.get_stockpile("Coal")
             if energy_income < 0 and coal_reserves > 0:
                 self._pay_energy(nation, "Coal", income=False)
             
             # attempt to spend oil reserves to pay remaining energy upkeep
-            energy_income = float(nation.get_income("Energy"))
-            oil_reserves = float(nation.get_stockpile("Oil"))
+            energy_income = nation.get_income("Energy")
+            oil_reserves = nation.get_stockpile("Oil")
             if energy_income < 0 and oil_reserves > 0:
                 self._pay_energy(nation, "Oil", income=False)
 
-    def _refine_income_strings(self) -> None:
-    
-        # create strings for net incomes
-        final_income_strings = {}
+    def _save_income_details(self) -> None:
         for nation in Nations:
-            final_income_strings[nation.name] = {}
+            income_details = self.income_details[nation.name]
             for resource_name in nation._resources:
-                str_list = []
-                resource_total = float(nation.get_income(resource_name))
-                str_list.append(f"<section> {resource_total:+.2f} {resource_name}")
-                final_income_strings[nation.name][resource_name] = str_list
-
-        # add counts
-        for nation in Nations:
-            for resource_name in nation._resources:
-                for income_string, count in self.text_dict[nation.name][resource_name].items():
-                    if count > 1:
-                        income_string = f"{income_string} [{count}x]"
-                    final_income_strings[nation.name][resource_name].append(income_string)
-
-        # save income strings
-        for nation in Nations:
-            resource_string_lists = final_income_strings[nation.name]
-            temp = []
-            for resource_name, string_list in resource_string_lists.items():
-                if len(string_list) > 1 or resource_name in ["Dollars", "Political Power", "Research", "Military Capacity", "Energy"]:
-                    temp += string_list
-            nation.income_details = temp
+                income_details.set_total(resource_name, nation.get_income(resource_name))
+            nation.income_details = income_details
 
     def run(self) -> None:
         self._prepare_nations()
         self._calculate_gross_income()
         self._calculate_net_income()
-        self._refine_income_strings()
\ No newline at end of file
+        self._save_income_details()
\ No newline at end of file
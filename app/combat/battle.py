@@ -38,9 +38,7 @@ class BattleTemplate:
         """
 
         # attacker damage from tags
-        for tag_data in self.attacker.tags.values():
-            if tag_data.get("Combat Roll Bonus") == self.defender.id:
-                self.attacker_damage_modifier += 1
+        self.attacker_damage_modifier += self.attacker.modifiers.combat_roll_bonus.get(self.defender.id, 0)
         
         # attacker damage from research
         if "Attacker" in self.attacker_cd.role and "Superior Training" in self.attacker.completed_research:
@@ -25,7 +25,7 @@ class NuclearStrike(Strike):
         # determine best defense
         # this algorithm isn't very efficient - too bad!
         for name, data in possible_defenders.items():
-            nearby_region_ids = self.target_region.get_regions_in_radius(data["range"])
+            nearby_region_ids = Regions.within(self.target_region.id, data["range"])
             for temp_region_id in nearby_region_ids:
                 temp_region = Regions.load(temp_region_id)
                 if temp_region.improvement.name == name:
@@ -0,0 +1,134 @@
+import json
+import os
+from typing import ClassVar, Iterator
+
+from app import storage
+
+class GameArchive:
+    """
+    Records of every finished game, shown on the archived games page and used to build player statistics.
+
+    Each record is saved to its own file, game_records/<game_id>.json, next to a small index with one line per game
+    (game_records/index.jsonl). Archiving a game writes one record and appends one index line, so it costs the same no
+    matter how many games came before it. Listing games only reads the index, and the records of a page are only read when shown.
+
+    Archives still kept in the old single file format (game_records.json) are split into the new format on first use.
+    """
+
+    ARCHIVE_DIRECTORY: ClassVar[str] = "game_records"
+    LEGACY_FILEPATH: ClassVar[str] = "game_records.json"
+    PAGE_SIZE: ClassVar[int] = 10
+
+    _index_cache: ClassVar[tuple[tuple, list[dict]]] = None
+
+    @classmethod
+    def _record_path(cls, game_id: str) -> str:
+        return f"{cls.ARCHIVE_DIRECTORY}/{game_id}.json"
+
+    @classmethod
+    def _index_path(cls) -> str:
+        return f"{cls.ARCHIVE_DIRECTORY}/index.jsonl"
+
+    @classmethod
+    def migrate(cls) -> None:
+        """
+        Splits a legacy game_records.json file into one file per game. Does nothing if the archive already exists.
+        """
+
+        if os.path.exists(cls._index_path()) or not os.path.exists(cls.LEGACY_FILEPATH):
+            return
+
+        game_records_dict: dict = storage.load_json(cls.LEGACY_FILEPATH)
+        os.makedirs(cls.ARCHIVE_DIRECTORY, exist_ok=True)
+        index_lines = []
+        for game_id, game_record in sorted(game_records_dict.items(), key=lambda item: item[1]["Number"]):
+            storage.save_json(cls._record_path(game_id), game_record, pretty=True)
+            index_lines.append(cls._index_line(game_id, game_record))
+
+        # the index is written last so a migration that fails partway is simply redone
+        storage.save_text(cls._index_path(), "".join(index_lines))
+        cls._index_cache = None
+
+    @staticmethod
+    def _index_line(game_id: str, game_record: dict) -> str:
+        entry = {"id": game_id, "number": game_record["Number"], "name": game_record["Name"]}
+        return json.dumps(entry, separators=(",", ":")) + "\n"
+
+    @classmethod
+    def add(cls, game_id: str, game_record: dict) -> None:
+        """
+        Archives a finished game. Archiving the same game again replaces its record.
+
+        Params:
+            game_id (str): Game ID string.
+            game_record (dict): Archive entry of the game.
+        """
+
+        cls.migrate()
+        os.makedirs(cls.ARCHIVE_DIRECTORY, exist_ok=True)
+        storage.save_json(cls._record_path(game_id), game_record, pretty=True)
+
+        # checked against the index rather than the record so an archive interrupted before the index line was added is completed
+        if not any(entry["id"] == game_id for entry in cls.index()):
+            storage.append_line(cls._index_path(), cls._index_line(game_id, game_record))
+            cls._index_cache = None
+
+    @classmethod
+    def index(cls) -> list[dict]:
+        """
+        Returns the id, number, and name of every archived game from newest to oldest.
+        The index is kept in memory until the file changes.
+        """
+
+        cls.migrate()
+        index_path = cls._index_path()
+        if not os.path.exists(index_path):
+            return []
+
+        index_stat = os.stat(index_path)
+        file_version = (index_stat.st_mtime_ns, index_stat.st_size)
+        if cls._index_cache is None or cls._index_cache[0] != file_version:
+            entries = storage.load_json_lines(index_path)
+            entries.sort(key=lambda entry: entry["number"], reverse=True)
+            cls._index_cache = (file_version, entries)
+
+        return cls._index_cache[1]
+
+    @classmethod
+    def count(cls) -> int:
+        return len(cls.index())
+
+    @classmethod
+    def load(cls, game_id: str) -> dict:
+        """
+        Returns the archive entry of a single game.
+        """
+        return storage.load_json(cls._record_path(game_id))
+
+    @classmethod
+    def page(cls, page_number: int) -> tuple[dict[str, dict], int]:
+        """
+        Returns one page of archived games from newest to oldest.
+
+        Params:
+            page_number (int): Page to load, starting from 1. Pages past the end are empty.
+
+        Returns:
+            tuple:
+                dict: Archive entries of the games on the page, keyed by game id.
+                int: Total number of pages.
+        """
+
+        index = cls.index()
+        page_count = max(1, (len(index) + cls.PAGE_SIZE - 1) // cls.PAGE_SIZE)
+        start = (max(page_number, 1) - 1) * cls.PAGE_SIZE
+        records = {entry["id"]: cls.load(entry["id"]) for entry in index[start:start + cls.PAGE_SIZE]}
+        return records, page_count
+
+    @classmethod
+    def items(cls) -> Iterator[tuple[str, dict]]:
+        """
+        Yields the game id and archive entry of every archived game from oldest to newest, loading one record at a time.
+        """
+        for entry in reversed(cls.index()):
+            yield entry["id"], cls.load(entry["id"])
\ No newline at end of file
@@ -0,0 +1,79 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import ClassVar
+
+from app import storage
+from app.alliance.alliances import Alliances
+from app.nation.nations import Nations
+from app.notifications import Notifications
+from app.truce.truces import Truces
+from app.war.wars import Wars
+
+@dataclass
+class GameState:
+    """
+    Reads gamedata.json once and hands each section of it to the class that manages it.
+
+    Alliances, Nations, Notifications, Truces, and Wars all work directly on the shared data after load() is called.
+    Call save() once all changes are done to write gamedata.json back to disk in a single pass.
+    """
+
+    game_id: ClassVar[str] = None
+    _data: ClassVar[dict] = None
+
+    @classmethod
+    def _gamedata_path(cls) -> str:
+        return f"gamedata/{cls.game_id}/gamedata.json"
+
+    @classmethod
+    def load(cls, game_id: str) -> None:
+
+        cls.game_id = game_id
+        gamedata_path = cls._gamedata_path()
+
+        if not os.path.exists(gamedata_path):
+            raise FileNotFoundError(f"Error: Unable to locate required game files for GameState class.")
+
+        with open(gamedata_path, 'r') as f:
+            gamedata_dict = json.load(f)
+
+        cls.attach(game_id, gamedata_dict)
+
+    @classmethod
+    def attach(cls, game_id: str, data: dict) -> None:
+        """
+        Binds this class and every class it manages to gamedata that has already been read, e.g. a copy rebuilt from the game history.
+        """
+
+        cls.game_id = game_id
+        cls._data = data
+
+        Alliances.attach(game_id, cls._data["alliances"])
+        Nations.attach(game_id, cls._data["nations"])
+        Notifications.attach(game_id, cls._data["notifications"])
+        Truces.attach(game_id, cls._data["truces"])
+        Wars.attach(game_id, cls._data["wars"])
+
+    @classmethod
+    def collect(cls) -> dict:
+        """
+        Returns the current contents of gamedata.json as held by each class.
+        """
+
+        if cls._data is None:
+            raise RuntimeError("Error: GameState has not been loaded.")
+
+        # a class may have replaced its data outright (see Notifications.initialize) so always collect the current data
+        cls._data["alliances"] = Alliances._data
+        cls._data["nations"] = Nations._data
+        cls._data["notifications"] = Notifications._data
+        cls._data["truces"] = Truces._data
+        cls._data["wars"] = Wars._data
+
+        return cls._data
+
+    @classmethod
+    def save(cls) -> None:
+        storage.save_json(cls._gamedata_path(), cls.collect())
+        storage.bump_state_version(cls.game_id)
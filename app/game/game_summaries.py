@@ -0,0 +1,125 @@
+import json
+import os
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import ClassVar
+
+from app import storage
+from app.game.games import Games
+from app.game.game import GameStatus
+
+@dataclass
+class GameSummaries:
+    """
+    The title, status, and player rows shown for each game on the games page.
+
+    Building the player rows means reading the nations of the game and every player profile, so they are built once by
+    update() at the end of each setup stage and turn resolution and saved to gamedata/<game_id>/summary.json.
+    The games page only reads these small files, and keeps them in memory until they are written again.
+    """
+
+    _cache: ClassVar[dict[str, tuple[int, dict]]] = {}
+
+    @staticmethod
+    def _summary_path(game_id: str) -> str:
+        return f"gamedata/{game_id}/summary.json"
+
+    @classmethod
+    def load(cls, game_id: str) -> dict:
+        """
+        Returns the summary of a game. Games that have never been summarized are summarized now.
+        """
+
+        summary_path = cls._summary_path(game_id)
+        if not os.path.exists(summary_path):
+            return cls.update(game_id)
+
+        modified_time = os.stat(summary_path).st_mtime_ns
+        cached = cls._cache.get(game_id)
+        if cached is None or cached[0] != modified_time:
+            cached = (modified_time, storage.load_json(summary_path))
+            cls._cache[game_id] = cached
+
+        return cached[1]
+
+    @classmethod
+    def update(cls, game_id: str) -> dict:
+        """
+        Rebuilds and saves the summary of a game from its current state.
+        Uses the nations that are already loaded if they belong to this game.
+        """
+
+        from app.nation.nations import Nations
+
+        if Nations.game_id != game_id or Nations._data is None:
+            Nations.load(game_id)
+
+        summary = cls.build(game_id)
+        storage.save_json(cls._summary_path(game_id), summary)
+        cls._cache.pop(game_id, None)
+        return summary
+
+    @classmethod
+    def build(cls, game_id: str) -> dict:
+        """
+        Builds the summary of a game. Nations must already be loaded for this game.
+        """
+
+        from app import site_functions
+        from app.nation.nations import Nations
+
+        game = Games.load(game_id)
+        with open("playerdata/player_records.json", 'r') as json_file:
+            player_records_dict = json.load(json_file)
+
+        summary = {
+            "title": f"""<a href="/{game.id}">{game.name}</a>""",
+            "status": None,
+            "playerdata": None
+        }
+
+        match game.status:
+
+            case GameStatus.REGION_SELECTION:
+                summary["status"] = "Starting Region Selection in Progress"
+                refined_player_data = []
+                for nation in Nations:
+                    username = player_records_dict[nation.player_id]["Username"]
+                    username_str = f"""<a href="profile/{nation.player_id}">{username}</a>"""
+                    refined_player_data.append([nation.name, 0, 'TBD', username_str, '#ffffff', '#ffffff'])
+                summary["playerdata"] = refined_player_data
+
+            case GameStatus.NATION_SETUP:
+                summary["status"] = "Nation Setup in Progress"
+                refined_player_data = []
+                for nation in Nations:
+                    username = player_records_dict[nation.player_id]["Username"]
+                    username_str = f"""<a href="profile/{nation.player_id}">{username}</a>"""
+                    player_color_2 = site_functions.check_color_correction(nation.color)
+                    refined_player_data.append([nation.name, 0, 'TBD', username_str, nation.color, player_color_2])
+                summary["playerdata"] = refined_player_data
+
+            case _:
+                if not GameStatus.FINISHED:
+                    summary["status"] = "Game Over!"
+                else:
+                    summary["status"] = f"Turn {game.turn}"
+
+                data_a = []
+                data_b = []
+                for nation in Nations:
+                    gov_fp_str = f"{nation.fp} - {nation.gov}"
+                    username_str = f"""<a href="profile/{nation.player_id}">{player_records_dict[nation.player_id]["Username"]}</a>"""
+                    player_color = site_functions.check_color_correction(nation.color)
+                    # tba - fix duplicate player color (second one should be redundant)
+                    if nation.score > 0:
+                        data_a.append([nation.name, nation.score, gov_fp_str, username_str, player_color, player_color])
+                    else:
+                        data_b.append([nation.name, nation.score, gov_fp_str, username_str, player_color, player_color])
+
+                filtered_data_a = sorted(data_a, key=itemgetter(0), reverse=False)
+                filtered_data_a = sorted(filtered_data_a, key=itemgetter(1), reverse=True)
+                filtered_data_b = sorted(data_b, key=itemgetter(0), reverse=False)
+                summary["playerdata"] = filtered_data_a + filtered_data_b
+
+        return summary
\ No newline at end of file
@@ -3,7 +3,9 @@ from datetime import datetime
 from dataclasses import dataclass
 from typing import ClassVar, Iterator
 
+from app import storage
 from .game import Game
+from .game_archive import GameArchive
 
 class GamesMeta(type):
 
@@ -21,11 +23,18 @@ class Games(metaclass=GamesMeta):
     _instances: ClassVar[dict[str, Game]] = {}
     with open("active_games.json", "r") as json_file:
         _data = json.load(json_file)
+    _saved: ClassVar[dict[str, str]] = {game_id: json.dumps(game_data, sort_keys=True) for game_id, game_data in _data.items()}
 
     @classmethod
     def save(cls) -> None:
-        with open("active_games.json", 'w') as json_file:
-            json.dump(cls._data, json_file, indent=4)
+        storage.save_json("active_games.json", cls._data, pretty=True)
+
+        # active_games.json holds the turn, status, and events shown on every game page, so games whose entry changed are out of date
+        saved = {game_id: json.dumps(game_data, sort_keys=True) for game_id, game_data in cls._data.items()}
+        for game_id, game_str in saved.items():
+            if cls._saved.get(game_id) != game_str:
+                storage.bump_state_version(game_id)
+        cls._saved = saved
 
     @classmethod
     def create(cls, game_id: str, form_data_dict: dict) -> None:
@@ -33,12 +42,9 @@ class Games(metaclass=GamesMeta):
         GAME_VERSION = "Development"
         current_date = datetime.today().date()
 
-        with open("game_records.json", 'r') as json_file:
-            game_records_dict = json.load(json_file)
-        
         game_data = {
             "name": form_data_dict["Game Name"],
-            "number": len(game_records_dict) + len(cls) + 1,
+            "number": GameArchive.count() + len(cls) + 1,
             "turn": 0,
             "status": 101,
             "information": {
@@ -64,6 +70,14 @@ class Games(metaclass=GamesMeta):
 
         cls._data[game_id] = game_data
 
+    @classmethod
+    def attach(cls, game_id: str, data: dict) -> None:
+        """
+        Binds a single game to data that has already been read, e.g. a copy handed to a map rendering process.
+        """
+        cls._data[game_id] = data
+        cls._instances.pop(game_id, None)
+
     @classmethod
     def delete(cls, game_id: str) -> None:
         if game_id in cls._data:
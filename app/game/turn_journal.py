@@ -0,0 +1,209 @@
+import copy
+import json
+import os
+from datetime import datetime
+from typing import ClassVar
+
+from app import storage
+
+class TurnJournal:
+    """
+    History of a game, one entry each time a setup stage, turn, or event is resolved.
+
+    An entry holds only what changed in the game files since the previous entry: the game entry in active_games.json,
+    gamedata.json, and the region data. Every SNAPSHOT_INTERVAL entries a full copy of the game files is saved as well,
+    so rebuilding the state at any turn means loading the nearest snapshot and applying at most a few entries on top of it.
+    The first entry of a journal is always a snapshot of the game before anything was recorded.
+
+    Everything is kept under gamedata/<game_id>/history/ with the entries in journal.jsonl and the snapshots in snapshots/<entry>.json.
+
+    Usage: create a TurnJournal once the game files are loaded, make the changes, then call commit().
+    """
+
+    SNAPSHOT_INTERVAL: ClassVar[int] = 10
+
+    def __init__(self, game_id: str):
+        self.game_id = game_id
+        self._before = self.current_state(game_id)
+
+    @staticmethod
+    def _history_path(game_id: str) -> str:
+        return f"gamedata/{game_id}/history"
+
+    @classmethod
+    def _journal_path(cls, game_id: str) -> str:
+        return f"{cls._history_path(game_id)}/journal.jsonl"
+
+    @classmethod
+    def _snapshot_path(cls, game_id: str, entry_number: int) -> str:
+        return f"{cls._history_path(game_id)}/snapshots/{entry_number}.json"
+
+    @staticmethod
+    def current_state(game_id: str) -> dict:
+        """
+        Returns a copy of the loaded state of a game. Games, GameState, and Regions must be loaded for this game.
+        """
+
+        from app.game.games import Games
+        from app.game.game_state import GameState
+        from app.region.regions import Regions
+
+        state = {
+            "game": Games._data[game_id],
+            "gamedata": GameState.collect(),
+            "regions": Regions._data
+        }
+
+        # a JSON round trip gives the same types the game files would hold, e.g. lists instead of tuples
+        return json.loads(json.dumps(state))
+
+    @classmethod
+    def entries(cls, game_id: str) -> list[dict]:
+        """
+        Returns the entries recorded for a game without their changes, oldest first.
+        Each has the entry number, the turn and status of the game after the entry, and when it was recorded.
+        """
+        journal_path = cls._journal_path(game_id)
+        if not os.path.exists(journal_path):
+            return []
+        return [{key: value for key, value in entry.items() if key not in ("changes", "removed")} for entry in storage.load_json_lines(journal_path)]
+
+    def commit(self) -> dict:
+        """
+        Records the changes made to the game since this journal was created.
+
+        Returns:
+            dict: The new entry, without its changes.
+        """
+
+        after = self.current_state(self.game_id)
+        journal_path = self._journal_path(self.game_id)
+        os.makedirs(os.path.dirname(self._snapshot_path(self.game_id, 0)), exist_ok=True)
+
+        entries = self.entries(self.game_id)
+        if not entries:
+            base_entry = self._new_entry(0, self._before)
+            storage.save_json(self._snapshot_path(self.game_id, 0), self._before)
+            storage.append_line(journal_path, json.dumps(base_entry, separators=(",", ":")))
+            entries.append(base_entry)
+
+        changes = []
+        removed = []
+        _diff(self._before, after, [], changes, removed)
+
+        entry = self._new_entry(entries[-1]["entry"] + 1, after)
+        if entry["entry"] % self.SNAPSHOT_INTERVAL == 0:
+            storage.save_json(self._snapshot_path(self.game_id, entry["entry"]), after)
+        storage.append_line(journal_path, json.dumps(entry | {"changes": changes, "removed": removed}, separators=(",", ":")))
+
+        self._before = after
+        return entry
+
+    @staticmethod
+    def _new_entry(entry_number: int, state: dict) -> dict:
+        return {
+            "entry": entry_number,
+            "turn": state["game"]["turn"],
+            "status": state["game"]["status"],
+            "recorded": datetime.now().isoformat(timespec="seconds")
+        }
+
+    @classmethod
+    def entry_at_turn(cls, game_id: str, turn: int) -> int:
+        """
+        Returns the number of the last entry recorded while the game was at or before a given turn.
+        """
+
+        matching_entries = [entry["entry"] for entry in cls.entries(game_id) if entry["turn"] <= turn]
+        if not matching_entries:
+            raise ValueError(f"Error: No history recorded for game {game_id} at turn {turn}.")
+        return matching_entries[-1]
+
+    @classmethod
+    def materialize(cls, game_id: str, entry_number: int) -> dict:
+        """
+        Rebuilds the state of a game as it was after an entry.
+
+        Params:
+            game_id (str): Game ID string.
+            entry_number (int): Entry to rebuild. Use entry_at_turn() to find the entry for a turn.
+
+        Returns:
+            dict: "game", "gamedata", and "regions" data in the same format as current_state().
+        """
+
+        snapshot_numbers = [int(filename.split(".")[0]) for filename in os.listdir(os.path.dirname(cls._snapshot_path(game_id, 0)))]
+        base_number = max(number for number in snapshot_numbers if number <= entry_number)
+        state = storage.load_json(cls._snapshot_path(game_id, base_number))
+
+        for entry in storage.load_json_lines(cls._journal_path(game_id)):
+            if base_number < entry["entry"] <= entry_number:
+                _apply(state, entry["changes"], entry["removed"])
+
+        return state
+
+    @classmethod
+    def rollback(cls, game_id: str, turn: int) -> None:
+        """
+        Restores the game files to the last entry recorded at or before a turn and discards every later entry.
+        All regions are redrawn the next time the maps are updated.
+        """
+
+        from app.game.games import Games
+        from app.game.game_state import GameState
+        from app.game.game_summaries import GameSummaries
+        from app.region.regions import Regions
+
+        entry_number = cls.entry_at_turn(game_id, turn)
+        state = cls.materialize(game_id, entry_number)
+
+        Games.attach(game_id, state["game"])
+        Games.save()
+        GameState.attach(game_id, state["gamedata"])
+        GameState.save()
+        Regions.attach(game_id, state["regions"])
+        for region_id in state["regions"]:
+            Regions.mark_changed(region_id)
+            Regions.mark_for_redraw(region_id)
+        Regions.save()
+        GameSummaries.update(game_id)
+
+        # discard the entries that were rolled back
+        journal_path = cls._journal_path(game_id)
+        kept_lines = [json.dumps(entry, separators=(",", ":")) + "\n" for entry in storage.load_json_lines(journal_path) if entry["entry"] <= entry_number]
+        storage.save_text(journal_path, "".join(kept_lines))
+        snapshots_path = os.path.dirname(cls._snapshot_path(game_id, 0))
+        for filename in os.listdir(snapshots_path):
+            if int(filename.split(".")[0]) > entry_number:
+                os.remove(f"{snapshots_path}/{filename}")
+
+def _diff(before, after, path: list, changes: list, removed: list) -> None:
+    """
+    Collects the differences between two JSON values. Dicts are compared key by key, anything else is replaced as a whole.
+    """
+
+    if isinstance(before, dict) and isinstance(after, dict):
+        for key in before:
+            if key not in after:
+                removed.append(path + [key])
+        for key, value in after.items():
+            if key not in before:
+                changes.append([path + [key], value])
+            else:
+                _diff(before[key], value, path + [key], changes, removed)
+    elif before != after:
+        changes.append([path, after])
+
+def _apply(state: dict, changes: list, removed: list) -> None:
+
+    for path in removed:
+        parent = state
+        for key in path[:-1]:
+            parent = parent[key]
+        del parent[path[-1]]
+
+    for path, value in changes:
+        parent = state
+        for key in path[:-1]:
+            parent = parent[key]
+        parent[path[-1]] = copy.deepcopy(value)
\ No newline at end of file
@@ -1,9 +1,15 @@
 import json
+import os
 import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image
 
 from app import palette
+from app import storage
+from app.map_layers import MapLayers, SpriteAtlas
+from app.map_tiles import MapTiles
 from app.game.games import Games
 from app.game.game import GameStatus
 from app.scenario.scenario import ScenarioInterface as SD
@@ -11,7 +17,7 @@ from app.nation.nations import Nations
 from app.region.region import Region
 from app.region.regions import Regions
 
-MAP_OPACITY = 0.75
+MAP_OPACITY = MapLayers.MAP_OPACITY
 DO_NOT_SPAWN = {"Capital", "City", "Colony", "Military Base", "Missile Defense System", "Missile Silo",
                 "Nuclear Power Plant", "Research Institute", "Solar Farm", "Surveillance Center"}
 
@@ -19,12 +25,28 @@ class GameMaps:
     """
     Class used for generating and updating map images.
 
+    Maps are redrawn incrementally when possible. Regions report when something visible about them changes (see Regions.mark_for_redraw)
+    and only the areas of the map covered by those regions and their improvement and unit images are redrawn on top of the previous maps.
+    Everything is redrawn from scratch if the previous maps are unavailable or too much of the map has changed.
+
+    The main, resource, and control maps are built and encoded on a small thread pool (see RENDER_THREADS).
+    PNG_COMPRESS_LEVEL and PNG_OPTIMIZE trade export time for file size.
+
     Important methods:
         update_all() - updates all maps and exports them as images
         populate_main_map() - spawns random improvements on random regions
         populate_resource_map() - handles resource generation
     """
 
+    MAX_REDRAW_AREA: ClassVar[float] = 0.4
+    RASTER_CACHE_SIZE: ClassVar[int] = 2
+    RENDER_THREADS: ClassVar[int] = 3
+    PNG_COMPRESS_LEVEL: ClassVar[int] = 6    # 0 (no compression, fastest) to 9 (smallest)
+    PNG_OPTIMIZE: ClassVar[bool] = False     # smallest possible files at the cost of much slower encoding
+
+    _rasters: ClassVar[dict[str, dict]] = {}
+    _executor: ClassVar[ThreadPoolExecutor] = None
+
     def __init__(self, game_id: str):
 
         game = Games.load(game_id)
@@ -34,6 +56,39 @@ class GameMaps:
         with open(f"maps/{self.map_str}/config.json", 'r') as json_file:
             self.map_config: dict = json.load(json_file)
 
+        self.box = None
+        self._colors = None
+        self.pending_end = None    # redraws deferred after this point in the log are left for the next update
+        self._pending_offset = 0
+
+    @staticmethod
+    def _game_images_path(game_id: str) -> str:
+        return f"gamedata/{game_id}/images"
+
+    @staticmethod
+    def _sprite_images_path() -> str:
+        return "app/static/images"
+
+    @classmethod
+    def _run_parallel(cls, *tasks) -> list:
+        """
+        Runs tasks on the render thread pool and returns their results in order.
+        PIL releases the GIL while blending, compositing, and encoding so the tasks run on separate cores.
+        """
+
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=cls.RENDER_THREADS, thread_name_prefix="map-render")
+        futures = [cls._executor.submit(task) for task in tasks]
+        return [future.result() for future in futures]
+
+    @classmethod
+    def _render_state_path(cls, game_id: str) -> str:
+        return f"{cls._game_images_path(game_id)}/render_state.json"
+
+    @classmethod
+    def _pending_redraws_path(cls, game_id: str) -> str:
+        return f"{cls._game_images_path(game_id)}/pending_redraws.jsonl"
+
     def _get_fill_color(self, region: Region) -> tuple | None:
     
         if region.data.occupier_id != "0":
@@ -47,103 +102,150 @@ class GameMaps:
         
         return None  
 
-    def init_images(self) -> None:
+    def _get_region_colors(self) -> tuple[dict, dict, dict]:
         """
-        Takes care of map image initialization.
+        Returns the ownership, resource, and magnified box colors of every region, calculated once per update.
         """
 
-        map_images_filepath = f"app/static/images/map_images/{self.map_str}/image_resources"
-        self.filepath_background = f"{map_images_filepath}/background.png"
-        self.filepath_magnified = f"{map_images_filepath}/magnified.png"
-        self.filepath_main = f"{map_images_filepath}/main.png"
-        self.filepath_text = f"{map_images_filepath}/text.png"
-        
-        self.main_map = Image.open(self.filepath_main).convert("RGBA")
-        self.resource_map = Image.open(self.filepath_main).convert("RGBA")
-        self.control_map = Image.open(self.filepath_main).convert("RGBA")
+        if self._colors is not None:
+            return self._colors
 
-        self.images_filepath = "app/static/images"
-        self.filepath_unit_back = f"{self.images_filepath}/units/back.png"
-        self.filepath_unit_back_1 = f"{self.images_filepath}/units/back_1.png"
-        self.filepath_unit_back_2 = f"{self.images_filepath}/units/back_2.png"
-        self.filepath_unit_back_3 = f"{self.images_filepath}/units/back_3.png"
-        self.filepath_unit_symb_back = f"{self.images_filepath}/units/back_symb.png"
-        self.nuke_img = Image.open(f"{self.images_filepath}/nuke.png")
+        ownership_colors = {}
+        resource_colors = {}
+        magnified_colors = {}
+        for region in Regions:
+            
+            fill_color = self._get_fill_color(region)
+            if fill_color is not None and region.graph.improvement_coordinates is not None:
+                ownership_colors[region.id] = fill_color
+            if fill_color is not None and region.graph.is_magnified:
+                magnified_colors[region.id] = fill_color
+            
+            if region.data.resource != "Empty":
+                resource_colors[region.id] = palette.resource_colors[region.data.resource]
+
+        self._colors = (ownership_colors, resource_colors, magnified_colors)
+        return self._colors
+
+    def _crop(self, image: Image.Image) -> Image.Image:
+        return image.crop(self.box) if self.box is not None else image
 
-    def color_regions(self) -> None:
+    def _position(self, coords: list) -> tuple:
+        if self.box is None:
+            return tuple(coords)
+        return (coords[0] - self.box[0], coords[1] - self.box[1])
+
+    def load_layers(self) -> None:
+        """
+        Loads the static map layers and sprites.
         """
-        Iterates through all map regions, coloring them as needed for each individual map.
+
+        self.layers = MapLayers.load(self.map_str)
+        self.sprites = SpriteAtlas.load(self._sprite_images_path())
+        self.nuke_img = self.sprites.sprite("nuke.png")
+
+    def init_images(self, box: tuple = None) -> None:
+        """
+        Takes care of map image initialization.
+
+        Params:
+            box (tuple): Optional (left, upper, right, lower) area of the map to draw. Defaults to the whole map.
+        """
+
+        self.load_layers()
+        self.box = box
+        self.main_map = self._crop(self.layers.main).copy()
+        self.resource_map = self.main_map.copy()
+        self.control_map = self.main_map.copy()
+
+    def color_regions(self) -> tuple[Image.Image, Image.Image, Image.Image]:
+        """
+        Paints the region colors used by each individual map. The layers are painted in parallel.
         - Main and Control maps use region ownership and occupation. If region is occupied, that occupation color will show instead of the ownership color.
         - Resource map uses region resource (duh).
+        - Magnified boxes on the main map use ownership as well.
+
+        Returns:
+            tuple: Ownership, resource, and magnified box color layers.
         """
 
-        for region in Regions:
+        ownership_colors, resource_colors, magnified_colors = self._get_region_colors()
 
-            # color region using ownership
-            fill_color = self._get_fill_color(region)
-            if fill_color is not None and region.graph.improvement_coordinates is not None:
-                if not region.graph.is_magnified:
-                    x = region.graph.improvement_coordinates[0] + 25
-                    y = region.graph.improvement_coordinates[1] + 25
-                    ImageDraw.floodfill(self.main_map, (x, y), fill_color, border=(0, 0, 0, 255))
-                    ImageDraw.floodfill(self.control_map, (x, y), fill_color, border=(0, 0, 0, 255))
-                for coords in region.graph.additional_region_coordinates:
-                    ImageDraw.floodfill(self.main_map, tuple(coords), fill_color, border=(0, 0, 0, 255))
-                    ImageDraw.floodfill(self.control_map, tuple(coords), fill_color, border=(0, 0, 0, 255))
-            
-            # color region using resource
-            if region.data.resource != "Empty":
-                fill_color = palette.resource_colors[region.data.resource]
-                if not region.graph.is_magnified and region.graph.improvement_coordinates is not None:
-                    x = region.graph.improvement_coordinates[0] + 25
-                    y = region.graph.improvement_coordinates[1] + 25
-                    coords = (x, y)
-                    ImageDraw.floodfill(self.resource_map, coords, fill_color, border=(0, 0, 0, 255))
-                for coords in region.graph.additional_region_coordinates:
-                    ImageDraw.floodfill(self.resource_map, tuple(coords), fill_color, border=(0, 0, 0, 255))
-
-    def apply_background(self) -> None:
-        """
-        Applies background raster layer to all maps. 
+        return self._run_parallel(
+            lambda: self.layers.regions.colorize(ownership_colors, self.box),
+            lambda: self.layers.regions.colorize(resource_colors, self.box),
+            lambda: self.layers.magnified_boxes.colorize(magnified_colors, self.box)
+        )
+
+    def apply_background(self, map_img: Image.Image) -> Image.Image:
+        """
+        Applies background raster layer to a map. 
         - Uses MAP_OPACITY constant to set transparency of map layers.
         """
-        background_img = Image.open(self.filepath_background)
-        background_img = background_img.convert("RGBA")
-        self.main_map = Image.blend(background_img, self.main_map, MAP_OPACITY)
-        self.resource_map = Image.blend(background_img, self.resource_map, MAP_OPACITY)
-        self.control_map = Image.blend(background_img, self.control_map, MAP_OPACITY)
+        return Image.blend(self._crop(self.layers.background), map_img, MAP_OPACITY)
 
-    def apply_magnified(self) -> None:
+    def apply_magnified(self, map_img: Image.Image, magnified_layer: Image.Image) -> None:
         """
-        Adds magnified boxes layer to maps that need it.
+        Adds magnified boxes layer to a map, colored using ownership.
         """
+        map_img.alpha_composite(self._crop(self.layers.magnified))
+        map_img.alpha_composite(magnified_layer)
 
-        magnified_img = Image.open(self.filepath_magnified)
-        self.main_map = Image.alpha_composite(self.main_map, magnified_img)
-        
-        for region in Regions:
+    def apply_text(self, map_img: Image.Image) -> None:
+        """
+        Adds text layer to a map.
+        """
+        map_img.alpha_composite(self._crop(self.layers.text))
 
-            # skip non-magnified or unclaimed
-            fill_color = self._get_fill_color(region)
-            if not region.graph.is_magnified or fill_color is None:
+    def draw_main_map(self, ownership_layer: Image.Image, magnified_layer: Image.Image) -> Image.Image:
+        """
+        Builds the main map: ownership colors, background, magnified boxes, and then improvements and units on top.
+        """
+
+        self.main_map.alpha_composite(ownership_layer)
+        self.main_map = self.apply_background(self.main_map)
+        self.apply_magnified(self.main_map, magnified_layer)
+
+        for region in Regions:
+            if self.box is not None and not any(_overlaps(sprite_box, self.box) for sprite_box in self.get_sprite_boxes(region)):
                 continue
+            self.render_improvement(region)
+            self.render_unit(region)
 
-            # color magnified box using ownership
-            x = region.graph.improvement_coordinates[0] + 25
-            y = region.graph.improvement_coordinates[1] + 25
-            ImageDraw.floodfill(self.main_map, (x, y), fill_color, border=(0, 0, 0, 255))
-            x = region.graph.improvement_coordinates[0] + 55
-            ImageDraw.floodfill(self.main_map, (x, y), fill_color, border=(0, 0, 0, 255))
-            x = region.graph.improvement_coordinates[0] + 70
-            ImageDraw.floodfill(self.main_map, (x, y), fill_color, border=(0, 0, 0, 255))
+        return self.main_map
 
-    def apply_text(self) -> None:
+    def draw_text_map(self, map_img: Image.Image, color_layer: Image.Image) -> Image.Image:
         """
-        Adds text layer to maps that need it.
+        Builds a map that shows region colors under the text layer. Used for both the resource and control maps.
         """
-        text_img = Image.open(self.filepath_text)
-        self.resource_map = Image.alpha_composite(self.resource_map, text_img)
-        self.control_map = Image.alpha_composite(self.control_map, text_img)
+        map_img.alpha_composite(color_layer)
+        map_img = self.apply_background(map_img)
+        self.apply_text(map_img)
+        return map_img
+
+    def get_sprite_boxes(self, region: Region) -> list[list[int]]:
+        """
+        Returns the areas of the main map covered by the improvement and unit images of a region.
+        """
+
+        boxes = []
+
+        def add_box(img: Image.Image, coords: tuple) -> None:
+            width, height = img.size
+            boxes.append([coords[0], coords[1], coords[0] + width, coords[1] + height])
+
+        improvement_coordinates = region.graph.improvement_coordinates
+        if region.data.fallout and improvement_coordinates is not None:
+            add_box(self.nuke_img, improvement_coordinates)
+        elif region.improvement.name is not None and improvement_coordinates is not None:
+            max_health = SD.improvements[region.improvement.name].health
+            for img, (dx, dy) in self.sprites.improvement(region.improvement.name, region.improvement.health, max_health):
+                add_box(img, (improvement_coordinates[0] + dx, improvement_coordinates[1] + dy))
+
+        if region.unit.name is not None and region.graph.unit_coordinates is not None:
+            add_box(self.sprites.sprite("units/back.png"), region.graph.unit_coordinates)
+
+        return boxes
 
     def render_improvement(self, region: Region) -> None:
         """
@@ -159,24 +261,16 @@ class GameMaps:
             # place nuclear explosion
             # TODO: make shadow blend properly
             mask = self.nuke_img.split()[3]
-            self.main_map.paste(self.nuke_img, region.graph.improvement_coordinates, mask)
+            self.main_map.paste(self.nuke_img, self._position(region.graph.improvement_coordinates), mask)
             return
     
         if region.improvement.name is not None and region.graph.improvement_coordinates is not None:
             
-            # place improvement on map
-            improvement_img = Image.open(f"{self.images_filepath}/improvements/{region.improvement.name.lower()}.png")
-            x = region.graph.improvement_coordinates[0]
-            y = region.graph.improvement_coordinates[1]
-            self.main_map.paste(improvement_img, (x, y))
-
-            # place improvement health
-            if region.improvement.health != 99:
-                max_health = SD.improvements[region.improvement.name].health
-                health_img = Image.open(f"{self.images_filepath}/health/{region.improvement.health}-{max_health}.png")
-                x = region.graph.improvement_coordinates[0] - 12
-                y = region.graph.improvement_coordinates[1] + 52
-                self.main_map.paste(health_img, (x, y))
+            # place improvement and improvement health on map
+            x, y = region.graph.improvement_coordinates
+            max_health = SD.improvements[region.improvement.name].health
+            for img, (dx, dy) in self.sprites.improvement(region.improvement.name, region.improvement.health, max_health):
+                self.main_map.paste(img, self._position((x + dx, y + dy)))
 
     def render_unit(self, region: Region) -> None:
         """
@@ -190,57 +284,46 @@ class GameMaps:
         if region.unit.name is None or region.graph.unit_coordinates is None:
             return
             
-        # place unit image
+        # badges are drawn once per look and reused, see SpriteAtlas.unit_badge()
         nation = Nations.get(region.unit.owner_id)
-        fill_color = palette.hex_to_tup(nation.color, alpha=True)
-        unit_img = Image.open(self.filepath_unit_back).convert("RGBA")
-        match region.unit.level:
-            case 3:
-                unit_img = Image.open(self.filepath_unit_back_3).convert("RGBA")
-            case 2:
-                unit_img = Image.open(self.filepath_unit_back_2).convert("RGBA")
-            case 1:
-                unit_img = Image.open(self.filepath_unit_back_1).convert("RGBA")
-        ImageDraw.floodfill(unit_img, (1, 1), fill_color, border=(0, 0, 0, 255))
-
-        # place unit symbol
-        fill_color = palette.normal_to_occupied[nation.color]
-        fill_color = palette.hex_to_tup(fill_color, alpha=True)
-        symb_back_img = Image.open(self.filepath_unit_symb_back).convert("RGBA")
-        ImageDraw.floodfill(symb_back_img, (1, 1), fill_color, border=(0, 0, 0, 255))
-        symb_img = Image.open(f"{self.images_filepath}/units/{region.unit.name.lower()}.png")
-        symb_img = Image.alpha_composite(symb_back_img, symb_img)
-        unit_img.paste(symb_img, (9, 16))
-
-        # place unit name
-        font = ImageFont.truetype("app/fonts/LeelaUIb.ttf", size=10)
-        ImageDraw.Draw(unit_img).text(xy=(25, 5), text=region.unit.full_name, fill=(0, 0, 0, 255), font=font, anchor="mt", align="center")
-
-        # place unit stats
         status = f"{region.unit.true_damage}-{region.unit.armor}-{region.unit.health}"
-        ImageDraw.Draw(unit_img).text(xy=(25, 37), text=status, fill=(0, 0, 0, 255), font=font, anchor="mt", align="center")
+        unit_img = self.sprites.unit_badge(region.unit.name, region.unit.level, nation.color, region.unit.full_name, status)
         
         # place unit on map
-        x = region.graph.unit_coordinates[0]
-        y = region.graph.unit_coordinates[1]
-        self.main_map.paste(unit_img, (x, y))
+        self.main_map.paste(unit_img, self._position(region.graph.unit_coordinates))
 
-    def export(self) -> None:
-        """
-        Exports maps generated by this class as images.
-        """
+    def _main_map_filepath(self) -> str:
         
         game = Games.load(self.game_id)
         
         if game.status.is_setup():
-            self.main_map.save(f"gamedata/{self.game_id}/images/0.png")
+            return f"{self._game_images_path(self.game_id)}/0.png"
         elif game.status == GameStatus.ACTIVE_PENDING_EVENT:
-            self.main_map.save(f"gamedata/{self.game_id}/images/{game.turn}.png")
+            return f"{self._game_images_path(self.game_id)}/{game.turn}.png"
         else:
-            self.main_map.save(f"gamedata/{self.game_id}/images/{game.turn - 1}.png")
+            return f"{self._game_images_path(self.game_id)}/{game.turn - 1}.png"
+
+    def export(self, boxes: list[tuple] = None) -> None:
+        """
+        Exports maps generated by this class as images along with their tiles and previews (see MapTiles).
+        The three maps are encoded in parallel.
+
+        Params:
+            boxes (list): Optional (left, upper, right, lower) areas that changed since the last export. Only tiles covering them are written again.
+        """
         
-        self.resource_map.save(f"gamedata/{self.game_id}/images/resourcemap.png")
-        self.control_map.save(f"gamedata/{self.game_id}/images/controlmap.png")
+        save_params = {"compress_level": self.PNG_COMPRESS_LEVEL, "optimize": self.PNG_OPTIMIZE}
+        exports = [
+            ("mainmap", self._main_map_filepath(), self.main_map),
+            ("resourcemap", f"{self._game_images_path(self.game_id)}/resourcemap.png", self.resource_map),
+            ("controlmap", f"{self._game_images_path(self.game_id)}/controlmap.png", self.control_map)
+        ]
+
+        def export_map(name: str, filepath: str, map_img: Image.Image) -> None:
+            storage.save_image(filepath, map_img, **save_params)
+            MapTiles(self.game_id, name).update(map_img, boxes, **save_params)
+
+        self._run_parallel(*[lambda export=export: export_map(*export) for export in exports])
 
     def update_all(self) -> None:
         """
@@ -249,17 +332,184 @@ class GameMaps:
 
         print("Updating game maps...")
 
-        self.init_images()
-        self.color_regions()
-        self.apply_background()
-        self.apply_magnified()
-        self.apply_text()
+        self._colors = None
+        self.load_layers()
+        redraw_boxes = self._get_redraw_boxes()
+        
+        if redraw_boxes is None:
+            self.render_all()
+        else:
+            self.redraw(redraw_boxes)
+
+        self.export(redraw_boxes)
+        self._save_render_state()
 
-        for region in Regions:
-            self.render_improvement(region)
-            self.render_unit(region)
+    def render_all(self, box: tuple = None) -> None:
+        """
+        Draws all maps from scratch.
+
+        Params:
+            box (tuple): Optional (left, upper, right, lower) area of the map to draw. Defaults to the whole map.
+        """
 
-        self.export()
+        self.init_images(box)
+        ownership_layer, resource_layer, magnified_layer = self.color_regions()
+
+        # the three maps only share the color layers above so they are built in parallel
+        self.main_map, self.resource_map, self.control_map = self._run_parallel(
+            lambda: self.draw_main_map(ownership_layer, magnified_layer),
+            lambda: self.draw_text_map(self.resource_map, resource_layer),
+            lambda: self.draw_text_map(self.control_map, ownership_layer)
+        )
+
+        self.box = None
+
+    def redraw(self, boxes: list[tuple]) -> None:
+        """
+        Redraws parts of the previous maps.
+
+        Params:
+            boxes (list): (left, upper, right, lower) areas of the map to redraw.
+        """
+
+        rasters = GameMaps._rasters[self.game_id]
+        main_map = rasters["main"]
+        resource_map = rasters["resource"]
+        control_map = rasters["control"]
+
+        for box in boxes:
+            self.render_all(box)
+            main_map.paste(self.main_map, box[:2])
+            resource_map.paste(self.resource_map, box[:2])
+            control_map.paste(self.control_map, box[:2])
+
+        self.main_map = main_map
+        self.resource_map = resource_map
+        self.control_map = control_map
+
+    @classmethod
+    def defer_redraw(cls, game_id: str, region_ids: set[str]) -> None:
+        """
+        Records regions that changed in a request that did not update the maps so the next update still redraws them.
+
+        Regions are appended to a log rather than saved in the render state, which is only written by map updates.
+        Updates remember how far into the log they have drawn, so regions deferred while an update is running are never lost.
+        """
+
+        if not os.path.isdir(cls._game_images_path(game_id)):
+            return    # the first update will draw everything anyway
+        storage.append_line(cls._pending_redraws_path(game_id), json.dumps(sorted(region_ids)))
+
+    @classmethod
+    def pending_redraws_end(cls, game_id: str) -> int:
+        """
+        Returns the current end of the deferred redraw log. A map update given this as its pending_end only redraws regions deferred before now.
+        """
+        pending_redraws_path = cls._pending_redraws_path(game_id)
+        if not os.path.exists(pending_redraws_path):
+            return 0
+        return os.path.getsize(pending_redraws_path)
+
+    def _get_redraw_boxes(self) -> list[tuple] | None:
+        """
+        Works out which parts of the previous maps need to be redrawn.
+
+        Returns:
+            list | None: Areas to redraw, or None if everything must be drawn from scratch.
+        """
+
+        redraw_region_ids = Regions.take_redraws()
+        render_state_path = self._render_state_path(self.game_id)
+        render_state = storage.load_json(render_state_path) if os.path.exists(render_state_path) else {}
+        pending_lines, self._pending_offset = storage.load_json_lines_after(self._pending_redraws_path(self.game_id), render_state.get("pendingOffset", 0), self.pending_end)
+        if not render_state:
+            return None
+
+        pending = set(render_state.get("pending", []))    # saved by older versions
+        for region_ids in pending_lines:
+            pending.update(region_ids)
+
+        # nation colors and map layers affect every region
+        nation_colors = {nation.id: nation.color for nation in Nations}
+        if render_state["layersHash"] != self.layers.source_hash or render_state["colors"] != nation_colors:
+            return None
+
+        if not self._load_previous_maps(render_state["version"], render_state["mainMap"]):
+            return None
+
+        redraw_region_ids |= pending
+        previous_sprite_boxes = render_state["spriteBoxes"]
+        boxes = []
+        for region_id in sorted(redraw_region_ids):
+            region = Regions.load(region_id)
+            for labels in [self.layers.regions, self.layers.magnified_boxes]:
+                if region_id in labels.boxes:
+                    boxes.append(tuple(labels.boxes[region_id]))
+            for sprite_box in previous_sprite_boxes.get(region_id, []) + self.get_sprite_boxes(region):
+                boxes.append(tuple(sprite_box))
+
+        width, height = self.layers.main.size
+        boxes = [_clip(box, width, height) for box in boxes]
+        boxes = [box for box in boxes if box[0] < box[2] and box[1] < box[3]]
+        if sum((box[2] - box[0]) * (box[3] - box[1]) for box in boxes) > self.MAX_REDRAW_AREA * width * height:
+            return None
+
+        return boxes
+
+    def _load_previous_maps(self, version: int, main_map_filepath: str) -> bool:
+        
+        rasters = GameMaps._rasters.get(self.game_id)
+        if rasters is not None and rasters["version"] == version:
+            return True
+
+        filepaths = {
+            "main": main_map_filepath,
+            "resource": f"{self._game_images_path(self.game_id)}/resourcemap.png",
+            "control": f"{self._game_images_path(self.game_id)}/controlmap.png"
+        }
+        if not all(os.path.exists(filepath) for filepath in filepaths.values()):
+            return False
+
+        rasters = {"version": version}
+        for name, filepath in filepaths.items():
+            with Image.open(filepath) as img:
+                rasters[name] = img.convert("RGBA")
+        if any(rasters[name].size != self.layers.main.size for name in filepaths):
+            return False
+        
+        self._cache_maps(rasters)
+        return True
+
+    def _cache_maps(self, rasters: dict) -> None:
+        GameMaps._rasters.pop(self.game_id, None)
+        GameMaps._rasters[self.game_id] = rasters
+        while len(GameMaps._rasters) > self.RASTER_CACHE_SIZE:
+            del GameMaps._rasters[next(iter(GameMaps._rasters))]
+
+    def _save_render_state(self) -> None:
+
+        render_state_path = self._render_state_path(self.game_id)
+        version = 1
+        if os.path.exists(render_state_path):
+            version = storage.load_json(render_state_path)["version"] + 1
+        
+        self._cache_maps({"version": version, "main": self.main_map, "resource": self.resource_map, "control": self.control_map})
+
+        sprite_boxes = {}
+        for region in Regions:
+            boxes = self.get_sprite_boxes(region)
+            if boxes:
+                sprite_boxes[region.id] = boxes
+
+        render_state = {
+            "version": version,
+            "layersHash": self.layers.source_hash,
+            "mainMap": self._main_map_filepath(),
+            "colors": {nation.id: nation.color for nation in Nations},
+            "pendingOffset": self._pending_offset,
+            "spriteBoxes": sprite_boxes
+        }
+        storage.save_json(render_state_path, render_state)
 
     def populate_main_map(self) -> None:
         """
@@ -288,7 +538,7 @@ class GameMaps:
             
             # there cannot be other improvements within a radius of two regions
             nearby_improvement_found = False
-            for region_id in random_region.get_regions_in_radius(2):
+            for region_id in Regions.within(random_region.id, 2):
                 temp = Regions.load(region_id)
                 if temp.improvement.name is not None:
                     nearby_improvement_found = True
@@ -384,4 +634,10 @@ class GameMaps:
             random_region_id = random.choice(region_id_list)
             region = Regions.load(random_region_id)
             region.data.resource = resource
-            region_id_list.remove(random_region_id)
\ No newline at end of file
+            region_id_list.remove(random_region_id)
+
+def _overlaps(box_a: list, box_b: tuple) -> bool:
+    return box_a[0] < box_b[2] and box_b[0] < box_a[2] and box_a[1] < box_b[3] and box_b[1] < box_a[3]
+
+def _clip(box: tuple, width: int, height: int) -> tuple:
+    return (max(box[0], 0), max(box[1], 0), min(box[2], width), min(box[3], height))
\ No newline at end of file
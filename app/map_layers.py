@@ -0,0 +1,342 @@
+import hashlib
+import os
+from typing import ClassVar
+
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+
+from app import palette
+from app import storage
+from app.region.adjacency import AdjacencyGraph
+
+BORDER = 254
+EMPTY = 255
+LABELS_PER_PLANE = 254
+
+def border_mask(image: Image.Image) -> Image.Image:
+    """
+    Returns an "L" mask that is 255 wherever image is opaque black, the border color used by map floodfills.
+    """
+    r, g, b, a = image.convert("RGBA").split()
+    is_black = ImageChops.lighter(ImageChops.lighter(r, g), b).point(lambda v: 255 if v == 0 else 0)
+    is_opaque = a.point(lambda v: 255 if v == 255 else 0)
+    return ImageChops.darker(is_black, is_opaque)
+
+def floodfill(image: Image.Image, xy: tuple, value: int, border: int) -> list[int] | None:
+    """
+    Same fill as ImageDraw.floodfill() with a border color, but also returns the (left, upper, right, lower) box of the filled pixels.
+    Returns None if nothing was filled.
+    """
+
+    width, height = image.size
+    pixels = image.load()
+    x, y = xy
+    if not (0 <= x < width and 0 <= y < height) or pixels[x, y] == value:
+        return None
+    
+    pixels[x, y] = value
+    left, upper, right, lower = x, y, x, y
+    stack = [(x, y)]
+    while stack:
+        x, y = stack.pop()
+        for s, t in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= s < width and 0 <= t < height and pixels[s, t] not in (value, border):
+                pixels[s, t] = value
+                stack.append((s, t))
+                if s < left:
+                    left = s
+                elif s > right:
+                    right = s
+                if t < upper:
+                    upper = t
+                elif t > lower:
+                    lower = t
+
+    return [left, upper, right + 1, lower + 1]
+
+class RegionLabels:
+    """
+    Records which region every pixel of a map image belongs to.
+
+    Regions are numbered in the order they are given to build(). Region i is stored as the value i % 254 in plane
+    i // 254, so each plane is a single "L" image. Border pixels are 254 and pixels outside of any region are 255.
+    Coloring a map is a palette lookup over each plane rather than a floodfill per region.
+    """
+
+    def __init__(self, region_ids: list[str], planes: list[Image.Image], boxes: dict[str, list[int]]):
+        self.region_ids = region_ids
+        self.planes = planes
+        self.boxes = boxes
+        self.index = {region_id: i for i, region_id in enumerate(region_ids)}
+
+    @classmethod
+    def build(cls, border_source: Image.Image, seeds: dict[str, list[tuple]]) -> "RegionLabels":
+        """
+        Labels each region by floodfilling from its seed points, stopping at opaque black pixels.
+
+        Params:
+            border_source (Image): Image whose opaque black pixels separate regions.
+            seeds (dict): Maps each region id to the pixel coordinates used to floodfill it.
+
+        Returns:
+            RegionLabels: Labels for every seeded region.
+        """
+
+        region_ids = list(seeds.keys())
+        borders = border_mask(border_source)
+        planes = []
+        for _ in range(0, max(len(region_ids), 1), LABELS_PER_PLANE):
+            plane = Image.new("L", border_source.size, EMPTY)
+            plane.paste(BORDER, mask=borders)
+            planes.append(plane)
+
+        boxes = {}
+        for i, region_id in enumerate(region_ids):
+            plane = planes[i // LABELS_PER_PLANE]
+            for coords in seeds[region_id]:
+                box = floodfill(plane, tuple(coords), i % LABELS_PER_PLANE, BORDER)
+                if box is None:
+                    continue
+                if region_id in boxes:
+                    box = [min(boxes[region_id][0], box[0]), min(boxes[region_id][1], box[1]), max(boxes[region_id][2], box[2]), max(boxes[region_id][3], box[3])]
+                boxes[region_id] = box
+
+        return RegionLabels(region_ids, planes, boxes)
+
+    def colorize(self, colors: dict[str, tuple], box: tuple = None) -> Image.Image:
+        """
+        Paints regions in the given colors.
+
+        Params:
+            colors (dict): Maps region ids to RGBA colors. Regions that are not included are left transparent.
+            box (tuple): Optional (left, upper, right, lower) area to paint. Defaults to the whole image.
+
+        Returns:
+            Image: RGBA image of the painted regions.
+        """
+
+        layer = None
+        for k, plane in enumerate(self.planes):
+
+            palette = bytearray(256 * 4)
+            plane_has_color = False
+            for value in range(LABELS_PER_PLANE):
+                i = k * LABELS_PER_PLANE + value
+                if i >= len(self.region_ids):
+                    break
+                color = colors.get(self.region_ids[i])
+                if color is not None:
+                    palette[value * 4:value * 4 + 4] = bytes(color)
+                    plane_has_color = True
+
+            if layer is not None and not plane_has_color:
+                continue
+
+            plane_colored = plane.crop(box) if box is not None else plane.copy()
+            plane_colored.putpalette(palette, rawmode="RGBA")
+            plane_colored = plane_colored.convert("RGBA")
+
+            if layer is None:
+                layer = plane_colored
+            else:
+                layer.alpha_composite(plane_colored)
+
+        return layer
+
+    def save(self, directory: str, name: str) -> dict:
+        """
+        Saves each plane as a PNG file and returns the metadata needed to load them again.
+        """
+        os.makedirs(directory, exist_ok=True)
+        for k, plane in enumerate(self.planes):
+            plane.save(os.path.join(directory, f"{name}_{k}.png"))
+        return {"regionIds": self.region_ids, "planes": len(self.planes), "boxes": self.boxes}
+
+    @classmethod
+    def load(cls, directory: str, name: str, metadata: dict) -> "RegionLabels":
+        planes = []
+        for k in range(metadata["planes"]):
+            with Image.open(os.path.join(directory, f"{name}_{k}.png")) as plane:
+                planes.append(plane.convert("L"))
+        return RegionLabels(metadata["regionIds"], planes, metadata["boxes"])
+
+class MapLayers:
+    """
+    The static images a map is built from, loaded once per process and shared by every game on that map.
+
+    Region labels for the map regions and the magnified boxes are built from these images the first time a map is used.
+    They are saved in a labels folder next to the images and rebuilt if the images or graph.json change.
+    """
+
+    MAP_OPACITY: ClassVar[float] = 0.75
+
+    _cache: ClassVar[dict[str, "MapLayers"]] = {}
+
+    def __init__(self, map_str: str):
+
+        self.map_str = map_str
+        image_resources_filepath = self._image_resources_path(map_str)
+        self.graph, adjacency = AdjacencyGraph.load(f"maps/{map_str}/graph.json")
+
+        source_hash = hashlib.sha256(adjacency.graph_hash.encode())
+        images = {}
+        for name in ["background", "magnified", "main", "text"]:
+            filepath = f"{image_resources_filepath}/{name}.png"
+            with open(filepath, 'rb') as f:
+                source_hash.update(f.read())
+            with Image.open(filepath) as image:
+                images[name] = image.convert("RGBA")
+
+        self.background: Image.Image = images["background"]
+        self.magnified: Image.Image = images["magnified"]
+        self.main: Image.Image = images["main"]
+        self.text: Image.Image = images["text"]
+
+        self.source_hash = source_hash.hexdigest()
+        self._load_labels(f"{image_resources_filepath}/labels", self.source_hash)
+
+    @staticmethod
+    def _image_resources_path(map_str: str) -> str:
+        return f"app/static/images/map_images/{map_str}/image_resources"
+
+    @classmethod
+    def load(cls, map_str: str) -> "MapLayers":
+        if map_str not in cls._cache:
+            cls._cache[map_str] = MapLayers(map_str)
+        return cls._cache[map_str]
+
+    def _load_labels(self, labels_filepath: str, source_hash: str) -> None:
+
+        metadata_filepath = f"{labels_filepath}/labels.json"
+        if os.path.exists(metadata_filepath):
+            metadata = storage.load_json(metadata_filepath)
+            if metadata.get("sourceHash") == source_hash:
+                self.regions = RegionLabels.load(labels_filepath, "regions", metadata["regions"])
+                self.magnified_boxes = RegionLabels.load(labels_filepath, "magnified", metadata["magnified"])
+                return
+
+        region_seeds = {}
+        magnified_seeds = {}
+        for region_id, region_graph in self.graph.items():
+            improvement_coordinates = region_graph["improvementCords"]
+            seeds = []
+            if improvement_coordinates is not None and not region_graph["isMagnified"]:
+                seeds.append((improvement_coordinates[0] + 25, improvement_coordinates[1] + 25))
+            seeds += [tuple(coords) for coords in region_graph["additionalRegionCords"]]
+            region_seeds[region_id] = seeds
+            if improvement_coordinates is not None and region_graph["isMagnified"]:
+                x, y = improvement_coordinates
+                magnified_seeds[region_id] = [(x + 25, y + 25), (x + 55, y + 25), (x + 70, y + 25)]
+
+        # magnified boxes are filled after the background and magnified layers are applied so their borders come from both
+        magnified_border_source = Image.blend(self.background, self.main, self.MAP_OPACITY)
+        magnified_border_source.alpha_composite(self.magnified)
+
+        self.regions = RegionLabels.build(self.main, region_seeds)
+        self.magnified_boxes = RegionLabels.build(magnified_border_source, magnified_seeds)
+
+        metadata = {
+            "sourceHash": source_hash,
+            "regions": self.regions.save(labels_filepath, "regions"),
+            "magnified": self.magnified_boxes.save(labels_filepath, "magnified")
+        }
+        storage.save_json(metadata_filepath, metadata)
+
+class SpriteAtlas:
+    """
+    The improvement, health bar, unit, and nuke images drawn on top of the maps, loaded once per process.
+
+    Unit badges are drawn once for each combination of unit, level, nation color, name, and stats and then reused.
+    The same goes for the improvement and health bar images of each improvement and health value. Both caches
+    drop the least recently used entry once they are full.
+    """
+
+    BADGE_CACHE_SIZE: ClassVar[int] = 512
+    FONT_FILEPATH: ClassVar[str] = "app/fonts/LeelaUIb.ttf"
+
+    _cache: ClassVar[dict[str, "SpriteAtlas"]] = {}
+
+    def __init__(self, images_filepath: str):
+        self.images_filepath = images_filepath
+        self._sprites: dict[str, Image.Image] = {}
+        self._unit_badges: dict[tuple, Image.Image] = {}
+        self._improvement_sprites: dict[tuple, list] = {}
+        self._font = None
+
+    @classmethod
+    def load(cls, images_filepath: str) -> "SpriteAtlas":
+        if images_filepath not in cls._cache:
+            cls._cache[images_filepath] = SpriteAtlas(images_filepath)
+        return cls._cache[images_filepath]
+
+    @property
+    def font(self) -> ImageFont.FreeTypeFont:
+        if self._font is None:
+            self._font = ImageFont.truetype(self.FONT_FILEPATH, size=10)
+        return self._font
+
+    def sprite(self, name: str) -> Image.Image:
+        """
+        Returns an RGBA image from the sprite folder, e.g. "units/back.png". Shared, must not be modified.
+        """
+        if name not in self._sprites:
+            with Image.open(f"{self.images_filepath}/{name}") as image:
+                self._sprites[name] = image.convert("RGBA")
+        return self._sprites[name]
+
+    def improvement(self, improvement_name: str, health: int, max_health: int) -> list[tuple[Image.Image, tuple]]:
+        """
+        Returns the images of an improvement along with their offsets from the improvement coordinates.
+        The health bar is only included for improvements that have health.
+        """
+
+        key = (improvement_name, health, max_health)
+        sprites = self._improvement_sprites.pop(key, None)
+        if sprites is None:
+            sprites = [(self.sprite(f"improvements/{improvement_name.lower()}.png"), (0, 0))]
+            if health != 99:
+                sprites.append((self.sprite(f"health/{health}-{max_health}.png"), (-12, 52)))
+        
+        self._remember(self._improvement_sprites, key, sprites)
+        return sprites
+
+    def unit_badge(self, unit_name: str, level: int, color: str, full_name: str, status: str) -> Image.Image:
+        """
+        Returns the image of a unit as it appears on the map. Shared, must not be modified.
+
+        Params:
+            unit_name (str): Unit type, e.g. "Infantry".
+            level (int): Unit level. Levels 1 to 3 have their own background.
+            color (str): Hex color of the nation that owns the unit.
+            full_name (str): Name written at the top of the badge.
+            status (str): Damage, armor, and health written at the bottom of the badge.
+        """
+
+        key = (unit_name, level, color, full_name, status)
+        badge = self._unit_badges.pop(key, None)
+        if badge is not None:
+            self._remember(self._unit_badges, key, badge)
+            return badge
+        
+        # unit background
+        background_name = f"units/back_{level}.png" if level in (1, 2, 3) else "units/back.png"
+        badge = self.sprite(background_name).copy()
+        ImageDraw.floodfill(badge, (1, 1), palette.hex_to_tup(color, alpha=True), border=(0, 0, 0, 255))
+
+        # unit symbol
+        symb_back_img = self.sprite("units/back_symb.png").copy()
+        ImageDraw.floodfill(symb_back_img, (1, 1), palette.hex_to_tup(palette.normal_to_occupied[color], alpha=True), border=(0, 0, 0, 255))
+        symb_img = Image.alpha_composite(symb_back_img, self.sprite(f"units/{unit_name.lower()}.png"))
+        badge.paste(symb_img, (9, 16))
+
+        # unit name and stats
+        draw = ImageDraw.Draw(badge)
+        draw.text(xy=(25, 5), text=full_name, fill=(0, 0, 0, 255), font=self.font, anchor="mt", align="center")
+        draw.text(xy=(25, 37), text=status, fill=(0, 0, 0, 255), font=self.font, anchor="mt", align="center")
+
+        self._remember(self._unit_badges, key, badge)
+        return badge
+
+    def _remember(self, cache: dict, key: tuple, value) -> None:
+        cache[key] = value
+        while len(cache) > self.BADGE_CACHE_SIZE:
+            del cache[next(iter(cache))]
\ No newline at end of file
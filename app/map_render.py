@@ -0,0 +1,168 @@
+import copy
+import os
+import threading
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import ClassVar
+
+from app import storage
+
+class MapRenderer:
+    """
+    Updates game maps in a background process so turn resolution does not have to wait on image rendering.
+
+    submit() takes a copy of the current game, region, and nation data and queues a job that draws and exports the maps from that copy.
+    Jobs for the same game always run one at a time in the order they were submitted. The worker processes are kept alive
+    between jobs so the map layers, sprites, and previous maps they have loaded are reused (see MapLayers and GameMaps).
+
+    Map images are replaced atomically so the previous maps keep being served until the new ones are complete.
+    status() reports whether a game has maps waiting to be drawn.
+    """
+
+    MAX_WORKERS: ClassVar[int] = 1
+
+    _executor: ClassVar[ProcessPoolExecutor] = None
+    _queued: ClassVar[dict[str, list[dict]]] = {}
+    _running: ClassVar[dict[str, Future]] = {}
+    _lock: ClassVar[threading.RLock] = threading.RLock()
+
+    @staticmethod
+    def _status_path(game_id: str) -> str:
+        from app.map import GameMaps
+        return f"{GameMaps._game_images_path(game_id)}/render_status.json"
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ProcessPoolExecutor(max_workers=cls.MAX_WORKERS)
+        return cls._executor
+
+    @classmethod
+    def snapshot(cls, game_id: str) -> dict:
+        """
+        Copies everything needed to draw the maps of a game in another process.
+        Regions marked for redraw are handed to the job so they are not also deferred by Regions.save().
+        """
+
+        from app.game.games import Games
+        from app.map import GameMaps
+        from app.nation.nations import Nations
+        from app.region.regions import Regions
+
+        # taken before the copy so redraws deferred after it, which the copied regions may not include, are left for the next update
+        pending_end = GameMaps.pending_redraws_end(game_id)
+        return {
+            "gameId": game_id,
+            "game": copy.deepcopy(Games._data[game_id]),
+            "regions": copy.deepcopy(Regions._data),
+            "nations": copy.deepcopy(Nations._data),
+            "redraws": sorted(Regions.take_redraws()),
+            "pendingEnd": pending_end,
+            "submitted": datetime.now().isoformat(timespec="seconds")
+        }
+
+    @classmethod
+    def submit(cls, game_id: str) -> None:
+        """
+        Queues a map update for a game using its current state.
+        """
+
+        job = cls.snapshot(game_id)
+        with cls._lock:
+            cls._queued.setdefault(game_id, []).append(job)
+            if game_id not in cls._running:
+                cls._start_next(game_id)
+
+    @classmethod
+    def _start_next(cls, game_id: str) -> None:
+        """
+        Starts the oldest queued job of a game. Must be called while holding the lock.
+        """
+
+        queued = cls._queued.get(game_id)
+        if not queued:
+            cls._queued.pop(game_id, None)
+            cls._running.pop(game_id, None)
+            return
+
+        job = queued.pop(0)
+        future = cls._get_executor().submit(render_maps, job)
+        cls._running[game_id] = future
+        future.add_done_callback(lambda f: cls._job_done(game_id, f))
+
+    @classmethod
+    def _job_done(cls, game_id: str, future: Future) -> None:
+
+        exception = future.exception()
+        if exception is not None:
+            print(f"Failed to update maps for game {game_id}: {exception}")
+
+        with cls._lock:
+            if isinstance(exception, BrokenProcessPool):
+                cls._executor = None    # a worker died, start a new pool for the next job
+            cls._running.pop(game_id, None)
+            cls._start_next(game_id)
+
+    @classmethod
+    def status(cls, game_id: str) -> dict:
+        """
+        Returns the render status of a game.
+
+        Returns:
+            dict: "state" is "queued" or "rendering" while an update is waiting, otherwise the result of the last update
+            ("ready" or "failed") or "idle" if the maps have never been drawn in the background.
+        """
+
+        with cls._lock:
+            queued = len(cls._queued.get(game_id, []))
+            running = game_id in cls._running
+
+        last_result = {}
+        status_path = cls._status_path(game_id)
+        if os.path.exists(status_path):
+            last_result = storage.load_json(status_path)
+
+        if running:
+            return {"state": "rendering", "queued": queued, "lastResult": last_result}
+        if queued:
+            return {"state": "queued", "queued": queued, "lastResult": last_result}
+        if last_result:
+            return last_result
+        return {"state": "idle"}
+
+def render_maps(job: dict) -> None:
+    """
+    Draws and exports the maps of a game from a snapshot taken by MapRenderer.snapshot(). Runs in a worker process.
+    """
+
+    from app.game.games import Games
+    from app.map import GameMaps
+    from app.nation.nations import Nations
+    from app.region.regions import Regions
+    from app.scenario.scenario import ScenarioInterface as SD
+
+    game_id = job["gameId"]
+    status = {"submitted": job["submitted"]}
+
+    try:
+        Games.attach(game_id, job["game"])
+        SD.load(game_id)
+        Regions.attach(game_id, job["regions"])
+        Nations.attach(game_id, job["nations"])
+        for region_id in job["redraws"]:
+            Regions.mark_for_redraw(region_id)
+
+        maps = GameMaps(game_id)
+        maps.pending_end = job["pendingEnd"]
+        maps.update_all()
+        status |= {"state": "ready", "mainMap": maps._main_map_filepath()}
+
+    except Exception:
+        status |= {"state": "failed", "error": traceback.format_exc()}
+        raise
+
+    finally:
+        status["finished"] = datetime.now().isoformat(timespec="seconds")
+        storage.save_json(MapRenderer._status_path(game_id), status)
\ No newline at end of file
@@ -0,0 +1,94 @@
+import os
+import shutil
+from typing import ClassVar
+
+from PIL import Image
+
+from app import storage
+
+class MapTiles:
+    """
+    Cuts an exported map into a pyramid of small tiles plus a downscaled preview so pages do not have to download the full map.
+
+    Zoom level 0 fits the whole map in a single tile and every level after that doubles the resolution, up to the full map.
+    Tiles are saved as tiles/<name>/<zoom>/<x>_<y>.png and described by tiles/<name>/tiles.json.
+    When only parts of a map changed, only the tiles covering those parts are written again so unchanged tiles keep their ETags.
+    """
+
+    TILE_SIZE: ClassVar[int] = 256
+    PREVIEW_WIDTH: ClassVar[int] = 1024
+
+    def __init__(self, game_id: str, name: str):
+        from app.map import GameMaps
+        self.game_id = game_id
+        self.name = name
+        self.tiles_filepath = f"{GameMaps._game_images_path(game_id)}/tiles/{name}"
+
+    @property
+    def preview_filepath(self) -> str:
+        return f"{self.tiles_filepath}/preview.png"
+
+    def tile_filepath(self, zoom: int, x: int, y: int) -> str:
+        return f"{self.tiles_filepath}/{zoom}/{x}_{y}.png"
+
+    def metadata(self) -> dict | None:
+        """
+        Returns the size and zoom levels of the saved tiles, or None if there are none.
+        """
+        metadata_filepath = f"{self.tiles_filepath}/tiles.json"
+        if not os.path.exists(metadata_filepath):
+            return None
+        return storage.load_json(metadata_filepath)
+
+    @classmethod
+    def max_zoom(cls, width: int, height: int) -> int:
+        zoom = 0
+        while max(width, height) > cls.TILE_SIZE * 2 ** zoom:
+            zoom += 1
+        return zoom
+
+    def update(self, image: Image.Image, boxes: list[tuple] = None, **save_params) -> None:
+        """
+        Writes the tiles and preview of a map.
+
+        Params:
+            image (Image): Full resolution map.
+            boxes (list): Optional (left, upper, right, lower) areas of the map that changed since the last update. If not given every tile is written.
+            save_params: Extra options passed on to Image.save().
+        """
+
+        width, height = image.size
+        max_zoom = self.max_zoom(width, height)
+        metadata = {"width": width, "height": height, "tileSize": self.TILE_SIZE, "maxZoom": max_zoom}
+
+        # tiles cut from a different map size cannot be reused
+        metadata_filepath = f"{self.tiles_filepath}/tiles.json"
+        if self.metadata() != metadata:
+            boxes = None
+            if os.path.exists(self.tiles_filepath):
+                shutil.rmtree(self.tiles_filepath)
+        
+        # tiles.json is only written back once every tile is up to date, so an update that fails partway is redone in full
+        if os.path.exists(metadata_filepath):
+            os.remove(metadata_filepath)
+
+        for zoom in range(max_zoom, -1, -1):
+            scale = 2 ** (max_zoom - zoom)
+            full_tile_size = self.TILE_SIZE * scale
+            level_img = image.reduce(scale) if scale > 1 else image
+            os.makedirs(f"{self.tiles_filepath}/{zoom}", exist_ok=True)
+
+            for x in range(0, (width + full_tile_size - 1) // full_tile_size):
+                for y in range(0, (height + full_tile_size - 1) // full_tile_size):
+                    tile_box = (x * full_tile_size, y * full_tile_size, (x + 1) * full_tile_size, (y + 1) * full_tile_size)
+                    if boxes is not None and not any(_overlaps(box, tile_box) for box in boxes):
+                        continue
+                    crop_box = (x * self.TILE_SIZE, y * self.TILE_SIZE, min((x + 1) * self.TILE_SIZE, level_img.width), min((y + 1) * self.TILE_SIZE, level_img.height))
+                    storage.save_image(self.tile_filepath(zoom, x, y), level_img.crop(crop_box), **save_params)
+
+        preview = image.resize((self.PREVIEW_WIDTH, round(height * self.PREVIEW_WIDTH / width)), Image.Resampling.LANCZOS, reducing_gap=2.0)
+        storage.save_image(self.preview_filepath, preview, **save_params)
+        storage.save_json(metadata_filepath, metadata)
+
+def _overlaps(box_a: tuple, box_b: tuple) -> bool:
+    return box_a[0] < box_b[2] and box_b[0] < box_a[2] and box_a[1] < box_b[3] and box_b[1] < box_a[3]
\ No newline at end of file
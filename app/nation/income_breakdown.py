@@ -0,0 +1,152 @@
+from typing import ClassVar
+
+def _plural(improvement_name: str) -> str:
+    if improvement_name[-1] != 'y':
+        return f"{improvement_name}s"
+    return f"{improvement_name[:-1]}ies"
+
+class IncomeBreakdown:
+    """
+    Where the income of a nation came from during the last income update, shown on the nation sheet.
+
+    Saved as {"totals": {resource name: net income}, "records": [[kind, source, resource name, amount, count], ...]}.
+    Amounts are the change to the income of the resource and records with the same kind, source, resource, and amount
+    (to the cent) are counted together. The text shown for each record is only built when the nation sheet asks for it.
+
+    Games saved by older versions store the text lines themselves. These are still shown until the next income update.
+    """
+
+    # text of each kind of record, given the source name and amount
+    TEMPLATES: ClassVar[dict[str, callable]] = {
+        "improvement": lambda source, amount: f"+{amount:.2f} from {_plural(source)}",
+        "alliance": lambda source, amount: f"+{amount:.2f} from {source}.",
+        "war": lambda source, amount: f"+{amount:g} from winning a war",
+        "tag": lambda source, amount: f"{amount:+.2f} from {source}.",
+        "rate": lambda source, amount: f"{amount:+.2f} from income rate.",
+        "tribute paid": lambda source, amount: f"-{-amount:.2f} from tribute to {source}.",
+        "tribute received": lambda source, amount: f"{amount:.2f} from puppet state tribute.",
+        "upkeep": lambda source, amount: f"-{-amount:.2f} from upkeep costs.",
+        "energy upkeep": lambda source, amount: f"-{-amount:.2f} from energy upkeep costs.",
+        "energy payment": lambda source, amount: f"+{amount:.2f} from {source}.",
+        "ranking": lambda source, amount: f"+{amount:.2f} {source}"
+    }
+
+    # resources that are always shown on the nation sheet even if there is nothing to explain
+    ALWAYS_SHOWN: ClassVar[list[str]] = ["Dollars", "Political Power", "Research", "Military Capacity", "Energy"]
+
+    def __init__(self, d: dict | list = None):
+        """
+        Params:
+            d (dict | list): Saved income details. A new empty breakdown is created if not given.
+        """
+        self._data = d if d is not None else {"totals": {}, "records": []}
+        self._index: dict[tuple, list] = None
+
+    @property
+    def data(self) -> dict | list:
+        return self._data
+
+    @property
+    def is_legacy(self) -> bool:
+        return isinstance(self._data, list)
+
+    def add(self, kind: str, source: str | None, resource_name: str, amount: float, *, first: bool = False) -> None:
+        """
+        Records a change to the income of a resource.
+
+        Params:
+            kind (str): Type of source, one of TEMPLATES.
+            source (str): Name of the improvement, alliance, tag... the income came from. None if not needed by the kind.
+            resource_name (str): Resource affected.
+            amount (float): Change to the income of the resource.
+            first (bool): If True a new record is listed before all others.
+        """
+
+        if self.is_legacy:
+            self._data = {"totals": {}, "records": []}
+        if self._index is None:
+            self._index = {(record[0], record[1], record[2], record[3]): record for record in self._data["records"]}
+
+        amount = round(amount, 2)
+        key = (kind, source, resource_name, amount)
+        record = self._index.get(key)
+        if record is not None:
+            record[4] += 1
+            return
+
+        record = [kind, source, resource_name, amount, 1]
+        self._index[key] = record
+        if first:
+            self._data["records"].insert(0, record)
+        else:
+            self._data["records"].append(record)
+
+    def set_total(self, resource_name: str, amount: float) -> None:
+        self._data["totals"][resource_name] = amount
+
+    def add_total(self, resource_name: str, amount: float) -> None:
+        self._data["totals"][resource_name] = self._data["totals"].get(resource_name, 0) + amount
+
+    def records(self, resource_name: str = None) -> list[tuple]:
+        """
+        Returns the recorded changes, optionally only the ones affecting a single resource.
+
+        Returns:
+            list: (kind, source, resource name, amount, count) tuples.
+        """
+        if self.is_legacy:
+            return []
+        return [tuple(record) for record in self._data["records"] if resource_name is None or record[2] == resource_name]
+
+    def sections(self, resource_names: list[str]) -> dict[str, list[str]]:
+        """
+        Builds the text shown on the nation sheet.
+
+        Params:
+            resource_names (list): Names of all resources in the order they are shown.
+
+        Returns:
+            dict: Lines for each resource keyed by the css class of the resource. The first line is the total.
+        """
+
+        if self.is_legacy:
+            return self._legacy_sections(resource_names)
+
+        lines_by_resource = {resource_name: [] for resource_name in resource_names}
+        for kind, source, resource_name, amount, count in self._data["records"]:
+            line = IncomeBreakdown.TEMPLATES[kind](source, amount)
+            if count > 1:
+                line = f"{line} [{count}x]"
+            lines_by_resource.setdefault(resource_name, []).append(line)
+
+        sections = {}
+        for resource_name in resource_names:
+            if resource_name not in self._data["totals"]:
+                continue
+            lines = lines_by_resource[resource_name]
+            if lines or resource_name in IncomeBreakdown.ALWAYS_SHOWN:
+                sections[resource_name.lower().replace(" ", "-")] = [f"{self._data['totals'][resource_name]:+.2f} {resource_name}"] + lines
+
+        return sections
+
+    def _legacy_sections(self, resource_names: list[str]) -> dict[str, list[str]]:
+
+        def fetch_color_class(income_str: str) -> str:
+            for resource_name in resource_names:
+                if resource_name in income_str:
+                    return resource_name.lower().replace(" ", "-")
+
+        sections = {}
+        lines = []
+        color_class = ""
+        for income_str in self._data:
+            if income_str.startswith("<section> "):
+                if lines:
+                    sections[color_class] = lines
+                color_class = fetch_color_class(income_str)
+                lines = [income_str[10:]]
+            else:
+                lines.append(income_str)
+        sections[color_class] = lines
+
+        return sections
\ No newline at end of file
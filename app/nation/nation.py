@@ -2,6 +2,8 @@ import os
 from collections.abc import Generator
 
 from app.scenario.scenario import ScenarioInterface as SD
+from .income_breakdown import IncomeBreakdown
+from .nation_modifiers import NationModifiers
 
 class Nation:
     
@@ -11,6 +13,8 @@ class Nation:
         self._game_id = game_id
         self.stats = NationStatistics(self._data["statistics"])
         self.records = NationRecords(self._data["records"])
+        self._modifiers: NationModifiers = None
+        _convert_resource_strings(self._data["resources"])
 
     @property
     def name(self) -> str:
@@ -18,7 +22,9 @@ class Nation:
 
     @name.setter
     def name(self, value: str):
+        from .nations import Nations
         self._data["nationName"] = value
+        Nations.reset_indexes()
 
     @property
     def player_id(self) -> str:
@@ -69,7 +75,9 @@ class Nation:
 
     @status.setter
     def status(self, value: str) -> None:
+        from .nations import Nations
         self._data["status"] = value
+        Nations.reset_indexes()
 
     @property
     def trade_fee(self) -> str:
@@ -118,6 +126,7 @@ class Nation:
     @completed_research.setter
     def completed_research(self, value: dict) -> None:
         self._data["unlockedResearch"] = value
+        self._modifiers = None
 
     @property
     def improvement_counts(self) -> dict:
@@ -158,6 +167,24 @@ class Nation:
     @tags.setter
     def tags(self, value: dict) -> None:
         self._data["tags"] = value
+        self._modifiers = None
+
+    @property
+    def modifiers(self) -> NationModifiers:
+        """
+        Modifiers from the research and tags of this nation. Tags must be added and removed using add_tag() and remove_tag() for this to stay up to date.
+        """
+        if self._modifiers is None:
+            self._modifiers = NationModifiers(self)
+        return self._modifiers
+
+    def add_tag(self, tag_name: str, tag_data: dict) -> None:
+        self.tags[tag_name] = tag_data
+        self._modifiers = None
+
+    def remove_tag(self, tag_name: str) -> None:
+        del self.tags[tag_name]
+        self._modifiers = None
 
     @property
     def action_log(self) -> list:
@@ -168,12 +195,12 @@ class Nation:
         self._data["actionLog"] = value
 
     @property
-    def income_details(self) -> list:
-        return self._data["incomeDetails"]
+    def income_details(self) -> IncomeBreakdown:
+        return IncomeBreakdown(self._data["incomeDetails"])
 
     @income_details.setter
-    def income_details(self, value: list) -> None:
-        self._data["incomeDetails"] = value
+    def income_details(self, value: IncomeBreakdown) -> None:
+        self._data["incomeDetails"] = value.data
 
     @property
     def _sets(self) -> dict:
@@ -211,14 +238,14 @@ class Nation:
                     "Alliance Limit Modifier": 1,
                     "Expire Turn": 99999
                 }
-                self.tags["Republic"] = new_tag
+                self.add_tag("Republic", new_tag)
 
             case "Technocracy":
                 new_tag = {
                     "Research Rate": 20,
                     "Expire Turn": 99999
                 }
-                self.tags["Technocracy"] = new_tag
+                self.add_tag("Technocracy", new_tag)
 
             case "Oligarchy":
                 new_tag = {
@@ -228,7 +255,7 @@ class Nation:
                     "Energy Rate": 20,
                     "Expire Turn": 99999
                 }
-                self.tags["Oligarchy"] = new_tag
+                self.add_tag("Oligarchy", new_tag)
 
             case "Totalitarian":
                 new_tag = {
@@ -240,7 +267,7 @@ class Nation:
                     },
                     "Expire Turn": 99999
                 }
-                self.tags["Totalitarian"] = new_tag
+                self.add_tag("Totalitarian", new_tag)
 
             case "Remnant":
                 new_tag = {
@@ -249,7 +276,7 @@ class Nation:
                     "Agenda Cost": 5,
                     "Expire Turn": 99999
                 }
-                self.tags["Remnant"] = new_tag
+                self.add_tag("Remnant", new_tag)
 
             case "Protectorate":
                 new_tag = {
@@ -265,7 +292,7 @@ class Nation:
                     },
                     "Expire Turn": 99999
                 }
-                self.tags["Protectorate"] = new_tag
+                self.add_tag("Protectorate", new_tag)
 
             case "Military Junta":
                 new_tag = {
@@ -280,14 +307,14 @@ class Nation:
                     },
                     "Expire Turn": 99999
                 }
-                self.tags["Military Junta"] = new_tag
+                self.add_tag("Military Junta", new_tag)
 
             case "Crime Syndicate":
                 new_tag = {
                     "Region Claim Cost": 0.2,
                     "Expire Turn": 99999
                 }
-                self.tags["Crime Syndicate"] = new_tag
+                self.add_tag("Crime Syndicate", new_tag)
 
     def update_victory_progress(self) -> None:
         
@@ -349,28 +376,17 @@ class Nation:
             raise Exception(f"{technology_name} not recognized as an agenda/technology.")
 
         self.completed_research[technology_name] = True
+        self._modifiers = None
 
     def update_trade_fee(self) -> None:
         
         trade_fee_list = ["3:1", "2:1", "1:1", "1:2", "1:3", "1:4", "1:5"]
-        trade_index = 3
-
-        if "Improved Logistics" in self.completed_research:
-            trade_index += 1
-
-        for tag_data in self.tags.values():
-            trade_index += tag_data.get("Trade Fee Modifier", 0)
-
-        self.trade_fee = trade_fee_list[trade_index]
+        self.trade_fee = trade_fee_list[self.modifiers.trade_fee_index]
 
     def award_research_bonus(self, research_name: str) -> None:
 
-        for tag_data in self.tags.values():
+        for bonus_dict in self.modifiers.research_bonuses:
             
-            if "Research Bonus" not in tag_data:
-                continue
-            
-            bonus_dict = tag_data["Research Bonus"]
             sd_technology = SD.technologies[research_name]
 
             if sd_technology.type in bonus_dict["Categories"]:
@@ -381,9 +397,7 @@ class Nation:
 
     def apply_build_discount(self, build_cost_dict: dict) -> None:
         
-        build_cost_rate = 1.0
-        for tag_data in self.tags.values():
-            build_cost_rate -= float(tag_data.get("Build Discount", 0))
+        build_cost_rate = self.modifiers.build_cost_rate
 
         for key in build_cost_dict:
             build_cost_dict[key] *= build_cost_rate
@@ -423,8 +437,7 @@ class Nation:
         adjustment += agenda_cost_adjustment[sd_agenda.type][self.fp]
 
         # cost adjustment from tags
-        for tag_data in self.tags.values():
-            adjustment += int(tag_data.get("Agenda Cost", 0))
+        adjustment += self.modifiers.agenda_cost
         
         return adjustment
 
@@ -433,23 +446,11 @@ class Nation:
         from app.alliance.alliances import Alliances
 
         capacity_used = 0
-        for alliance in Alliances:
-            if (alliance.is_active
-                and self.name in alliance.current_members
-                and SD.alliances[alliance.type].capacity
-                ):
+        for alliance in Alliances.memberships(self.name):
+            if SD.alliances[alliance.type].capacity:
                 capacity_used += 1
         
-        capacity_limit = 2
-        for name in self.completed_research:
-            if name in SD.agendas:
-                agenda_data = SD.agendas[name]
-                capacity_limit += agenda_data.modifiers.get("Alliance Limit Modifier", 0)
-            elif name in SD.technologies:
-                technology_data = SD.technologies[name]
-                capacity_limit += technology_data.modifiers.get("Alliance Limit Modifier", 0)
-        for tag_data in self.tags.values():
-            capacity_limit += tag_data.get("Alliance Limit Modifier", 0)
+        capacity_limit = self.modifiers.alliance_limit
 
         return capacity_used, capacity_limit
 
@@ -491,7 +492,7 @@ class Nation:
             for string in self.action_log:
                 file.write(string + '\n')
 
-    def get_stockpile(self, resource_name: str) -> str:
+    def get_stockpile(self, resource_name: str) -> float:
         if resource_name not in self._resources:
             raise Exception(f"Resource {resource_name} not recognized.")
         return self._resources[resource_name]["stored"]
@@ -505,19 +506,18 @@ class Nation:
             raise TypeError(f"Invalid amount provided. Expected a float or integer.")
         
         if overwrite:
-            self._resources[resource_name]["stored"] = f"{amount:.2f}"
+            self._resources[resource_name]["stored"] = round(amount, 2)
             return
         
-        stored = float(self._resources[resource_name]["stored"])
-        stored += amount
+        stored = self._resources[resource_name]["stored"] + amount
         
-        stored_max = int(self.get_max(resource_name))
+        stored_max = self.get_max(resource_name)
         if stored > stored_max:
             stored = stored_max
 
-        self._resources[resource_name]["stored"] = f"{stored:.2f}"
+        self._resources[resource_name]["stored"] = round(stored, 2)
 
-    def get_income(self, resource_name: str) -> str:
+    def get_income(self, resource_name: str) -> float:
         
         if resource_name not in self._resources:
             raise Exception(f"Resource {resource_name} not recognized.")
@@ -539,14 +539,13 @@ class Nation:
             return
         
         if overwrite:
-            self._resources[resource_name]["income"] = f"{amount:.2f}"
+            self._resources[resource_name]["income"] = round(amount, 2)
             return
 
-        income = float(self._resources[resource_name]["income"])
-        income += amount
-        self._resources[resource_name]["income"] = f"{income:.2f}"
+        income = self._resources[resource_name]["income"] + amount
+        self._resources[resource_name]["income"] = round(income, 2)
 
-    def get_gross_income(self, resource_name: str) -> str:
+    def get_gross_income(self, resource_name: str) -> float:
         
         if resource_name not in self._resources:
             raise Exception(f"Resource {resource_name} not recognized.")
@@ -569,12 +568,11 @@ class Nation:
             return
 
         if overwrite:
-            self._resources[resource_name]["grossIncome"] = f"{amount:.2f}"
+            self._resources[resource_name]["grossIncome"] = round(amount, 2)
             return
         
-        income = float(self._resources[resource_name]["grossIncome"])
-        income += amount
-        self._resources[resource_name]["grossIncome"] = f"{income:.2f}"
+        income = self._resources[resource_name]["grossIncome"] + amount
+        self._resources[resource_name]["grossIncome"] = round(income, 2)
 
     def get_max(self, resource_name: str) -> int:
         if resource_name not in self._resources:
@@ -590,12 +588,10 @@ class Nation:
             raise TypeError(f"Invalid amount provided. Expected an integer.")
         
         if overwrite:
-            self._resources[resource_name]["max"] = f"{amount}"
+            self._resources[resource_name]["max"] = amount
             return
         
-        max = int(self._resources[resource_name]["max"])
-        max += amount
-        self._resources[resource_name]["max"] = f"{max}"
+        self._resources[resource_name]["max"] += amount
 
     def update_stockpile_limits(self) -> None:
         
@@ -619,9 +615,7 @@ class Nation:
         if resource_name not in self._resources:
             raise Exception(f"Resource {resource_name} not recognized.")
         
-        rate = self._resources[resource_name]["rate"]
-        for tag_data in self.tags.values():
-            rate += tag_data.get(f"{resource_name} Rate", 0)
+        rate = self._resources[resource_name]["rate"] + self.modifiers.rates[resource_name]
 
         return rate
 
@@ -639,13 +633,13 @@ class Nation:
             self._resources[resource_name]["rate"] += amount
 
     def get_used_mc(self) -> float:
-        return float(self._resources["Military Capacity"]["used"])
+        return self._resources["Military Capacity"]["used"]
 
     def update_military_capacity(self) -> None:
         used_military_capacity = 0
         for count in self.unit_counts.values():
             used_military_capacity += count
-        self._resources["Military Capacity"]["used"] = f"{used_military_capacity:.2f}"
+        self._resources["Military Capacity"]["used"] = float(used_military_capacity)
 
     def get_max_mc(self) -> float:
         
@@ -653,7 +647,7 @@ class Nation:
         if self.name == "Foreign Adversary":
             return 99999
 
-        return float(self._resources["Military Capacity"]["max"])
+        return self._resources["Military Capacity"]["max"]
 
     def update_max_mc(self, amount: int | float, *, overwrite = False) -> None:
         
@@ -661,12 +655,11 @@ class Nation:
             raise TypeError(f"Invalid amount provided. Expected a float or integer.")
         
         if overwrite:
-            self._resources["Military Capacity"]["max"] = f"{amount:.2f}"
+            self._resources["Military Capacity"]["max"] = round(amount, 2)
             return
         
-        income = float(self._resources["Military Capacity"]["max"])
-        income += amount
-        self._resources["Military Capacity"]["max"] = f"{income:.2f}"
+        income = self._resources["Military Capacity"]["max"] + amount
+        self._resources["Military Capacity"]["max"] = round(income, 2)
 
     def get_vc_list(self) -> list:
         """
@@ -682,14 +675,6 @@ class Nation:
             results.append(key)
         return results
 
-    def _find_pp_index(self) -> int:
-        """
-        Returns in index of where the political power log starts.
-        """
-        for i, str in enumerate(self.income_details):
-            if "Political Power" in str:
-                return i
-            
     def generate_full_unit_name(self, unit_name: str) -> str:
         """
         Creates the full name for a unit using its name and number.
@@ -726,10 +711,7 @@ class Nation:
         Returns:
             int: Starting XP value.
         """
-        amount = 0
-        for tag_data in self.tags.values():
-            amount += int(tag_data.get("Starting XP Bonus", 0))
-        return amount
+        return self.modifiers.starting_xp
 
 class NationStatistics:
 
@@ -886,4 +868,17 @@ class NationRecords:
             if callable(value):
                 continue
 
-            yield attribute_name, value
\ No newline at end of file
+            yield attribute_name, value
+
+def _convert_resource_strings(resources: dict) -> None:
+    """
+    Games saved before resources were stored as numbers hold them as formatted strings such as "5.00". Converts them in place.
+    """
+    for resource_name, resource_data in resources.items():
+        for key, value in resource_data.items():
+            if not isinstance(value, str):
+                continue
+            if key == "max" and resource_name != "Military Capacity":
+                resource_data[key] = int(float(value))
+            else:
+                resource_data[key] = float(value)
\ No newline at end of file
@@ -0,0 +1,117 @@
+from app.scenario.scenario import ScenarioInterface as SD
+
+UPKEEP_RESOURCES = ["Dollars", "Food", "Energy", "Coal", "Oil", "Uranium"]  # tba - pull list from scenario files
+
+class NationModifiers:
+    """
+    Lookup tables of every modifier a nation gets from its completed research and tags.
+
+    Built the first time Nation.modifiers is used and kept until research is added or the tags of the nation change
+    (see Nation.add_tech(), Nation.add_tag(), and Nation.remove_tag()). Values that used to be summed by walking the
+    research and tags of the nation are summed here in the same order, so results are identical.
+    """
+
+    def __init__(self, nation):
+        """
+        Params:
+            nation (Nation): Nation to compile the modifiers of.
+        """
+
+        research_modifiers = []
+        for name in nation.completed_research:
+            if name in SD.agendas:
+                research_modifiers.append(SD.agendas[name].modifiers)
+            elif name in SD.technologies:
+                research_modifiers.append(SD.technologies[name].modifiers)
+
+        tags = list(nation.tags.items())
+
+        # improvement yields from research: improvement -> resource -> income and multiplier
+        self.improvement_yields: dict[str, dict[str, dict]] = {}
+        for improvement_name, improvement_data in SD.improvements:
+            self.improvement_yields[improvement_name] = {resource_name: {"Income": 0, "Income Multiplier": 1} for resource_name in nation._resources}
+            for resource_name, amount in improvement_data.income.items():
+                self.improvement_yields[improvement_name][resource_name]["Income"] = amount
+
+        # upkeep from research: improvement or unit -> resource -> upkeep and multiplier
+        self.upkeep: dict[str, dict[str, dict]] = {}
+        for target_name, target_data in list(SD.improvements) + list(SD.units):
+            self.upkeep[target_name] = {resource_name: {"Upkeep": 0, "Upkeep Multiplier": 1} for resource_name in UPKEEP_RESOURCES}
+            for resource_name, amount in target_data.upkeep.items():
+                self.upkeep[target_name][resource_name]["Upkeep"] = amount
+
+        self.alliance_limit: int = 2
+        self.alliance_political_power_bonus: float = 0
+
+        for modifiers in research_modifiers:
+            for target, target_modifiers in modifiers.items():
+                if target in self.improvement_yields:
+                    for resource_name, modifier_dict in target_modifiers.items():
+                        if "Income" in modifier_dict:
+                            self.improvement_yields[target][resource_name]["Income"] += modifier_dict["Income"]
+                        elif "Income Multiplier" in modifier_dict:
+                            self.improvement_yields[target][resource_name]["Income Multiplier"] += modifier_dict["Income Multiplier"]
+                if target in self.upkeep:
+                    for resource_name, modifier_dict in target_modifiers.items():
+                        if "Upkeep" in modifier_dict:
+                            self.upkeep[target][resource_name]["Upkeep"] += modifier_dict["Upkeep"]
+                        elif "Upkeep Multiplier" in modifier_dict:
+                            self.upkeep[target][resource_name]["Upkeep Multiplier"] += modifier_dict["Upkeep Multiplier"]
+            self.alliance_limit += modifiers.get("Alliance Limit Modifier", 0)
+            self.alliance_political_power_bonus += modifiers.get("Alliance Political Power Bonus", 0)
+
+        # improvement yields from tags: improvement -> resource -> modifiers in tag order
+        self.tag_improvement_income: dict[str, dict[str, tuple]] = _collect_improvement_modifiers(tags, "Improvement Income")
+        self.tag_improvement_multipliers: dict[str, dict[str, tuple]] = _collect_improvement_modifiers(tags, "Improvement Income Multiplier")
+        self.capital_boost: bool = any("Capital Boost" in tag_data for tag_name, tag_data in tags)
+
+        # flat income from tags: resource -> (tag name, amount)
+        self.tag_income: dict[str, tuple] = {}
+        for resource_name in nation._resources:
+            self.tag_income[resource_name] = tuple(
+                (tag_name, float(tag_data[f"{resource_name} Income"]))
+                for tag_name, tag_data in tags
+                if float(tag_data.get(f"{resource_name} Income", 0)) != 0
+            )
+
+        self.rates: dict[str, int] = {resource_name: 0 for resource_name in nation._resources}
+        self.claim_cost_multiplier: float = 1.0
+        self.market_buy_rate: float = 1.0
+        self.market_sell_rate: float = 1.0
+        self.build_cost_rate: float = 1.0
+        self.agenda_cost: int = 0
+        self.starting_xp: int = 0
+        self.trade_fee_index: int = 3
+        self.combat_roll_bonus: dict[str, int] = {}
+        self.research_bonuses: tuple[dict] = tuple(tag_data["Research Bonus"] for tag_name, tag_data in tags if "Research Bonus" in tag_data)
+
+        if "Improved Logistics" in nation.completed_research:
+            self.trade_fee_index += 1
+
+        for tag_name, tag_data in tags:
+            for resource_name in self.rates:
+                self.rates[resource_name] += tag_data.get(f"{resource_name} Rate", 0)
+            self.claim_cost_multiplier += float(tag_data.get("Region Claim Cost", 0))
+            self.market_buy_rate -= float(tag_data.get("Market Buy Modifier", 0))
+            self.market_sell_rate += float(tag_data.get("Market Sell Modifier", 0))
+            self.build_cost_rate -= float(tag_data.get("Build Discount", 0))
+            self.agenda_cost += int(tag_data.get("Agenda Cost", 0))
+            self.starting_xp += int(tag_data.get("Starting XP Bonus", 0))
+            self.trade_fee_index += tag_data.get("Trade Fee Modifier", 0)
+            self.alliance_limit += tag_data.get("Alliance Limit Modifier", 0)
+            self.alliance_political_power_bonus += tag_data.get("Alliance Political Power Bonus", 0)
+            if "Combat Roll Bonus" in tag_data:
+                target_id = tag_data["Combat Roll Bonus"]
+                self.combat_roll_bonus[target_id] = self.combat_roll_bonus.get(target_id, 0) + 1
+
+        if "Improved Logistics" in nation.completed_research:
+            self.market_buy_rate -= 0.2
+
+def _collect_improvement_modifiers(tags: list[tuple[str, dict]], key: str) -> dict[str, dict[str, tuple]]:
+    collected = {}
+    for tag_name, tag_data in tags:
+        for improvement_name, resource_data in tag_data.get(key, {}).items():
+            for resource_name, modifier in resource_data.items():
+                improvement_modifiers = collected.setdefault(improvement_name, {})
+                improvement_modifiers[resource_name] = improvement_modifiers.get(resource_name, ()) + (modifier,)
+    return collected
\ No newline at end of file
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import ClassVar, Iterator, Tuple
 from enum import StrEnum
 
+from app import storage
 from app.game.games import Games
 from app.scenario.scenario import ScenarioInterface as SD
 from .nation import Nation
@@ -12,24 +13,19 @@ from .nation import Nation
 class NationsMeta(type):
 
     def __iter__(cls) -> Iterator["Nation"]:
-        for nation_id in cls._data:
-            nation = Nation(nation_id, cls._data[nation_id], cls.game_id)
-            if nation.is_active:
-                yield nation
+        yield from cls._get_active()
 
     def __len__(cls):
-        length = 0
-        for nation_id in cls._data:
-            nation = Nation(nation_id, cls._data[nation_id], cls.game_id)
-            if nation.is_active:
-                length += 1
-        return length
+        return len(cls._get_active())
 
 @dataclass
 class Nations(metaclass=NationsMeta):
 
     game_id: ClassVar[str] = None
     _data: ClassVar[dict[str, dict]] = None
+    _instances: ClassVar[dict[str, Nation]] = {}
+    _active: ClassVar[list[Nation]] = None
+    _names: ClassVar[dict[str, Nation]] = None
 
     @classmethod
     def _gamedata_path(cls) -> str:
@@ -47,7 +43,40 @@ class Nations(metaclass=NationsMeta):
         with open(gamedata_path, 'r') as f:
             gamedata_dict = json.load(f)
 
-        cls._data = gamedata_dict["nations"]
+        cls.attach(game_id, gamedata_dict["nations"])
+
+    @classmethod
+    def attach(cls, game_id: str, data: dict) -> None:
+        """
+        Binds this class to nations data that has already been read from gamedata.json.
+        """
+        cls.game_id = game_id
+        cls._data = data
+        cls._instances = {nation_id: Nation(nation_id, nation_data, game_id) for nation_id, nation_data in data.items()}
+        cls.reset_indexes()
+
+    @classmethod
+    def reset_indexes(cls) -> None:
+        """
+        Marks the active nation list and the name index as out of date so they are rebuilt on next use.
+        Must be called whenever a nation is created, renamed, or changes status.
+        """
+        cls._active = None
+        cls._names = None
+
+    @classmethod
+    def _get_active(cls) -> list[Nation]:
+        if cls._active is None:
+            cls._active = [nation for nation in cls._instances.values() if nation.is_active]
+        return cls._active
+
+    @classmethod
+    def _get_names(cls) -> dict[str, Nation]:
+        if cls._names is None:
+            cls._names = {}
+            for nation in cls._get_active():
+                cls._names.setdefault(nation.name.lower(), nation)
+        return cls._names
 
     @classmethod
     def save(cls) -> None:
@@ -56,12 +85,10 @@ class Nations(metaclass=NationsMeta):
             raise RuntimeError("Error: Nations has not been loaded.")
 
         gamedata_filepath = f"gamedata/{cls.game_id}/gamedata.json"
-        with open(gamedata_filepath, 'r') as json_file:
-            gamedata_dict = json.load(json_file)
-
+        gamedata_dict = storage.load_json(gamedata_filepath)
         gamedata_dict["nations"] = cls._data
-        with open(gamedata_filepath, 'w') as json_file:
-            json.dump(gamedata_dict, json_file, indent=4)
+        storage.save_json(gamedata_filepath, gamedata_dict)
+        storage.bump_state_version(cls.game_id)
 
     @classmethod
     def create(cls, nation_id: str, player_id: int) -> None:
@@ -83,90 +110,90 @@ class Nations(metaclass=NationsMeta):
             "satisfiedVictorySet": {},
             "resources": {
                 "Dollars": {
-                    "stored": "5.00",
-                    "income": "0.00",
-                    "grossIncome": "0.00",
+                    "stored": 5.0,
+                    "income": 0.0,
+                    "grossIncome": 0.0,
                     "max": 100,
                     "rate": 100
                 },
                 "Political Power": {
-                    "stored": "1.00",
-                    "income": "0.00",
-                    "grossIncome": "0.00",
+                    "stored": 1.0,
+                    "income": 0.0,
+                    "grossIncome": 0.0,
                     "max": 50,
                     "rate": 100
                 },
                 "Research": {
-                    "stored": "0.00",
-                    "income": "0.00",
-                    "grossIncome": "0.00",
+                    "stored": 0.0,
+                    "income": 0.0,
+                    "grossIncome": 0.0,
                     "max": 50,
                     "rate": 100
                 },
                 "Food": {
-                    "stored": "0.00",
-                    "income": "0.00",
-                    "grossIncome": "0.00",
+                    "stored": 0.0,
+                    "income": 0.0,
+                    "grossIncome": 0.0,
                     "max": 50,
                     "rate": 100
                 },
                 "Coal": {
-                    "stored": "0.00",
-                    "income": "0.00",
-                    "grossIncome": "0.00",
+                    "stored": 0.0,
+                    "income": 0.0,
+                    "grossIncome": 0.0,
                     "max": 50,
                     "rate": 100
                 },
                 "Oil": {
-                    "stored": "0.00",
-                    "income": "0.00",
-                    "grossIncome": "0.00",
+                    "stored": 0.0,
+                    "income": 0.0,
+                    "grossIncome": 0.0,
                     "max": 50,
                     "rate": 100
                 },
                 "Basic Materials": {
-                    "stored": "0.00",
-                    "income": "0.00",
-                    "grossIncome": "0.00",
+                    "stored": 0.0,
+                    "income": 0.0,
+                    "grossIncome": 0.0,
                     "max": 50,
                     "rate": 100
                 },
                 "Common Metals": {
-                    "stored": "0.00",
-                    "income": "0.00",
-                    "grossIncome": "0.00",
+                    "stored": 0.0,
+                    "income": 0.0,
+                    "grossIncome": 0.0,
                     "max": 50,
                     "rate": 100
                 },
                 "Advanced Metals": {
-                    "stored": "0.00",
-                    "income": "0.00",
-                    "grossIncome": "0.00",
+                    "stored": 0.0,
+                    "income": 0.0,
+                    "grossIncome": 0.0,
                     "max": 50,
                     "rate": 100
                 },
                 "Uranium": {
-                    "stored": "0.00",
-                    "income": "0.00",
-                    "grossIncome": "0.00",
+                    "stored": 0.0,
+                    "income": 0.0,
+                    "grossIncome": 0.0,
                     "max": 50,
                     "rate": 100
                 },
                 "Rare Earth Elements": {
-                    "stored": "0.00",
-                    "income": "0.00",
-                    "grossIncome": "0.00",
+                    "stored": 0.0,
+                    "income": 0.0,
+                    "grossIncome": 0.0,
                     "max": 50,
                     "rate": 100
                 },
                 "Energy": {
-                    "income": "0.00",
-                    "grossIncome": "0.00",
+                    "income": 0.0,
+                    "grossIncome": 0.0,
                     "rate": 100
                 },
                 "Military Capacity": {
-                    "used": "0.00",
-                    "max": "0.00",
+                    "used": 0.0,
+                    "max": 0.0,
                     "rate": 100
                 },
             },
@@ -194,24 +221,26 @@ class Nations(metaclass=NationsMeta):
             "unitCounts": {unit_name: 0 for unit_name, unit_data in SD.units},
             "unitCountsLifetime": {unit_name: 0 for unit_name, unit_data in SD.units},
             "unlockedResearch": {},
-            "incomeDetails": [],
+            "incomeDetails": {"totals": {}, "records": []},
             "tags": {},
             "actionLog": []
         }
         
         cls._data[nation_id] = nation_data
+        cls._instances[nation_id] = Nation(nation_id, nation_data, cls.game_id)
+        cls.reset_indexes()
 
     @classmethod
     def get(cls, string: str) -> "Nation":
         
         # check if nation id was provided
-        if string in cls._data:
-            return Nation(string, cls._data[string], cls.game_id)
+        if string in cls._instances:
+            return cls._instances[string]
         
         # check if nation name was provided
-        for nation in cls:
-            if nation.name.lower() == string.lower():
-                return Nation(nation.id, cls._data[nation.id], cls.game_id)
+        nation = cls._get_names().get(string.lower())
+        if nation is not None:
+            return nation
 
         raise Exception(f"Failed to retrieve nation with identifier {string}.")
     
@@ -241,7 +270,7 @@ class Nations(metaclass=NationsMeta):
             for resource_name in nation._resources:
                 if resource_name == "Military Capacity":
                     continue
-                income = float(nation.get_income(resource_name))
+                income = nation.get_income(resource_name)
                 net_income_total += income
             nation.records.net_income.append(f"{net_income_total:.2f}")
 
@@ -250,7 +279,7 @@ class Nations(metaclass=NationsMeta):
             for resource_name in nation._resources:
                 if resource_name == "Military Capacity":
                     continue
-                income = float(nation.get_gross_income(resource_name))
+                income = nation.get_gross_income(resource_name)
                 if resource_name in ["Basic Materials", "Common Metals", "Advanced Metals"]:
                     industrial_income_total += income
                 if resource_name in ["Energy", "Coal", "Oil"]:
@@ -386,18 +415,11 @@ class Nations(metaclass=NationsMeta):
                     if update:
                         nation.update_stockpile("Political Power", bonus[i])
 
-                    # add income string to income details
-                    pp_index = nation._find_pp_index()
-                    p1 = nation.income_details[:pp_index + 1]
-                    p2 = nation.income_details[pp_index + 1:]
-                    p1.append(f"+{bonus[i]:.2f} {string}")
-                    nation.income_details = p1 + p2
-
-                    # update main political power string
-                    main_pp_string = nation.income_details[pp_index]
-                    value = float(main_pp_string[11:-15])
-                    value += bonus[i]
-                    nation.income_details[pp_index] = f"<section> +{value:.2f} Political Power"
+                    # add bonus to income details
+                    income_details = nation.income_details
+                    income_details.add("ranking", string, "Political Power", bonus[i], first=True)
+                    income_details.add_total("Political Power", bonus[i])
+                    nation.income_details = income_details
 
     @classmethod
     def attribute_to_title(cls, attribute_name: str) -> str:
@@ -3,6 +3,8 @@ import os
 from dataclasses import dataclass
 from typing import ClassVar, Iterator
 
+from app import storage
+
 class NotificationsMeta(type):
 
     def __iter__(cls) -> Iterator[tuple[int, str]]:
@@ -36,7 +38,15 @@ class Notifications(metaclass=NotificationsMeta):
         with open(gamedata_path, 'r') as f:
             gamedata_dict = json.load(f)
 
-        cls._data = gamedata_dict["notifications"]
+        cls.attach(game_id, gamedata_dict["notifications"])
+
+    @classmethod
+    def attach(cls, game_id: str, data: list) -> None:
+        """
+        Binds this class to notifications data that has already been read from gamedata.json.
+        """
+        cls.game_id = game_id
+        cls._data = data
     
     @classmethod
     def save(cls) -> None:
@@ -45,12 +55,10 @@ class Notifications(metaclass=NotificationsMeta):
             raise RuntimeError("Error: Notifications has not been loaded.")
         
         gamedata_filepath = f'gamedata/{cls.game_id}/gamedata.json'
-        with open(gamedata_filepath, 'r') as json_file:
-            gamedata_dict = json.load(json_file)
-
+        gamedata_dict = storage.load_json(gamedata_filepath)
         gamedata_dict["notifications"] = cls._data
-        with open(gamedata_filepath, 'w') as json_file:
-            json.dump(gamedata_dict, json_file, indent=4)
+        storage.save_json(gamedata_filepath, gamedata_dict)
+        storage.bump_state_version(cls.game_id)
     
     @classmethod
     def add(cls, string: str, priority: int) -> None:
@@ -0,0 +1,93 @@
+import hashlib
+import os
+import threading
+from functools import wraps
+from typing import ClassVar
+
+from flask import make_response, request
+
+from app import storage
+
+def _code_version() -> str:
+    """
+    Returns a hash of the python files and templates of the site.
+    """
+    app_path = os.path.dirname(os.path.abspath(__file__))
+    code_hash = hashlib.sha1()
+    for directory, subdirectories, filenames in sorted(os.walk(app_path)):
+        for filename in sorted(filenames):
+            if filename.endswith((".py", ".html")):
+                filepath = os.path.join(directory, filename)
+                code_hash.update(os.path.relpath(filepath, app_path).encode())
+                with open(filepath, 'rb') as code_file:
+                    code_hash.update(code_file.read())
+    return code_hash.hexdigest()
+
+class PageCache:
+    """
+    Memoizes game pages until the state of their game is saved again (see storage.bump_state_version).
+
+    Pages are keyed by route, game, state version, and url arguments. The same key is sent as the page ETag so browsers
+    that already have the current page get an empty 304 response, whichever worker process answers and across restarts.
+    The key also includes a hash of the site code and templates so pages built by older code are never reused after an update.
+    """
+
+    MAX_PAGES: ClassVar[int] = 256
+    CODE_VERSION: ClassVar[str] = _code_version()
+
+    _pages: ClassVar[dict[str, str]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def key(cls, route_name: str, game_id: str, version: int, route_args: dict) -> str:
+        args_str = ",".join(f"{name}={value}" for name, value in sorted(route_args.items()))
+        key_str = f"{cls.CODE_VERSION}|{route_name}|{game_id}|{version}|{args_str}"
+        return hashlib.sha1(key_str.encode()).hexdigest()
+
+    @classmethod
+    def get(cls, key: str) -> str | None:
+        with cls._lock:
+            page = cls._pages.pop(key, None)
+            if page is not None:
+                cls._pages[key] = page
+            return page
+
+    @classmethod
+    def put(cls, key: str, page: str) -> None:
+        with cls._lock:
+            cls._pages[key] = page
+            while len(cls._pages) > cls.MAX_PAGES:
+                del cls._pages[next(iter(cls._pages))]
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._pages.clear()
+
+def cached_game_page(view):
+    """
+    Route decorator for pages that are built only from the state of a single game. The route must take full_game_id.
+    """
+
+    @wraps(view)
+    def wrapper(full_game_id: str, **route_args):
+
+        key = PageCache.key(view.__name__, full_game_id, storage.state_version(full_game_id), route_args)
+        if key in request.if_none_match:
+            response = make_response("", 304)
+            response.set_etag(key)
+            return response
+
+        page = PageCache.get(key)
+        if page is None:
+            page = view(full_game_id, **route_args)
+            if not isinstance(page, str):
+                return page    # redirects and errors are not cached
+            PageCache.put(key, page)
+
+        response = make_response(page)
+        response.set_etag(key)
+        response.cache_control.no_cache = True    # always check the ETag, the page changes whenever a turn is resolved
+        return response
+
+    return wrapper
\ No newline at end of file
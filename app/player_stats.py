@@ -0,0 +1,157 @@
+import os
+from datetime import datetime
+from operator import itemgetter
+from typing import ClassVar
+
+from app import storage
+from app.game.game_archive import GameArchive
+
+class PlayerStats:
+    """
+    Running totals for every player across all archived games, used by the leaderboard and profile pages.
+
+    Totals are saved to playerdata/player_stats.json and updated one game at a time by add_game() when a game is archived.
+    rebuild() recalculates everything from the game archive, e.g. after archived games were edited by hand.
+
+    Wins, total score, and games played count towards the leaderboard and skip games named "Test Game".
+    Draws, losses, favorite government and foreign policy, and first and last game count every archived game.
+    """
+
+    STATS_FILEPATH: ClassVar[str] = "playerdata/player_stats.json"
+    DATE_FORMAT: ClassVar[str] = "%m/%d/%Y"
+
+    _cache: ClassVar[tuple[int, dict, dict]] = None
+
+    @classmethod
+    def _new_player(cls) -> dict:
+        return {
+            "wins": 0,
+            "score": 0,
+            "games": 0,
+            "draws": 0,
+            "losses": 0,
+            "governments": {},
+            "foreignPolicies": {},
+            "firstGame": None,
+            "lastGame": None
+        }
+
+    @classmethod
+    def _load_data(cls) -> tuple[dict, dict]:
+        """
+        Returns the saved totals along with the rank of every player on the leaderboard.
+        Both are kept in memory until the file changes. If there is no saved file it is built from the archive.
+        """
+
+        if not os.path.exists(cls.STATS_FILEPATH):
+            cls.rebuild()
+
+        modified_time = os.stat(cls.STATS_FILEPATH).st_mtime_ns
+        if cls._cache is None or cls._cache[0] != modified_time:
+            data = storage.load_json(cls.STATS_FILEPATH)
+            ranks = {profile_id: i + 1 for i, profile_id in enumerate(cls._ranked_profile_ids(data))}
+            cls._cache = (modified_time, data, ranks)
+
+        return cls._cache[1], cls._cache[2]
+
+    @classmethod
+    def _ranked_profile_ids(cls, data: dict) -> list[str]:
+        rows = []
+        for profile_id, stats in data["players"].items():
+            if stats["games"] == 0:
+                continue
+            rows.append((profile_id, stats["wins"], stats["score"], round(stats["score"] / stats["games"], 2), stats["games"]))
+        rows.sort(key=itemgetter(1, 2, 3, 4), reverse=True)
+        return [row[0] for row in rows]
+
+    @classmethod
+    def _add_game(cls, data: dict, game_id: str, game_record: dict) -> None:
+
+        if game_id in data["archivedGames"]:
+            return
+        data["archivedGames"].append(game_id)
+
+        player_data: dict = game_record["Player Data"]
+        counts_for_leaderboard = game_record["Name"] != "Test Game"
+        is_draw = not any(player_info["Victory"] for player_info in player_data.values())
+        game_started = datetime.strptime(game_record["Statistics"]["Game Started"], cls.DATE_FORMAT)
+        game_ended = datetime.strptime(game_record["Statistics"]["Game Ended"], cls.DATE_FORMAT)
+
+        for profile_id, player_info in player_data.items():
+
+            stats = data["players"].setdefault(profile_id, cls._new_player())
+
+            if counts_for_leaderboard:
+                stats["wins"] += player_info.get("Victory", 0)
+                stats["score"] += player_info.get("Score", 0)
+                stats["games"] += 1
+
+            if is_draw:
+                stats["draws"] += 1
+            elif not player_info["Victory"]:
+                stats["losses"] += 1
+
+            governments: dict = stats["governments"]
+            governments[player_info["Government"]] = governments.get(player_info["Government"], 0) + 1
+            foreign_policies: dict = stats["foreignPolicies"]
+            foreign_policies[player_info["Foreign Policy"]] = foreign_policies.get(player_info["Foreign Policy"], 0) + 1
+
+            if stats["firstGame"] is None or game_started < datetime.strptime(stats["firstGame"], cls.DATE_FORMAT):
+                stats["firstGame"] = game_started.strftime(cls.DATE_FORMAT)
+            if stats["lastGame"] is None or game_ended > datetime.strptime(stats["lastGame"], cls.DATE_FORMAT):
+                stats["lastGame"] = game_ended.strftime(cls.DATE_FORMAT)
+
+    @classmethod
+    def add_game(cls, game_id: str, game_record: dict) -> None:
+        """
+        Adds a newly archived game to the totals. Games that have already been counted are ignored.
+
+        Params:
+            game_id (str): Game ID string.
+            game_record (dict): Archive entry of the game, as saved by GameArchive.
+        """
+        data, ranks = cls._load_data()
+        cls._add_game(data, game_id, game_record)
+        storage.save_json(cls.STATS_FILEPATH, data)
+        cls._cache = None
+
+    @classmethod
+    def rebuild(cls) -> None:
+        """
+        Recalculates the totals of every player from the game archive.
+        """
+
+        data = {"archivedGames": [], "players": {}}
+        for game_id, game_record in GameArchive.items():
+            cls._add_game(data, game_id, game_record)
+
+        storage.save_json(cls.STATS_FILEPATH, data)
+        cls._cache = None
+
+    @classmethod
+    def get(cls, profile_id: str) -> dict:
+        """
+        Returns the totals of a player. Players who have never finished a game get empty totals.
+        """
+        data, ranks = cls._load_data()
+        return data["players"].get(profile_id, cls._new_player())
+
+    @classmethod
+    def rank(cls, profile_id: str) -> int:
+        """
+        Returns the leaderboard position of a player, or 0 if they are not on the leaderboard.
+        """
+        data, ranks = cls._load_data()
+        return ranks.get(profile_id, 0)
+
+    @classmethod
+    def leaderboard(cls) -> list[list]:
+        """
+        Returns one row per ranked player: profile id, wins, total score, average score, and games played.
+        """
+        data, ranks = cls._load_data()
+        rows = []
+        for profile_id in sorted(ranks, key=ranks.get):
+            stats = data["players"][profile_id]
+            rows.append([profile_id, stats["wins"], stats["score"], round(stats["score"] / stats["games"], 2), stats["games"]])
+        return rows
\ No newline at end of file
@@ -0,0 +1,199 @@
+import hashlib
+import json
+import os
+from array import array
+from collections import deque
+from typing import ClassVar
+
+from app import storage
+
+class AdjacencyGraph:
+    """
+    Compact adjacency structure for a single map, compiled from its graph.json file.
+
+    Regions are numbered in the order they appear in graph.json. The neighbours of region i are stored in
+    neighbours[offsets[i]:offsets[i + 1]], land borders first and then sea routes. is_sea_route flags each neighbour entry.
+
+    Each graph.json file is only read and compiled once per process. See load().
+
+    Hop distances between every pair of regions are built the first time a radius query is made and saved to a
+    distances.json file next to graph.json. That file stores a hash of graph.json and is rebuilt if the map changes.
+    """
+
+    UNREACHABLE: ClassVar[int] = 255
+
+    _cache: ClassVar[dict[str, tuple[int, dict, "AdjacencyGraph"]]] = {}
+
+    def __init__(self, graph: dict, graph_filepath: str = None, graph_hash: str = None):
+
+        self.graph_filepath = graph_filepath
+        self.graph_hash = graph_hash
+        self._distances: list[bytes] = None
+        self._layers: dict[int, tuple[list[str], list[int]]] = {}
+
+        self.ids: list[str] = list(graph.keys())
+        self.index: dict[str, int] = {region_id: i for i, region_id in enumerate(self.ids)}
+        self.offsets = array("I", [0])
+        self.neighbours = array("I")
+        self.is_sea_route = array("B")
+        self._adjacent: list[dict[str, bool]] = []
+        self._adjacent_to: dict[str, set[str]] = None
+
+        for region_id in self.ids:
+            land_borders: dict = graph[region_id].get("adjacencyMap", {})
+            sea_routes: dict = graph[region_id].get("seaRoutes", {})
+            adjacent = land_borders | sea_routes
+            for adj_id in adjacent:
+                self.neighbours.append(self.index[adj_id])
+                self.is_sea_route.append(adj_id not in land_borders)
+            self.offsets.append(len(self.neighbours))
+            self._adjacent.append(adjacent)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def load(cls, graph_filepath: str) -> tuple[dict, "AdjacencyGraph"]:
+        """
+        Returns the contents of a graph.json file along with its compiled adjacency structure.
+        The file is only read again if it has been modified since it was last loaded.
+
+        Params:
+            graph_filepath (str): Path to graph.json.
+
+        Returns:
+            tuple: Raw graph data and the AdjacencyGraph built from it. Both are shared and must not be modified.
+        """
+
+        modified_time = os.stat(graph_filepath).st_mtime_ns
+        cached = cls._cache.get(graph_filepath)
+
+        if cached is None or cached[0] != modified_time:
+            with open(graph_filepath, 'rb') as f:
+                contents = f.read()
+            graph = json.loads(contents)
+            graph_hash = hashlib.sha256(contents).hexdigest()
+            cached = (modified_time, graph, AdjacencyGraph(graph, graph_filepath, graph_hash))
+            cls._cache[graph_filepath] = cached
+
+        return cached[1], cached[2]
+
+    def adjacent(self, region_id: str) -> dict[str, bool]:
+        """
+        Returns the land borders and sea routes of a region keyed by region id. Shared, must not be modified.
+        """
+        return self._adjacent[self.index[region_id]]
+
+    def adjacent_to(self, region_id: str) -> set[str]:
+        """
+        Returns the ids of all regions that list a region as a land border or sea route. Shared, must not be modified.
+        """
+        if self._adjacent_to is None:
+            self._adjacent_to = {adj_id: set() for adj_id in self.ids}
+            for i, adjacent in enumerate(self._adjacent):
+                for adj_id in adjacent:
+                    self._adjacent_to[adj_id].add(self.ids[i])
+        return self._adjacent_to[region_id]
+
+    def distance(self, region_id_1: str, region_id_2: str) -> int | None:
+        """
+        Returns the number of hops between two regions, or None if one cannot be reached from the other.
+        """
+        distances = self._get_distances()
+        hops = distances[self.index[region_id_1]][self.index[region_id_2]]
+        return None if hops == self.UNREACHABLE else hops
+
+    def within(self, region_id: str, radius: int) -> set[str]:
+        """
+        Returns the ids of all regions at most radius hops away from a region, including the region itself.
+        """
+        
+        i = self.index[region_id]
+        if i not in self._layers:
+            self._layers[i] = self._build_layers(i)
+        
+        region_ids_by_distance, layer_ends = self._layers[i]
+        return set(region_ids_by_distance[:layer_ends[min(max(radius, 0), len(layer_ends) - 1)]])
+
+    def _build_layers(self, i: int) -> tuple[list[str], list[int]]:
+        """
+        Orders all regions reachable from region i by distance. layer_ends[d] is the number of regions at most d hops away.
+        """
+
+        row = self._get_distances()[i]
+        reachable = sorted((hops, j) for j, hops in enumerate(row) if hops != self.UNREACHABLE)
+        
+        region_ids_by_distance = [self.ids[j] for hops, j in reachable]
+        layer_ends = [0] * (reachable[-1][0] + 1)
+        for hops, j in reachable:
+            layer_ends[hops] += 1
+        for d in range(1, len(layer_ends)):
+            layer_ends[d] += layer_ends[d - 1]
+
+        return region_ids_by_distance, layer_ends
+
+    def _get_distances(self) -> list[bytes]:
+        
+        if self._distances is not None:
+            return self._distances
+
+        distances_filepath = None
+        if self.graph_filepath is not None:
+            distances_filepath = os.path.join(os.path.dirname(self.graph_filepath), "distances.json")
+
+        # reuse saved distances if graph.json has not changed since they were built
+        if distances_filepath is not None and os.path.exists(distances_filepath):
+            saved = storage.load_json(distances_filepath)
+            if saved.get("graphHash") == self.graph_hash and len(saved["distances"]) == len(self.ids):
+                self._distances = [bytes.fromhex(row) for row in saved["distances"]]
+                return self._distances
+
+        self._distances = [self._bfs_distances(i) for i in range(len(self.ids))]
+
+        if distances_filepath is not None:
+            try:
+                storage.save_json(distances_filepath, {"graphHash": self.graph_hash, "distances": [row.hex() for row in self._distances]})
+            except OSError:
+                pass    # the table still works from memory, it will be built again by the next process
+
+        return self._distances
+
+    def _bfs_distances(self, start: int) -> bytes:
+        
+        row = bytearray([self.UNREACHABLE]) * len(self.ids)
+        row[start] = 0
+        frontier = [start]
+        offsets = self.offsets
+        neighbours = self.neighbours
+        hops = 0
+
+        while frontier and hops < self.UNREACHABLE - 1:
+            hops += 1
+            next_frontier = []
+            for i in frontier:
+                for j in neighbours[offsets[i]:offsets[i + 1]]:
+                    if row[j] == self.UNREACHABLE:
+                        row[j] = hops
+                        next_frontier.append(j)
+            frontier = next_frontier
+
+        return bytes(row)
+
+    def bfs_order(self, region_id: str):
+        """
+        Yields the index of every region reachable from a region in breadth-first order, starting with the region itself.
+        """
+
+        start = self.index[region_id]
+        visited = {start}
+        queue = deque([start])
+        offsets = self.offsets
+        neighbours = self.neighbours
+
+        while queue:
+            i = queue.popleft()
+            yield i
+            for j in neighbours[offsets[i]:offsets[i + 1]]:
+                if j not in visited:
+                    visited.add(j)
+                    queue.append(j)
\ No newline at end of file
@@ -2,8 +2,9 @@ from app.scenario.scenario import ScenarioInterface as SD
 
 class ImprovementData:
     
-    def __init__(self, d: dict):
+    def __init__(self, d: dict, region_id: str = None):
         self._data = d
+        self._region_id = region_id
         self._load_attributes_from_game_files()
         self.has_been_attacked = False
 
@@ -13,7 +14,9 @@ class ImprovementData:
     
     @name.setter
     def name(self, value: str) -> None:
-        self._data["name"] = value
+        if self._data["name"] != value:
+            self._data["name"] = value
+            self._mark_changed(redraw=True)
 
     @property
     def health(self) -> int:
@@ -21,7 +24,9 @@ class ImprovementData:
     
     @health.setter
     def health(self, value: int) -> None:
-        self._data["health"] = value
+        if self._data["health"] != value:
+            self._data["health"] = value
+            self._mark_changed(redraw=True)
 
     @property
     def countdown(self) -> int:
@@ -29,7 +34,16 @@ class ImprovementData:
     
     @countdown.setter
     def countdown(self, value: int) -> None:
-        self._data["turnTimer"] = value
+        if self._data["turnTimer"] != value:
+            self._data["turnTimer"] = value
+            self._mark_changed()
+
+    def _mark_changed(self, redraw: bool = False) -> None:
+        from app.region.regions import Regions
+        if self._region_id is not None:
+            Regions.mark_changed(self._region_id)
+            if redraw:
+                Regions.mark_for_redraw(self._region_id)
 
     @property
     def has_health(self):
@@ -1,23 +1,21 @@
-import copy
 import json
-from collections import deque
 
-from app.game.games import Games
 from app.nation.nation import Nation
+from .adjacency import AdjacencyGraph
 from .improvement import ImprovementData
 from .unit import UnitData
 
 class Region:
 
-    def __init__(self, region_id: str, data: dict, graph: dict, game_id: str):
+    def __init__(self, region_id: str, data: dict, graph: dict, adjacency: AdjacencyGraph, game_id: str):
         self.id = region_id
         self._data = data
         self.game_id = game_id
         
-        self.data = RegionData(self._data["regionData"])
-        self.graph = GraphData(graph)
-        self.improvement = ImprovementData(self._data["improvementData"])
-        self.unit = UnitData(self._data["unitData"])
+        self.data = RegionData(self._data["regionData"], region_id)
+        self.graph = GraphData(region_id, graph, adjacency)
+        self.improvement = ImprovementData(self._data["improvementData"], region_id)
+        self.unit = UnitData(self._data["unitData"], region_id)
 
         self.claim_list = []
 
@@ -39,22 +37,8 @@ class Region:
         return self.__str__()
 
     def get_regions_in_radius(self, radius: int) -> set:
-        
-        queue = deque([(self, 0)])
-        visited = set([self.id])
-        
-        while queue:
-            
-            region, depth = queue.popleft()
-            
-            if depth < radius:
-                
-                for adj_region in region.graph.iter_adjacent_regions():
-                    if adj_region.id not in visited:
-                        visited.add(adj_region.id)
-                        queue.append((adj_region, depth + 1))
-        
-        return visited
+        from .regions import Regions
+        return Regions.within(self.id, radius)
 
     def check_for_adjacent_improvement(self, improvement_names: set) -> bool:
         for adj_region in self.graph.iter_adjacent_regions():
@@ -82,16 +66,13 @@ class Region:
             str: Suitable region_id if found, otherwise None.
         """
 
-        queue = deque([self])
-        visited = set()
+        from .regions import Regions
+
+        adjacency = self.graph.adjacency
 
-        while queue:
+        for i in adjacency.bfs_order(self.id):
             
-            region = queue.popleft()
-
-            if region.id in visited:
-                continue
-            visited.add(region.id)
+            region = Regions.load(adjacency.ids[i])
 
             if (
                 region.data.owner_id == self.unit.owner_id    # region must be owned by the unit owner
@@ -99,10 +80,6 @@ class Region:
                 and region.data.occupier_id == "0"            # region must not be occupied by another nation
             ):
                 return region.id
-            
-            for adj_region in region.graph.iter_adjacent_regions():
-                if adj_region.id not in visited:
-                    queue.append(adj_region)
 
         return None
 
@@ -117,11 +94,7 @@ class Region:
         Calculates cost of claiming a region for a specific nation.
         """
         
-        cost_multiplier = 1.0
-        for tag_data in nation.tags.values():
-            cost_multiplier += float(tag_data.get("Region Claim Cost", 0))
-    
-        return int(self.data.purchase_cost * cost_multiplier)
+        return int(self.data.purchase_cost * nation.modifiers.claim_cost_multiplier)
 
     def set_fallout(self, starting_fallout=4) -> None:
         self.data.fallout = starting_fallout
@@ -231,107 +204,13 @@ class Region:
         combat.pillage()
         return True
 
-    def calculate_yield(self, game_id: str, nation: Nation, improvement_income_dict: dict) -> dict:
-        """
-        Calculates the final yield of this improvement.
-
-        Params:
-            improvement_income_dict (dict): Contains the income and multiplier of this improvement type. From yield_dict.
-
-        Returns:
-            dict: Contains all yields from this improvement.
-        """
-
-        game = Games.load(game_id)
-
-        improvement_income_dict = copy.deepcopy(improvement_income_dict)  # deepcopy required because of modifiers below
-
-        # get modifer from central banks
-        if self.improvement.name != "Capital" and self.check_for_adjacent_improvement(improvement_names={"Central Bank"}):
-            for resource_name in improvement_income_dict:
-                improvement_income_dict[resource_name]["Income Multiplier"] += 0.2
-
-        # get modifer from remnant government
-        capital_boost = any("Capital Boost" in tag_data for tag_data in nation.tags.values())
-        if capital_boost and self.check_for_adjacent_improvement(improvement_names = {'Capital'}):
-            for resource_name in improvement_income_dict:
-                if resource_name in ["Political Power", "Military Capacity"]:
-                    continue
-                improvement_income_dict[resource_name]["Income Multiplier"] += 1.0
-        
-        # get pandemic multiplier
-        if "Pandemic" in game.active_events:
-            for resource_name in improvement_income_dict:
-                multiplier = improvement_income_dict[resource_name]["Income Multiplier"]
-                penalty = 0
-                if self.data.infection > 0:
-                    penalty += self.data.infection * 0.1
-                if self.data.quarantine:
-                    penalty += 0.5
-                multiplier -= penalty
-                if multiplier < 0:
-                    multiplier = 0
-                improvement_income_dict[resource_name]["Income Multiplier"] = multiplier
-
-        # get income modifiers from tags
-        for tag_name, tag_data in nation.tags.items():
-            if "Improvement Income" not in tag_data:
-                continue
-            for improvement_name, resource_data in tag_data["Improvement Income"].items():
-                if improvement_name != self.improvement.name:
-                    continue
-                for resource_name, income_modifier in resource_data.items():
-                    improvement_income_dict[resource_name]["Income"] += income_modifier
-        
-        # get income multiplier modifiers from tags
-        for tag_name, tag_data in nation.tags.items():
-            if "Improvement Income Multiplier" not in tag_data:
-                continue
-            for improvement_name, resource_data in tag_data["Improvement Income Multiplier"].items():
-                if improvement_name != self.improvement.name:
-                    continue
-                for resource_name, income_modifier in resource_data.items():
-                    improvement_income_dict[resource_name]["Income Multiplier"] += income_modifier
-        
-        # get capital resource if able
-        # TODO - find a way to not hard code this check
-        if self.improvement.name == "Capital" and self.data.resource != "Empty":
-            match self.data.resource:
-                case "Coal":
-                    if 'Coal Mining' in nation.completed_research:
-                        improvement_income_dict[self.data.resource]["Income"] += 1
-                case "Oil":
-                    if 'Oil Drilling' in nation.completed_research:
-                        improvement_income_dict[self.data.resource]["Income"] += 1
-                case "Basic Materials":
-                    improvement_income_dict[self.data.resource]["Income"] += 1
-                case "Common Metals":
-                    if 'Metal Extraction' in nation.completed_research:
-                        improvement_income_dict[self.data.resource]["Income"] += 1
-                case "Advanced Metals":
-                    if 'Metallurgy' in nation.completed_research:
-                        improvement_income_dict[self.data.resource]["Income"] += 1
-                case "Uranium":
-                    if 'Uranium Mining' in nation.completed_research:
-                        improvement_income_dict[self.data.resource]["Income"] += 1
-                case "Rare Earth Elements":
-                    if 'Rare Earth Mining' in nation.completed_research:
-                        improvement_income_dict[self.data.resource]["Income"] += 1
-        
-        # calculate final income
-        final_yield_dict = {}
-        for resource_name in improvement_income_dict:
-            final_yield = improvement_income_dict[resource_name]["Income"] * improvement_income_dict[resource_name]["Income Multiplier"]
-            final_yield_dict[resource_name] = final_yield
-
-        return final_yield_dict
-
 class RegionData:
 
     # TODO: move infection and quarantine code to scenario file somehow
 
-    def __init__(self, d: dict):
+    def __init__(self, d: dict, region_id: str = None):
         self._data = d
+        self._region_id = region_id
 
     @property
     def owner_id(self) -> str:
@@ -339,7 +218,9 @@ class RegionData:
     
     @owner_id.setter
     def owner_id(self, new_id: str) -> None:
-        self._data["ownerID"] = new_id
+        if self._data["ownerID"] != new_id:
+            self._data["ownerID"] = new_id
+            self._mark_changed(redraw=True)
     
     @property
     def occupier_id(self) -> str:
@@ -347,7 +228,9 @@ class RegionData:
     
     @occupier_id.setter
     def occupier_id(self, new_id: str) -> None:
-        self._data["occupierID"] = new_id
+        if self._data["occupierID"] != new_id:
+            self._data["occupierID"] = new_id
+            self._mark_changed(redraw=True)
     
     @property
     def purchase_cost(self) -> int:
@@ -355,7 +238,9 @@ class RegionData:
     
     @purchase_cost.setter
     def purchase_cost(self, value: int) -> None:
-        self._data["purchaseCost"] = value
+        if self._data["purchaseCost"] != value:
+            self._data["purchaseCost"] = value
+            self._mark_changed()
     
     @property
     def resource(self) -> str:
@@ -363,7 +248,9 @@ class RegionData:
     
     @resource.setter
     def resource(self, value: str) -> None:
-        self._data["regionResource"] = value
+        if self._data["regionResource"] != value:
+            self._data["regionResource"] = value
+            self._mark_changed(redraw=True)
     
     @property
     def fallout(self) -> int:
@@ -371,7 +258,9 @@ class RegionData:
     
     @fallout.setter
     def fallout(self, value: int) -> None:
-        self._data["nukeTurns"] = value
+        if self._data["nukeTurns"] != value:
+            self._data["nukeTurns"] = value
+            self._mark_changed(redraw=True)
 
     @property
     def infection(self) -> int:
@@ -379,7 +268,9 @@ class RegionData:
     
     @infection.setter
     def infection(self, value: int) -> None:
-        self._data["infection"] = value
+        if self._data["infection"] != value:
+            self._data["infection"] = value
+            self._mark_changed()
 
     @property
     def quarantine(self) -> bool:
@@ -387,11 +278,21 @@ class RegionData:
     
     @quarantine.setter
     def quarantine(self, value: bool) -> None:
-        self._data["quarantine"] = value
+        if self._data["quarantine"] != value:
+            self._data["quarantine"] = value
+            self._mark_changed()
+
+    def _mark_changed(self, redraw: bool = False) -> None:
+        from app.region.regions import Regions
+        if self._region_id is not None:
+            Regions.mark_changed(self._region_id)
+            if redraw:
+                Regions.mark_for_redraw(self._region_id)
 
 class GraphData:
         
-    def __init__(self, d: dict):
+    def __init__(self, region_id: str, d: dict, adjacency: AdjacencyGraph):
+        self.adjacency = adjacency
         self.full_name: str = d["fullName"]
         self.is_edge: bool = d["isEdgeOfMap"]
         self.is_significant: bool = d["hasRegionalCapital"]
@@ -399,12 +300,14 @@ class GraphData:
         self.is_start: bool = d["randomStartAllowed"]
         self.map: dict[str] = d.get("adjacencyMap", {})
         self.sea_routes: dict[str] = d.get("seaRoutes", {})
-        self.adjacent_regions: dict[str] = self.map | self.sea_routes
+        self.adjacent_regions: dict[str] = adjacency.adjacent(region_id)
         self.additional_region_coordinates: list = d["additionalRegionCords"]
         self.improvement_coordinates: list = d["improvementCords"]
         self.unit_coordinates: list = d["unitCords"]
 
     def iter_adjacent_regions(self):
         from .regions import Regions
+        instances = Regions._instances
         for region_id in self.adjacent_regions:
-            yield Regions.load(region_id)
\ No newline at end of file
+            region = instances.get(region_id)
+            yield region if region is not None else Regions.load(region_id)
\ No newline at end of file
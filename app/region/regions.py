@@ -1,9 +1,11 @@
-import json
 import os
+import zlib
 from dataclasses import dataclass
 from typing import ClassVar, Iterator
 
+from app import storage
 from app.game.games import Games
+from .adjacency import AdjacencyGraph
 from .region import Region
 
 class RegionsMeta(type):
@@ -20,16 +22,74 @@ class RegionsMeta(type):
 
 @dataclass
 class Regions(metaclass=RegionsMeta):
+    """
+    Region data of the loaded game.
+
+    Regions are saved in REGION_CHUNKS files under gamedata/<game_id>/regdata/, each region always in the same chunk.
+    Every change made through the region, improvement, and unit setters marks its region as changed, and save() only
+    rewrites the chunks holding changed regions, so saving costs about the same however large the map is.
+    Chunks are written as new files and chunks.json, which lists the file of every chunk, is replaced last, so a save
+    that fails partway leaves the previous save intact.
+    Games still saved as a single regdata.json file are split into chunks the first time they are saved.
+    """
+
+    REGION_CHUNKS: ClassVar[int] = 16
 
     game_id: ClassVar[str] = None
     _data: ClassVar[dict[str, dict]] = None
     _graph: ClassVar[dict[str, dict]] = None
+    _adjacency: ClassVar[AdjacencyGraph] = None
     _instances: ClassVar[dict[str, Region]] = {}
+    _redraws: ClassVar[set[str]] = set()
+    _changed: ClassVar[set[str]] = set()
+    _income_changed: ClassVar[set[str]] = set()
 
     @classmethod
     def _regdata_path(cls) -> str:
         return f"gamedata/{cls.game_id}/regdata.json"
 
+    @classmethod
+    def _chunks_path(cls) -> str:
+        return f"gamedata/{cls.game_id}/regdata"
+
+    @classmethod
+    def _chunk_index_path(cls) -> str:
+        return f"{cls._chunks_path()}/chunks.json"
+
+    @classmethod
+    def _chunk_of(cls, region_id: str) -> int:
+        return zlib.crc32(region_id.encode()) % cls.REGION_CHUNKS
+
+    @classmethod
+    def _chunk_path(cls, chunk: int, generation: int | None) -> str:
+        if generation is None:
+            return f"{cls._chunks_path()}/{chunk}.json"    # saved before chunk files were numbered by save
+        return f"{cls._chunks_path()}/{chunk}.{generation}.json"
+
+    @classmethod
+    def _read_chunk_index(cls) -> dict | None:
+        """
+        Returns the chunk count, the number of the last save, and the save each chunk was last written by.
+        Returns None if the regions of this game are still saved as a single regdata.json file.
+        """
+        chunk_index_path = cls._chunk_index_path()
+        if not os.path.exists(chunk_index_path):
+            return None
+        chunk_index = storage.load_json(chunk_index_path)
+        chunk_index.setdefault("generation", 0)
+        chunk_index.setdefault("chunkGenerations", [None] * chunk_index["chunks"])
+        return chunk_index
+
+    @classmethod
+    def _read_regdata(cls) -> dict:
+        chunk_index = cls._read_chunk_index()
+        if chunk_index is None:
+            return storage.load_json(cls._regdata_path())
+        regdata = {}
+        for chunk, generation in enumerate(chunk_index["chunkGenerations"]):
+            regdata.update(storage.load_json(cls._chunk_path(chunk, generation)))
+        return regdata
+
     @classmethod
     def initialize(cls, game_id: str) -> None:
 
@@ -39,25 +99,90 @@ class Regions(metaclass=RegionsMeta):
         regdata_path = cls._regdata_path()
         graph_filepath = f"maps/{game.get_map_string()}/graph.json"
         
-        if not (os.path.exists(regdata_path) and os.path.exists(graph_filepath)):
+        if not ((os.path.exists(regdata_path) or os.path.exists(cls._chunk_index_path())) and os.path.exists(graph_filepath)):
             raise FileNotFoundError(f"Error: Unable to locate required game files for Regions class.")
         
-        with open(regdata_path, 'r') as f:
-            cls._data = json.load(f)
-        with open(graph_filepath, 'r') as f:
-            cls._graph = json.load(f)
-        
+        cls.attach(game_id, cls._read_regdata())
+
+    @classmethod
+    def attach(cls, game_id: str, data: dict) -> None:
+        """
+        Binds this class to region data that has already been read from the game files.
+        """
+
+        game = Games.load(game_id)
+
+        cls.game_id = game_id
+        cls._data = data
+        cls._graph, cls._adjacency = AdjacencyGraph.load(f"maps/{game.get_map_string()}/graph.json")
+
         cls._instances.clear()
+        cls._redraws = set()
+        cls._changed = set()
+        cls._income_changed = set()
     
     @classmethod
     def save(cls) -> None:
+        """
+        Writes the chunks holding regions that changed since the last save.
+        Every chunk is written if the game is not saved in REGION_CHUNKS chunks yet.
+        """
+
         if cls._data is None:
             raise RuntimeError("Error: Regions data not loaded.")
         
-        regdata_filepath = f"gamedata/{cls.game_id}/regdata.json"
+        chunk_index = cls._read_chunk_index()
+        old_generations = chunk_index["chunkGenerations"] if chunk_index is not None else []
+        if len(old_generations) == cls.REGION_CHUNKS:
+            chunks_to_save = {cls._chunk_of(region_id) for region_id in cls._changed}
+            chunk_generations = old_generations.copy()
+        else:
+            chunks_to_save = set(range(cls.REGION_CHUNKS))
+            chunk_generations = [None] * cls.REGION_CHUNKS
+
+        if chunks_to_save:
+            chunks = {chunk: {} for chunk in chunks_to_save}
+            for region_id, region_data in cls._data.items():
+                chunk = cls._chunk_of(region_id)
+                if chunk in chunks:
+                    chunks[chunk][region_id] = region_data
+
+            # chunks are written under the number of this save and only read once chunks.json points to them
+            generation = (chunk_index["generation"] if chunk_index is not None else 0) + 1
+            os.makedirs(cls._chunks_path(), exist_ok=True)
+            for chunk, chunk_data in chunks.items():
+                storage.save_json(cls._chunk_path(chunk, generation), chunk_data)
+                chunk_generations[chunk] = generation
+
+            storage.save_json(cls._chunk_index_path(), {"chunks": cls.REGION_CHUNKS, "generation": generation, "chunkGenerations": chunk_generations})
+            cls._remove_unused_chunks(chunk_generations, old_generations)
+            if os.path.exists(cls._regdata_path()):
+                os.remove(cls._regdata_path())
+
+            storage.bump_state_version(cls.game_id)
         
-        with open(regdata_filepath, 'w') as json_file:
-            json.dump(cls._data, json_file, indent=4)
+        cls._changed = set()
+
+        # changes the maps have not been updated with yet
+        if cls._redraws:
+            from app.map import GameMaps
+            GameMaps.defer_redraw(cls.game_id, cls._redraws)
+            cls._redraws = set()
+
+    @classmethod
+    def _remove_unused_chunks(cls, chunk_generations: list, old_generations: list) -> None:
+        """
+        Deletes chunk files that are not part of the latest save, such as those left by a save that failed partway.
+        Chunks of the save before it are kept so pages that are reading the regions while a turn is saved can still find them.
+        """
+
+        in_use = {os.path.basename(cls._chunk_path(chunk, generation)) for chunk, generation in enumerate(chunk_generations)}
+        in_use |= {os.path.basename(cls._chunk_path(chunk, generation)) for chunk, generation in enumerate(old_generations)}
+        in_use.add(os.path.basename(cls._chunk_index_path()))
+
+        for filename in os.listdir(cls._chunks_path()):
+            if filename.endswith(".json") and filename not in in_use:
+                os.remove(f"{cls._chunks_path()}/{filename}")
 
     @classmethod
     def load(cls, region_id: str) -> Region:
@@ -68,9 +193,56 @@ class Regions(metaclass=RegionsMeta):
             raise Exception(f"Failed to load Region with id {region_id}. Region ID not valid for this game.")
         
         if region_id not in cls._instances:
-            cls._instances[region_id] = Region(region_id, cls._data[region_id], cls._graph[region_id], cls.game_id)
+            cls._instances[region_id] = Region(region_id, cls._data[region_id], cls._graph[region_id], cls._adjacency, cls.game_id)
         return cls._instances[region_id]
     
+    @classmethod
+    def mark_changed(cls, region_id: str) -> None:
+        """
+        Records that the data of a region has changed and must be written on the next save.
+        """
+        cls._changed.add(region_id)
+        cls._income_changed.add(region_id)
+
+    @classmethod
+    def mark_for_redraw(cls, region_id: str) -> None:
+        """
+        Records that something shown on the map has changed in a region.
+        """
+        cls._redraws.add(region_id)
+
+    @classmethod
+    def take_redraws(cls) -> set[str]:
+        """
+        Returns the regions marked for redraw since the last call.
+        """
+        region_ids = cls._redraws
+        cls._redraws = set()
+        return region_ids
+
+    @classmethod
+    def take_income_changes(cls) -> set[str]:
+        """
+        Returns the regions that changed since the last call. Unlike the changes used by save() these are kept until RegionIncome asks for them.
+        """
+        region_ids = cls._income_changed
+        cls._income_changed = set()
+        return region_ids
+
+    @classmethod
+    def within(cls, region_id: str, radius: int) -> set[str]:
+        """
+        Returns the ids of all regions at most radius hops away from a region, including the region itself.
+        """
+        return cls._adjacency.within(region_id, radius)
+
+    @classmethod
+    def adjacent_to(cls, region_id: str) -> set[str]:
+        """
+        Returns the ids of all regions that have a region as one of their neighbours.
+        """
+        return cls._adjacency.adjacent_to(region_id)
+
     @classmethod
     def ids(cls) -> list:
         return list(cls._graph.keys())
\ No newline at end of file
@@ -3,8 +3,9 @@ from app.combat.experience import ExperienceRewards
 
 class UnitData:
     
-    def __init__(self, d: dict):
+    def __init__(self, d: dict, region_id: str = None):
         self._data = d
+        self._region_id = region_id
         self._load_attributes_from_game_files()
         self.level = self.xp // 10
         self.has_been_attacked = False
@@ -16,7 +17,9 @@ class UnitData:
     
     @name.setter
     def name(self, value: str) -> None:
-        self._data["name"] = value
+        if self._data["name"] != value:
+            self._data["name"] = value
+            self._mark_changed(redraw=True)
 
     @property
     def full_name(self) -> str:
@@ -24,7 +27,9 @@ class UnitData:
     
     @full_name.setter
     def full_name(self, value: str) -> None:
-        self._data["fullName"] = value
+        if self._data["fullName"] != value:
+            self._data["fullName"] = value
+            self._mark_changed(redraw=True)
 
     @property
     def health(self) -> int:
@@ -32,7 +37,9 @@ class UnitData:
     
     @health.setter
     def health(self, value: int) -> None:
-        self._data["health"] = value
+        if self._data["health"] != value:
+            self._data["health"] = value
+            self._mark_changed(redraw=True)
 
     @property
     def xp(self) -> int:
@@ -40,7 +47,9 @@ class UnitData:
     
     @xp.setter
     def xp(self, value: int) -> None:
-        self._data["experience"] = value
+        if self._data["experience"] != value:
+            self._data["experience"] = value
+            self._mark_changed(redraw=True)
 
     @property
     def owner_id(self) -> str:
@@ -48,8 +57,17 @@ class UnitData:
     
     @owner_id.setter
     def owner_id(self, new_id: str) -> None:
-        self._data["ownerID"] = new_id
+        if self._data["ownerID"] != new_id:
+            self._data["ownerID"] = new_id
+            self._mark_changed(redraw=True)
     
+    def _mark_changed(self, redraw: bool = False) -> None:
+        from app.region.regions import Regions
+        if self._region_id is not None:
+            Regions.mark_changed(self._region_id)
+            if redraw:
+                Regions.mark_for_redraw(self._region_id)
+
     @property
     def true_max_health(self) -> int:
         return self.max_health + self.level * 2
@@ -4,21 +4,28 @@ import os
 import string
 import random
 import shutil
-from operator import itemgetter
-from collections import defaultdict
 from datetime import datetime
 from queue import PriorityQueue 
 
 from app import site_functions
+from app import storage
 from app import palette
+from app.map_render import MapRenderer
+from app.map_tiles import MapTiles
+from app.page_cache import cached_game_page
+from app.player_stats import PlayerStats
 from app.game.games import Games
+from app.game.game_archive import GameArchive
+from app.game.game_summaries import GameSummaries
+from app.game.turn_journal import TurnJournal
 from app.game.game import GameStatus
 from app.scenario.scenario import ScenarioInterface as SD
 
-from flask import Flask, Blueprint, render_template, request, redirect, url_for, send_file
+from flask import Flask, Blueprint, render_template, request, redirect, url_for, send_file, jsonify
 
 app = Flask(__name__)
 main = Blueprint('main', __name__)
+MAP_TILE_MAX_AGE = 60
 @main.route('/')
 def main_function():
     return render_template('index.html')
@@ -31,48 +38,17 @@ def main_function():
 @main.route('/games')
 def games():
 
-    def generate_refined_player_list_active():
-        """
-        Creates list of nations that is shown alongside each game.
-        """
-
-        with open('playerdata/player_records.json', 'r') as json_file:
-            player_records_dict = json.load(json_file)
-
-        data_a = []
-        data_b = []
-    
-        for nation in Nations:
-            gov_fp_str = f"{nation.fp} - {nation.gov}"
-            username_str = f"""<a href="profile/{nation.player_id}">{player_records_dict[nation.player_id]["Username"]}</a>"""
-            player_color = site_functions.check_color_correction(nation.color)
-            # tba - fix duplicate player color (second one should be redundant)
-            if nation.score > 0:
-                data_a.append([nation.name, nation.score, gov_fp_str, username_str, player_color, player_color])
-            else:
-                data_b.append([nation.name, nation.score, gov_fp_str, username_str, player_color, player_color])
-
-        filtered_data_a = sorted(data_a, key=itemgetter(0), reverse=False)
-        filtered_data_a = sorted(filtered_data_a, key=itemgetter(1), reverse=True)
-        filtered_data_b = sorted(data_b, key=itemgetter(0), reverse=False)
-        data = filtered_data_a + filtered_data_b
-
-        return data
-    
-    from app.nation.nations import Nations
-    with open("playerdata/player_records.json", 'r') as json_file:
-        player_records_dict = json.load(json_file)
-
     active_games = {}
 
     for game in Games:
 
-        Nations.load(game.id)
+        # player rows are prepared at the end of each turn, see GameSummaries
+        summary = GameSummaries.load(game.id)
         active_games[game.id] = {
-            "title": None,
-            "status": None,
-            "image_url": None,
-            "playerdata": None,
+            "title": summary["title"],
+            "status": summary["status"],
+            "image_url": url_for('main.get_map_preview', full_game_id=game.id, map_name='mainmap'),
+            "playerdata": summary["playerdata"],
             "information": {
                 "Scenario": game.info.scenario,
                 "Map": game.info.map,
@@ -89,40 +65,6 @@ def games():
                 "Region Disputes": game.stats.region_disputes,
             }
         }
-        
-        match game.status:
-
-            case GameStatus.REGION_SELECTION:
-                active_games[game.id]["title"] = f"""<a href="/{game.id}">{game.name}</a>"""
-                active_games[game.id]["status"] = "Starting Region Selection in Progress"
-                refined_player_data = []
-                for nation in Nations:
-                    username = player_records_dict[nation.player_id]["Username"]
-                    username_str = f"""<a href="profile/{nation.player_id}">{username}</a>"""
-                    refined_player_data.append([nation.name, 0, 'TBD', username_str, '#ffffff', '#ffffff'])
-                active_games[game.id]["playerdata"] = refined_player_data
-                active_games[game.id]["image_url"] = url_for('main.get_mainmap', full_game_id=game.id)
-
-            case GameStatus.NATION_SETUP:
-                active_games[game.id]["title"] = f"""<a href="/{game.id}">{game.name}</a>"""
-                active_games[game.id]["status"] = "Nation Setup in Progress"
-                refined_player_data = []
-                for nation in Nations:
-                    username = player_records_dict[nation.player_id]["Username"]
-                    username_str = f"""<a href="profile/{nation.player_id}">{username}</a>"""
-                    player_color_2 = site_functions.check_color_correction(nation.color)
-                    refined_player_data.append([nation.name, 0, 'TBD', username_str, nation.color, player_color_2])
-                active_games[game.id]["playerdata"] = refined_player_data
-                active_games[game.id]["image_url"] = url_for('main.get_mainmap', full_game_id=game.id)
-
-            case _:
-                active_games[game.id]["title"] = f"""<a href="/{game.id}">{game.name}</a>"""
-                if not GameStatus.FINISHED:
-                    active_games[game.id]["status"] = "Game Over!"
-                else:
-                    active_games[game.id]["status"] = f"Turn {game.turn}"
-                active_games[game.id]["playerdata"] = generate_refined_player_list_active()
-                active_games[game.id]["image_url"] = url_for('main.get_mainmap', full_game_id=game.id)
     
     return render_template('temp_games.html', dict = active_games)
 
@@ -194,8 +136,7 @@ def create_game():
             if form_data_dict["Scenario"] == "Standard":
                 regdata_dict[region_id]["regionData"]["infection"] = 0
                 regdata_dict[region_id]["regionData"]["quarantine"] = False
-        with open(f"gamedata/{game_id}/regdata.json", 'w') as json_file:
-            json.dump(regdata_dict, json_file, indent=4)
+        storage.save_json(f"gamedata/{game_id}/regdata.json", regdata_dict)
 
         # create gamedata.json
         gamedata_filepath = f"gamedata/{game_id}/gamedata.json"
@@ -206,14 +147,14 @@ def create_game():
             "truces": {},
             "wars": {}
         }
-        with open(gamedata_filepath, 'w') as json_file:
-            json.dump(gamedata_dict, json_file, indent=4)
+        storage.save_json(gamedata_filepath, gamedata_dict)
 
         # create nationdata
         Nations.load(game_id)
         for i, user_id in enumerate(profile_ids_list):
             Nations.create(str(i + 1), user_id)
         Nations.save()
+        GameSummaries.update(game_id)
 
         # create rmdata file
         rmdata_filepath = f'{files_destination}/rmdata.csv'
@@ -271,8 +212,8 @@ def create_game():
 @main.route('/archived_games')
 def archived_games():
     
-    with open("game_records.json", 'r') as json_file:
-        game_records_dict = json.load(json_file)
+    page = request.args.get("page", 1, type=int)
+    game_records_dict, page_count = GameArchive.page(page)
     
     for game_id, game_data in game_records_dict.items():
         
@@ -292,38 +233,22 @@ def archived_games():
         turn_number = game_data["Statistics"]["Game End Turn"]
         game_data["image_url"] = f"{game_id}/{turn_number}.png"
     
-    # display games from newest to oldest
-    game_records_dict = dict(sorted(game_records_dict.items(), key=lambda item: item[1]["Number"], reverse=True))
-    
-    return render_template("temp_archive.html", dict = game_records_dict)
+    # games are already ordered from newest to oldest
+    return render_template("temp_archive.html", dict = game_records_dict, page = page, page_count = page_count)
 
 # LEADERBOARD PAGE
 @main.route('/leaderboard')
 def leaderboard():
     
-    leaderboard_data = []
-    with open("playerdata/leaderboard.csv", 'r') as file:
-        reader = csv.reader(file)
-        for row in reader:
-            if row != []:
-                leaderboard_data.append(row)
-    
     with open("playerdata/player_records.json", 'r') as json_file:
         player_records_dict = json.load(json_file)
     
-    username_list = []
-    for profile_id, player_data in player_records_dict.items():
-        username_list.append(player_data.get("Username"))
-    
+    leaderboard_data = []
     profile_ids = []
-    for entry in leaderboard_data:
-        username = entry[0]
-        profile_id = username_list.index(username)
-        profile_id = str(profile_id + 1)
-        while len(profile_id) < 3:
-            profile_id = f'0{profile_id}'
+    for profile_id, wins, total_score, average_score, games_played in PlayerStats.leaderboard():
+        username = player_records_dict[profile_id]["Username"]
+        leaderboard_data.append([f"""<a href="profile/{profile_id}">{username}</a>""", wins, total_score, average_score, games_played])
         profile_ids.append(profile_id)
-        entry[0] = f"""<a href="profile/{profile_id}">{entry[0]}</a>"""
     
     with open("playerdata/leaderboard_records.json", 'r') as json_file:
         leaderboard_records_dict = json.load(json_file)
@@ -336,8 +261,9 @@ def profile_route(profile_id):
 
     with open("playerdata/player_records.json", 'r') as json_file:
         player_records_dict = json.load(json_file)
-    with open("game_records.json", 'r') as json_file:
-        game_records_dict = json.load(json_file)
+
+    # totals are updated whenever a game is archived, see PlayerStats
+    stats = PlayerStats.get(profile_id)
 
     profile = {
         "username": player_records_dict[profile_id]["Username"],
@@ -347,65 +273,24 @@ def profile_route(profile_id):
         "lastGame": None,
         "favoriteGov": None,
         "favoriteFP": None,
-        "rank": 0,
-        "totalWins": 0,
-        "totalDraws": 0,
-        "totalLosses": 0,
-        "totalScore": 0,
-        "averageScore": 0,
-        "totalGames": 0,
+        "rank": PlayerStats.rank(profile_id),
+        "totalWins": stats["wins"],
+        "totalDraws": stats["draws"],
+        "totalLosses": stats["losses"],
+        "totalScore": stats["score"],
+        "averageScore": round(stats["score"] / stats["games"], 2) if stats["games"] else 0,
+        "totalGames": stats["games"],
         "reliability": 0
     }
 
-    with open("playerdata/leaderboard.csv", 'r') as file:
-        reader = csv.reader(file)
-        for i, row in enumerate(reader):
-            if row[0] == profile["username"]:
-                profile["rank"] = i + 1
-                profile["totalWins"] = row[1]
-                profile["totalScore"] = row[2]
-                profile["averageScore"] = row[3]
-                profile["totalGames"] = int(row[4])
-    
-    game_starts = defaultdict(int)
-    game_ends = defaultdict(int)
-    governments_played = defaultdict(int)
-    foreign_policies_played = defaultdict(int)
-    
-    for game_id, game_data in game_records_dict.items():
-
-        if profile_id not in game_data["Player Data"]:
-            continue
-        
-        players_who_lost = set()
-        for select_profile_id, player_data in game_data["Player Data"].items():
-            if not player_data["Victory"]:
-                players_who_lost.add(select_profile_id)
-        
-        if len(players_who_lost) == len(game_data["Player Data"]):
-            profile["totalDraws"] += 1
-        elif not game_data["Player Data"][profile_id]["Victory"]:
-            profile["totalLosses"] += 1
-    
-    for game_id, game_data in game_records_dict.items():
-        
-        if profile_id not in game_data["Player Data"]:
-            continue
-
-        game_starts[game_id] = datetime.strptime(game_data["Statistics"]["Game Started"], "%m/%d/%Y")
-        game_ends[game_id] = datetime.strptime(game_data["Statistics"]["Game Ended"], "%m/%d/%Y")
-        
-        government_choice = game_data["Player Data"][profile_id]["Government"]
-        foreign_policy_choice = game_data["Player Data"][profile_id]["Foreign Policy"]
-        governments_played[government_choice] += 1
-        foreign_policies_played[foreign_policy_choice] += 1
-
-    profile["firstGame"] = game_starts[min(game_starts, key=game_starts.get)]
-    profile["lastGame"] = game_ends[max(game_ends, key=game_ends.get)]
-    profile["favoriteGov"] = max(governments_played, key=governments_played.get)
-    profile["favoriteFP"] = max(foreign_policies_played, key=foreign_policies_played.get)
+    if stats["firstGame"] is not None:
+        profile["firstGame"] = datetime.strptime(stats["firstGame"], PlayerStats.DATE_FORMAT)
+        profile["lastGame"] = datetime.strptime(stats["lastGame"], PlayerStats.DATE_FORMAT)
+        profile["favoriteGov"] = max(stats["governments"], key=stats["governments"].get)
+        profile["favoriteFP"] = max(stats["foreignPolicies"], key=stats["foreignPolicies"].get)
 
-    profile["reliability"] = int((profile["totalGames"] - profile["resignations"]) / profile["totalGames"] * 100)
+    if profile["totalGames"]:
+        profile["reliability"] = int((profile["totalGames"] - profile["resignations"]) / profile["totalGames"] * 100)
 
     return render_template('temp_profile.html', dict = profile)
 
@@ -415,6 +300,7 @@ def profile_route(profile_id):
 
 # LOAD GAME PAGE
 @main.route(f'/<full_game_id>')
+@cached_game_page
 def game_load(full_game_id):
     
     from app.nation.nations import Nations
@@ -426,10 +312,16 @@ def game_load(full_game_id):
     main_url = url_for('main.get_mainmap', full_game_id=full_game_id)
     resource_url = url_for('main.get_resourcemap', full_game_id=full_game_id)
     control_url = url_for('main.get_controlmap', full_game_id=full_game_id)
+    # the game pages show maps from their tiles when they have been drawn, see static/js/tiled_map.js
+    main_tiles_url = url_for('main.get_map_tiles_metadata', full_game_id=full_game_id, map_name='mainmap')
+    resource_tiles_url = url_for('main.get_map_tiles_metadata', full_game_id=full_game_id, map_name='resourcemap')
+    control_tiles_url = url_for('main.get_map_tiles_metadata', full_game_id=full_game_id, map_name='controlmap')
 
     match game.status:
 
         case GameStatus.REGION_SELECTION:
+
+            main_tiles_url = None    # the main map is still the blank map
             
             player_data = []
             for nation in Nations:
@@ -441,7 +333,7 @@ def game_load(full_game_id):
                 player_data.append(refined_player_data)
             active_player_data = player_data.pop(0)
 
-            return render_template('temp_stage1.html', active_player_data = active_player_data, player_data = player_data, game_title = game.name, full_title = full_title, main_url = main_url, resource_url = resource_url, control_url = control_url, full_game_id = full_game_id)
+            return render_template('temp_stage1.html', active_player_data = active_player_data, player_data = player_data, game_title = game.name, full_title = full_title, main_url = main_url, resource_url = resource_url, control_url = control_url, main_tiles_url = main_tiles_url, resource_tiles_url = resource_tiles_url, control_tiles_url = control_tiles_url, full_game_id = full_game_id)
 
         case GameStatus.NATION_SETUP:
             
@@ -457,7 +349,7 @@ def game_load(full_game_id):
                 player_data.append(refined_player_data)
             active_player_data = player_data.pop(0)
             
-            return render_template('temp_stage2.html', active_player_data = active_player_data, player_data = player_data, game_title = game.name, full_title = full_title, main_url = main_url, resource_url = resource_url, control_url = control_url, full_game_id = full_game_id)
+            return render_template('temp_stage2.html', active_player_data = active_player_data, player_data = player_data, game_title = game.name, full_title = full_title, main_url = main_url, resource_url = resource_url, control_url = control_url, main_tiles_url = main_tiles_url, resource_tiles_url = resource_tiles_url, control_tiles_url = control_tiles_url, full_game_id = full_game_id)
 
         case _:
 
@@ -471,10 +363,11 @@ def game_load(full_game_id):
                 player_data.append(refined_player_data)
             active_player_data = player_data.pop(0)
             
-            return render_template('temp_stage3.html', active_player_data = active_player_data, player_data = player_data, game_title = game.name, full_title = full_title, main_url = main_url, resource_url = resource_url, control_url = control_url, full_game_id = full_game_id)
+            return render_template('temp_stage3.html', active_player_data = active_player_data, player_data = player_data, game_title = game.name, full_title = full_title, main_url = main_url, resource_url = resource_url, control_url = control_url, main_tiles_url = main_tiles_url, resource_tiles_url = resource_tiles_url, control_tiles_url = control_tiles_url, full_game_id = full_game_id)
 
 # GENERATE NATION SHEET PAGES
 @main.route('/<full_game_id>/player<int:player_id>')
+@cached_game_page
 def player_route(full_game_id, player_id):
     page_title = f"Player #{player_id} Nation Sheet"
     player_information_dict = site_functions.get_data_for_nation_sheet(full_game_id, str(player_id))
@@ -482,17 +375,16 @@ def player_route(full_game_id, player_id):
 
 # WARS PAGE
 @main.route('/<full_game_id>/wars')
+@cached_game_page
 def wars(full_game_id):
     
+    from app.game.game_state import GameState
     from app.nation.nations import Nations
-    from app.alliance.alliances import Alliances
     from app.war.wars import Wars
 
     game = Games.load(full_game_id)
     
-    Nations.load(full_game_id)
-    Alliances.load(full_game_id)
-    Wars.load(full_game_id)
+    GameState.load(full_game_id)
     
     page_title = f"{game.name} Wars List"
     
@@ -631,6 +523,7 @@ def wars(full_game_id):
 
 # RESEARCH PAGE
 @main.route('/<full_game_id>/technologies')
+@cached_game_page
 def technologies(full_game_id):
 
     from app.nation.nations import Nations
@@ -710,6 +603,7 @@ def technologies(full_game_id):
 
 # AGENDAS PAGE
 @main.route('/<full_game_id>/agendas')
+@cached_game_page
 def agendas(full_game_id):
     
     from app.nation.nations import Nations
@@ -780,6 +674,7 @@ def agendas(full_game_id):
 
 # UNITS REF PAGE
 @main.route('/<full_game_id>/units')
+@cached_game_page
 def units_ref(full_game_id):
 
     SD.load(full_game_id)
@@ -809,6 +704,7 @@ def units_ref(full_game_id):
 
 # IMPROVEMENTS REF PAGE
 @main.route('/<full_game_id>/improvements')
+@cached_game_page
 def improvements_ref(full_game_id):
 
     # Improvement Colors:
@@ -854,6 +750,7 @@ def improvements_ref(full_game_id):
 
 # RESOURCE MARKET PAGE
 @main.route('/<full_game_id>/resource_market')
+@cached_game_page
 def resource_market(full_game_id):
 
     SD.load(full_game_id)
@@ -919,9 +816,11 @@ def resource_market(full_game_id):
 
 # ANNOUNCEMENT PAGE
 @main.route('/<full_game_id>/announcements')
+@cached_game_page
 def announcements(full_game_id):
 
     from app.alliance.alliances import Alliances
+    from app.game.game_state import GameState
     from app.nation.nations import Nations, LeaderboardRecordNames
     from app.notifications import Notifications
     from app.truce.truces import Truces
@@ -999,11 +898,7 @@ def announcements(full_game_id):
         return statistics_string
 
     game = Games.load(full_game_id)
-    Alliances.load(full_game_id)
-    Nations.load(full_game_id)
-    Notifications.load(full_game_id)
-    Truces.load(full_game_id)
-    Wars.load(full_game_id)
+    GameState.load(full_game_id)
 
     # page title and date
     page_title = f"{game.name} - Announcements Page"
@@ -1058,16 +953,17 @@ def announcements(full_game_id):
 
 # ALLIANCE PAGE
 @main.route('/<full_game_id>/alliances')
+@cached_game_page
 def alliances(full_game_id):
 
     from app.alliance.alliances import Alliances
+    from app.game.game_state import GameState
     from app.nation.nations import Nations
 
     SD.load(full_game_id)
     game = Games.load(full_game_id)
 
-    Alliances.load(full_game_id)
-    Nations.load(full_game_id)
+    GameState.load(full_game_id)
     page_title = f"{game.name} - Alliance Page"
 
     alliance_dict_filtered = {}
@@ -1127,14 +1023,19 @@ def get_mainmap(full_game_id):
     game = Games.load(full_game_id)
     map_str = game.get_map_string()
     if game.status == GameStatus.REGION_SELECTION:
-        filepath = f"..\\app\\static\\images\\map_images\\{map_str}\\blank.png"
+        filepath = f"../app/static/images/map_images/{map_str}/blank.png"
+        return send_file(filepath, mimetype='image/png')
     elif game.status == GameStatus.NATION_SETUP:
-        filepath = f"..\\gamedata\\{full_game_id}\\images\\0.png"
+        turn = 0
     elif game.status == GameStatus.ACTIVE_PENDING_EVENT:
-        filepath = f"..\\gamedata\\{full_game_id}\\images\\{game.turn}.png"
+        turn = game.turn
     else:
-        filepath = f"..\\gamedata\\{full_game_id}\\images\\{game.turn - 1}.png"
-    return send_file(filepath, mimetype='image/png')
+        turn = game.turn - 1
+    # maps are drawn in the background so serve the most recent map until this turn's map is ready
+    for map_turn in range(turn, -1, -1):
+        if os.path.exists(f"gamedata/{full_game_id}/images/{map_turn}.png"):
+            return send_file(f"../gamedata/{full_game_id}/images/{map_turn}.png", mimetype='image/png')
+    return jsonify(MapRenderer.status(full_game_id)), 202
 @main.route('/<full_game_id>/resourcemap.png')
 def get_resourcemap(full_game_id):
     filepath = f'../gamedata/{full_game_id}/images/resourcemap.png'
@@ -1144,27 +1045,61 @@ def get_controlmap(full_game_id):
     filepath = f'../gamedata/{full_game_id}/images/controlmap.png'
     return send_file(filepath, mimetype='image/png')
 
+@main.route('/<full_game_id>/<any(mainmap, resourcemap, controlmap):map_name>/preview.png')
+def get_map_preview(full_game_id, map_name):
+    Games.load(full_game_id)
+    map_tiles = MapTiles(full_game_id, map_name)
+    if not os.path.exists(map_tiles.preview_filepath):
+        return redirect(url_for(f"main.get_{map_name}", full_game_id=full_game_id))
+    return _send_map_file(map_tiles.preview_filepath)
+@main.route('/<full_game_id>/<any(mainmap, resourcemap, controlmap):map_name>/tiles.json')
+def get_map_tiles_metadata(full_game_id, map_name):
+    Games.load(full_game_id)
+    metadata = MapTiles(full_game_id, map_name).metadata()
+    if metadata is None:
+        return jsonify(MapRenderer.status(full_game_id)), 202
+    return jsonify(metadata)
+@main.route('/<full_game_id>/<any(mainmap, resourcemap, controlmap):map_name>/tiles/<int:zoom>/<int:x>/<int:y>.png')
+def get_map_tile(full_game_id, map_name, zoom, x, y):
+    Games.load(full_game_id)
+    filepath = MapTiles(full_game_id, map_name).tile_filepath(zoom, x, y)
+    if not os.path.exists(filepath):
+        return "Tile not found.", 404
+    return _send_map_file(filepath)
+
+def _send_map_file(filepath: str):
+    # tiles keep the same url between turns so browsers must check the ETag before reusing a cached copy
+    response = send_file(f"../{filepath}", mimetype='image/png', etag=True, conditional=True, max_age=MAP_TILE_MAX_AGE)
+    response.cache_control.public = True
+    response.cache_control.must_revalidate = True
+    return response
+
+@main.route('/<full_game_id>/render_status')
+def get_render_status(full_game_id):
+    Games.load(full_game_id)
+    return jsonify(MapRenderer.status(full_game_id))
+
 # TURN RESOLUTION
 @main.route('/<full_game_id>/resolve', methods=['POST'])
 def turn_resolution_new(full_game_id):
 
-    from app.alliance.alliances import Alliances
+    from app.game.game_state import GameState
     from app.region.regions import Regions
     from app.nation.nations import Nations
     from app.notifications import Notifications
-    from app.truce.truces import Truces
-    from app.war.wars import Wars
     from app import events
 
     game = Games.load(full_game_id)
     SD.load(full_game_id)
+    journal = None
 
     match game.status:
 
         case GameStatus.REGION_SELECTION:
             
-            Nations.load(full_game_id)
+            GameState.load(full_game_id)
             Regions.initialize(full_game_id)
+            journal = TurnJournal(full_game_id)
 
             contents_dict = {}
             for nation in Nations:
@@ -1174,17 +1109,16 @@ def turn_resolution_new(full_game_id):
             
             site_functions.resolve_stage1_processing(full_game_id, contents_dict)
             
-            Nations.save()
+            GameState.save()
             Regions.save()
             
             game.status = GameStatus.NATION_SETUP
             
         case GameStatus.NATION_SETUP:
             
-            Alliances.load(full_game_id)
-            Nations.load(full_game_id)
+            GameState.load(full_game_id)
             Regions.initialize(full_game_id)
-            Wars.load(full_game_id)
+            journal = TurnJournal(full_game_id)
 
             contents_dict = {}
             for nation in Nations:
@@ -1196,7 +1130,7 @@ def turn_resolution_new(full_game_id):
 
             site_functions.resolve_stage2_processing(full_game_id, contents_dict)
             
-            Nations.save()
+            GameState.save()
             
             game.set_startdate()
             game.turn += 1
@@ -1204,12 +1138,10 @@ def turn_resolution_new(full_game_id):
 
         case GameStatus.ACTIVE:
             
-            Alliances.load(full_game_id)
+            GameState.load(full_game_id)
             Regions.initialize(full_game_id)
-            Nations.load(full_game_id)
+            journal = TurnJournal(full_game_id)
             Notifications.initialize(full_game_id)
-            Truces.load(full_game_id)
-            Wars.load(full_game_id)
 
             contents_dict = {}
             for nation in Nations:
@@ -1225,31 +1157,21 @@ def turn_resolution_new(full_game_id):
 
             site_functions.resolve_turn_processing(full_game_id, contents_dict)
 
-            Alliances.save()
+            GameState.save()
             Regions.save()
-            Nations.save()
-            Notifications.save()
-            Truces.save()
-            Wars.save()
 
         case GameStatus.ACTIVE_PENDING_EVENT:
             
-            Alliances.load(full_game_id)
+            GameState.load(full_game_id)
             Regions.initialize(full_game_id)
-            Nations.load(full_game_id)
+            journal = TurnJournal(full_game_id)
             Notifications.initialize(full_game_id)
-            Truces.load(full_game_id)
-            Wars.load(full_game_id)
 
             events.resolve_current_event(full_game_id)
             site_functions.run_end_of_turn_checks(full_game_id, event_phase=True)
 
-            Alliances.save()
+            GameState.save()
             Regions.save()
-            Nations.save()
-            Notifications.save()
-            Truces.save()
-            Wars.save()
             
             game.turn += 1
             game.status = GameStatus.ACTIVE
@@ -1257,6 +1179,11 @@ def turn_resolution_new(full_game_id):
         case GameStatus.FINISHED:
             print(f"{game.name} has already finished. Turn resolution skipped.")
 
+    # record what changed in the game history so the turn can be inspected or rolled back later
+    if journal is not None:
+        journal.commit()
+
     Games.save()
+    GameSummaries.update(full_game_id)
 
     return redirect(f"/{full_game_id}")
\ No newline at end of file
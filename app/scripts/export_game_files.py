@@ -0,0 +1,20 @@
+import os
+import sys
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(parent_dir)
+os.chdir(parent_dir)
+
+from app import storage
+from app.region.regions import Regions
+
+GAME_ID = "game1"
+
+# game files are saved compactly, this writes readable copies to the export folder
+print(f"Exporting gamedata.json for game {GAME_ID}...")
+storage.export_pretty(f"gamedata/{GAME_ID}/gamedata.json", f"export/{GAME_ID}/gamedata.json")
+
+# regions are saved in several chunks, they are exported as a single file
+print(f"Exporting regdata.json for game {GAME_ID}...")
+Regions.initialize(GAME_ID)
+storage.save_json(f"export/{GAME_ID}/regdata.json", Regions._data, pretty=True)
\ No newline at end of file
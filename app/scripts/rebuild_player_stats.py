@@ -0,0 +1,11 @@
+import os
+import sys
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(parent_dir)
+os.chdir(parent_dir)
+
+from app.player_stats import PlayerStats
+
+print("Rebuilding player statistics from the game archive...")
+PlayerStats.rebuild()
\ No newline at end of file
@@ -0,0 +1,17 @@
+import os
+import sys
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(parent_dir)
+os.chdir(parent_dir)
+
+from app.game.turn_journal import TurnJournal
+
+GAME_ID = "game1"
+TURN = 1
+
+for entry in TurnJournal.entries(GAME_ID):
+    print(f"Entry {entry['entry']}: turn {entry['turn']}, status {entry['status']}, recorded {entry['recorded']}")
+
+print(f"Rolling back game {GAME_ID} to turn {TURN}...")
+TurnJournal.rollback(GAME_ID, TURN)
\ No newline at end of file
@@ -14,13 +14,16 @@ from app.checks import resolve_shortages
 from app.checks.update_income import UpdateIncomeProcess
 from app import events
 from app.map import GameMaps
+from app.map_render import MapRenderer
 from app import palette
+from app.player_stats import PlayerStats
 from app.game.games import Games
+from app.game.game_archive import GameArchive
 from app.game.game import GameStatus
+from app.game.game_state import GameState
 from app.scenario.scenario import ScenarioInterface as SD
 from app.alliance.alliances import Alliances
 from app.region.regions import Regions
-from app.nation.nation import Nation
 from app.nation.nations import Nations
 from app.notifications import Notifications
 from app.war.wars import Wars
@@ -72,7 +75,7 @@ def resolve_stage1_processing(game_id: str, contents_dict: dict) -> None:
             if not random_region.graph.is_start:
                 continue
             # check if there is a player within three regions
-            regions_in_radius = random_region.get_regions_in_radius(3)
+            regions_in_radius = Regions.within(random_region.id, 3)
             for candidate_region_id in regions_in_radius:
                 candidate_region = Regions.load(candidate_region_id)
                 # if player found restart loop
@@ -91,7 +94,7 @@ def resolve_stage1_processing(game_id: str, contents_dict: dict) -> None:
     maps = GameMaps(game_id)
     maps.populate_resource_map()
     maps.populate_main_map()
-    maps.update_all()
+    MapRenderer.submit(game_id)
 
 def resolve_stage2_processing(game_id: str, contents_dict: dict) -> None:
     """
@@ -221,9 +224,8 @@ def resolve_turn_processing(game_id: str, contents_dict: dict) -> None:
     # post-turn checks
     run_post_turn_checks(game_id, market_results)
 
-    # update game maps
-    maps = GameMaps(game_id)
-    maps.update_all()
+    # update game maps in the background
+    MapRenderer.submit(game_id)
 
 def run_end_of_turn_checks(game_id: str, *, event_phase = False) -> None:
     """
@@ -260,11 +262,8 @@ def run_post_turn_checks(game_id: str, market_results: dict) -> None:
         game.status = GameStatus.FINISHED
         game.updated_days_ellapsed()
 
-        with open("game_records.json", 'r') as json_file:
-            game_records_dict = json.load(json_file)
-
         # create game archive entry
-        game_records_dict[game_id] = {
+        game_record = {
             "Name": game.name,
             "Number": game.number,
             "Information": {
@@ -302,10 +301,10 @@ def run_post_turn_checks(game_id: str, market_results: dict) -> None:
             if nation.score == 3:
                 player_data_entry_dict["Victory"] = 1
             player_data_dict[nation.player_id] = player_data_entry_dict
-        game_records_dict[game_id]["Player Data"] = player_data_dict
+        game_record["Player Data"] = player_data_dict
 
-        with open("game_records.json", 'w') as json_file:
-            json.dump(game_records_dict, json_file, indent=4)
+        GameArchive.add(game_id, game_record)
+        PlayerStats.add_game(game_id, game_record)
     
     game = Games.load(game_id)
 
@@ -318,7 +317,7 @@ def run_post_turn_checks(game_id: str, market_results: dict) -> None:
             player_has_won = True
 
     if player_has_won:
-        resolve_win(game_id)
+        resolve_win()
 
     heals.heal_all()
     
@@ -350,16 +349,9 @@ def get_data_for_nation_sheet(game_id: str, player_id: str) -> dict:
         dict: player_information_dict.
     """
 
-    def fetch_color_class(income_str: str, nation: Nation) -> str:
-        for resource_name in nation._resources.keys():
-            if resource_name in income_str:
-                return resource_name.lower().replace(" ", "-")
-    
     SD.load(game_id)
 
-    Alliances.load(game_id)
-    Nations.load(game_id)
-    Wars.load(game_id)
+    GameState.load(game_id)
     nation = Nations.get(player_id)
 
     # build player info dict
@@ -399,9 +391,9 @@ def get_data_for_nation_sheet(game_id: str, player_id: str) -> dict:
             continue
         resource_data = {
             "Class": resource_name.lower().replace(" ", "-"),
-            "Stockpile": f"{nation.get_stockpile(resource_name)} / {nation.get_max(resource_name)}",
-            "Gross Income": nation.get_gross_income(resource_name),
-            "Net Income": nation.get_income(resource_name),
+            "Stockpile": f"{nation.get_stockpile(resource_name):.2f} / {nation.get_max(resource_name)}",
+            "Gross Income": f"{nation.get_gross_income(resource_name):.2f}",
+            "Net Income": f"{nation.get_income(resource_name):.2f}",
             "Income Rate": f"{nation.get_rate(resource_name)}%"
         }
         player_information_dict["Resource Data"][resource_name] = resource_data
@@ -444,26 +436,8 @@ def get_data_for_nation_sheet(game_id: str, player_id: str) -> dict:
     misc_data.append(("Agenda Count", nation.records.agenda_count[-1]))
     player_information_dict["Misc Info"] = misc_data
 
-    # format income details - I am aware this code sucks, however making it better would require updating the income calculation code which I do not want to do right now
-    income_details = {}
-    income_string_block_text = []
-    income_string_block_color = ""
-    for income_str in nation.income_details:
-        if income_str.startswith("<section> ") and income_string_block_text == []:
-            # for loop has just started - start first group
-            income_string_block_color = fetch_color_class(income_str, nation)
-            income_string_block_text.append(income_str[10:])
-        elif income_str.startswith("<section> ") and income_string_block_text != []:
-            # group ended - save and start new group
-            income_details[income_string_block_color] = income_string_block_text
-            income_string_block_text = []
-            income_string_block_color = fetch_color_class(income_str, nation)
-            income_string_block_text.append(income_str[10:])
-        else:
-            # add income string to its group
-            income_string_block_text.append(income_str)
-    income_details[income_string_block_color] = income_string_block_text
-    player_information_dict["Income Details"] = income_details
+    # format income details
+    player_information_dict["Income Details"] = nation.income_details.sections(list(nation._resources))
 
     # get tag data
     player_information_dict["Tag Data"] = {}
@@ -0,0 +1,66 @@
+/*
+ * Shows game maps from the tiles written by MapTiles instead of downloading the full resolution images.
+ *
+ * Maps are marked up as <img class="tiled-map" data-src="<full map url>" data-tiles="<tiles.json url>">.
+ * The downscaled preview is shown straight away and only the full resolution tiles in or near the visible part of the
+ * map frame are requested, as the frame is scrolled. Maps without tiles fall back to the full image.
+ */
+
+function showFullMap(img) {
+    img.src = img.dataset.src;
+}
+
+function buildTiledMap(img, metadata) {
+    const baseUrl = img.dataset.tiles.replace(/tiles\.json$/, "");
+    const frame = img.closest(".map-frame");
+    const tileSize = metadata.tileSize;
+
+    const tiledMap = document.createElement("div");
+    tiledMap.className = "tiled-map";
+    tiledMap.style.position = "relative";
+    tiledMap.style.width = `${metadata.width}px`;
+    tiledMap.style.height = `${metadata.height}px`;
+    tiledMap.style.backgroundImage = `url("${baseUrl}preview.png")`;
+    tiledMap.style.backgroundSize = "100% 100%";
+
+    const observer = new IntersectionObserver((entries) => {
+        for (const entry of entries) {
+            if (entry.isIntersecting) {
+                entry.target.src = entry.target.dataset.src;
+                observer.unobserve(entry.target);
+            }
+        }
+    }, {root: frame, rootMargin: `${tileSize}px`});
+
+    for (let x = 0; x * tileSize < metadata.width; x++) {
+        for (let y = 0; y * tileSize < metadata.height; y++) {
+            const tile = document.createElement("img");
+            tile.dataset.src = `${baseUrl}tiles/${metadata.maxZoom}/${x}/${y}.png`;
+            tile.style.position = "absolute";
+            tile.style.left = `${x * tileSize}px`;
+            tile.style.top = `${y * tileSize}px`;
+            tile.style.width = `${Math.min(tileSize, metadata.width - x * tileSize)}px`;
+            tile.style.height = `${Math.min(tileSize, metadata.height - y * tileSize)}px`;
+            tiledMap.appendChild(tile);
+            observer.observe(tile);
+        }
+    }
+
+    img.replaceWith(tiledMap);
+}
+
+function loadTiledMaps() {
+    for (const img of document.querySelectorAll("img.tiled-map")) {
+        if (!img.dataset.tiles) {
+            showFullMap(img);
+            continue;
+        }
+        // tiles.json answers 202 while the maps of a game have not been drawn yet
+        fetch(img.dataset.tiles)
+            .then((response) => response.status === 200 ? response.json() : Promise.reject())
+            .then((metadata) => buildTiledMap(img, metadata))
+            .catch(() => showFullMap(img));
+    }
+}
+
+document.addEventListener("DOMContentLoaded", loadTiledMaps);
\ No newline at end of file
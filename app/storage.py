@@ -0,0 +1,215 @@
+import json
+import os
+import tempfile
+import threading
+
+_state_version_lock = threading.Lock()
+
+# os.umask() can only be read by changing it, so it is read once here rather than while other threads may be creating files
+_umask = os.umask(0)
+os.umask(_umask)
+
+def _file_mode(filepath: str) -> int:
+    """
+    Returns the permissions a replacement for a file should have: those of the file itself, or the usual
+    permissions of a newly created file if it does not exist yet.
+    """
+    if os.path.exists(filepath):
+        return os.stat(filepath).st_mode & 0o777
+    return 0o666 & ~_umask
+
+def _create_temp_file(filepath: str) -> tuple[int, str]:
+    """
+    Creates the temporary file that replaces a file once it has been written.
+    mkstemp() only lets the owner read the file, so it is given the permissions of the file it replaces.
+    """
+    directory = os.path.dirname(filepath) or "."
+    fd, temp_filepath = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        os.fchmod(fd, _file_mode(filepath))
+    except BaseException:
+        os.close(fd)
+        os.remove(temp_filepath)
+        raise
+    return fd, temp_filepath
+
+def load_json(filepath: str) -> dict | list:
+    """
+    Reads a game file. Works for both compact and pretty-printed files.
+    """
+    with open(filepath, 'r') as json_file:
+        return json.load(json_file)
+
+def save_json(filepath: str, data: dict | list, *, pretty=False) -> None:
+    """
+    Writes a game file without ever leaving a partially written file behind.
+
+    Data is written to a temporary file in the same directory which then replaces the original in a single step.
+    If the process dies mid-write the original file is left untouched.
+
+    Params:
+        filepath (str): Path of the file to write.
+        data (dict | list): JSON serializable data.
+        pretty (bool): If True the file is indented for readability. Otherwise it is written compactly, which is much smaller and faster.
+    """
+
+    fd, temp_filepath = _create_temp_file(filepath)
+
+    try:
+        with os.fdopen(fd, 'w') as json_file:
+            if pretty:
+                json.dump(data, json_file, indent=4)
+            else:
+                json.dump(data, json_file, separators=(",", ":"))
+            json_file.flush()
+            os.fsync(json_file.fileno())
+        os.replace(temp_filepath, filepath)
+    except BaseException:
+        if os.path.exists(temp_filepath):
+            os.remove(temp_filepath)
+        raise
+
+def save_text(filepath: str, text: str) -> None:
+    """
+    Writes a text file such as a JSON lines index the same way save_json() writes game files.
+
+    Params:
+        filepath (str): Path of the file to write.
+        text (str): Full contents of the file.
+    """
+
+    fd, temp_filepath = _create_temp_file(filepath)
+
+    try:
+        with os.fdopen(fd, 'w') as text_file:
+            text_file.write(text)
+            text_file.flush()
+            os.fsync(text_file.fileno())
+        os.replace(temp_filepath, filepath)
+    except BaseException:
+        if os.path.exists(temp_filepath):
+            os.remove(temp_filepath)
+        raise
+
+def save_image(filepath: str, image, **params) -> None:
+    """
+    Writes a PIL image as a PNG file the same way save_json() writes game files, so a map that is being
+    served is only ever replaced by a complete image.
+
+    Params:
+        filepath (str): Path of the file to write.
+        image (Image): Image to save.
+        params: Extra options passed on to Image.save().
+    """
+
+    fd, temp_filepath = _create_temp_file(filepath)
+
+    try:
+        with os.fdopen(fd, 'wb') as image_file:
+            image.save(image_file, format="PNG", **params)
+            image_file.flush()
+            os.fsync(image_file.fileno())
+        os.replace(temp_filepath, filepath)
+    except BaseException:
+        if os.path.exists(temp_filepath):
+            os.remove(temp_filepath)
+        raise
+
+def append_line(filepath: str, line: str) -> None:
+    """
+    Appends one line to a log file such as a JSON lines index, creating the file if needed.
+
+    If an earlier append was interrupted partway the incomplete line is ended first so the new line stays readable.
+    """
+
+    prefix = ""
+    if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
+        with open(filepath, 'rb') as log_file:
+            log_file.seek(-1, os.SEEK_END)
+            if log_file.read(1) != b"\n":
+                prefix = "\n"
+
+    with open(filepath, 'a') as log_file:
+        log_file.write(prefix + line.rstrip("\n") + "\n")
+        log_file.flush()
+        os.fsync(log_file.fileno())
+
+def load_json_lines(filepath: str) -> list:
+    """
+    Reads a JSON lines file written with append_line(). Lines left incomplete by an interrupted append are skipped.
+    """
+
+    entries = []
+    with open(filepath, 'r') as log_file:
+        for line in log_file:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return entries
+
+def load_json_lines_after(filepath: str, offset: int, end: int = None) -> tuple[list, int]:
+    """
+    Reads the lines of a JSON lines file written with append_line() that were added after an earlier read.
+    A line that is still being appended is left for the next read.
+
+    Params:
+        filepath (str): Path of the file to read.
+        offset (int): Position returned by the previous read, or 0 to read from the start.
+        end (int): Optional position to stop reading at. Lines that end past it are left for the next read.
+
+    Returns:
+        tuple:
+            list: Entries of the lines that were read.
+            int: Position to pass to the next read.
+    """
+
+    if not os.path.exists(filepath):
+        return [], 0
+
+    with open(filepath, 'rb') as log_file:
+        size = log_file.seek(0, os.SEEK_END)
+        if offset > size:
+            offset = 0    # the file was replaced since the last read
+        end = size if end is None else min(max(end, offset), size)
+        log_file.seek(offset)
+        data = log_file.read(end - offset)
+
+    data = data[:data.rfind(b"\n") + 1]
+    entries = []
+    for line in data.splitlines():
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return entries, offset + len(data)
+
+def state_version_path(game_id: str) -> str:
+    return f"gamedata/{game_id}/state_version.json"
+
+def state_version(game_id: str) -> int:
+    """
+    Returns how many times the state of a game has been saved. Pages built from game state can be cached until it changes.
+    """
+    filepath = state_version_path(game_id)
+    if not os.path.exists(filepath):
+        return 0
+    return load_json(filepath)["version"]
+
+def bump_state_version(game_id: str) -> None:
+    """
+    Records that the state of a game has been saved. Called by every class that writes game files.
+    Does nothing if the game has no files yet.
+    """
+    filepath = state_version_path(game_id)
+    if not os.path.isdir(os.path.dirname(filepath)):
+        return
+    with _state_version_lock:
+        save_json(filepath, {"version": state_version(game_id) + 1})
+
+def export_pretty(filepath: str, export_filepath: str) -> None:
+    """
+    Writes an indented copy of a game file for manual inspection. The original file is not modified.
+    """
+    os.makedirs(os.path.dirname(export_filepath) or ".", exist_ok=True)
+    save_json(export_filepath, load_json(filepath), pretty=True)
\ No newline at end of file
@@ -3,6 +3,7 @@ import os
 from dataclasses import dataclass
 from typing import ClassVar, Iterator
 
+from app import storage
 from app.game.games import Games
 from .truce import Truce
 
@@ -37,7 +38,15 @@ class Truces(metaclass=TrucesMeta):
         with open(gamedata_path, 'r') as f:
             gamedata_dict = json.load(f)
 
-        cls._data = gamedata_dict["truces"]
+        cls.attach(game_id, gamedata_dict["truces"])
+
+    @classmethod
+    def attach(cls, game_id: str, data: dict) -> None:
+        """
+        Binds this class to truces data that has already been read from gamedata.json.
+        """
+        cls.game_id = game_id
+        cls._data = data
 
     @classmethod
     def save(cls) -> None:
@@ -46,12 +55,10 @@ class Truces(metaclass=TrucesMeta):
             raise RuntimeError("Error: Truces has not been loaded.")
         
         gamedata_filepath = f"gamedata/{cls.game_id}/gamedata.json"
-        with open(gamedata_filepath, 'r') as json_file:
-            gamedata_dict = json.load(json_file)
-
+        gamedata_dict = storage.load_json(gamedata_filepath)
         gamedata_dict["truces"] = cls._data
-        with open(gamedata_filepath, 'w') as json_file:
-            json.dump(gamedata_dict, json_file, indent=4)
+        storage.save_json(gamedata_filepath, gamedata_dict)
+        storage.bump_state_version(cls.game_id)
 
     @classmethod
     def create(cls, signatories: list[str], truce_length: int) -> None:
@@ -192,7 +192,7 @@ def energy_focus(nation: Nation) -> bool:
             "Streak": 0,
             "Expire Turn": 99999
         }
-        nation.tags["Energy Focus"] = new_tag
+        nation.add_tag("Energy Focus", new_tag)
 
     # reset streak if failed to meet minimum
     if float(nation.records.energy_income[-1]) < 24:
@@ -220,7 +220,7 @@ def industrial_focus(nation: Nation) -> bool:
             "Streak": 0,
             "Expire Turn": 99999
         }
-        nation.tags["Industrial Focus"] = new_tag
+        nation.add_tag("Industrial Focus", new_tag)
 
     # reset streak if failed to meet minimum
     if float(nation.records.industrial_income[-1]) < 50:
@@ -256,7 +256,7 @@ def monopoly(nation: Nation) -> bool:
         new_tag = {
             "Expire Turn": 99999
         }
-        nation.tags["Monopoly"] = new_tag
+        nation.add_tag("Monopoly", new_tag)
 
     # check resources
     for resource_name in nation._resources:
@@ -265,7 +265,7 @@ def monopoly(nation: Nation) -> bool:
             continue
         
         # check nation gross income of resource vs all other players
-        if any(float(nation.get_gross_income(resource_name)) <= float(temp.get_gross_income(resource_name)) for temp in Nations):
+        if any(nation.get_gross_income(resource_name) <= temp.get_gross_income(resource_name) for temp in Nations):
             if resource_name in nation.tags["Monopoly"]:
                 # reset streak if broken by deleting record
                 del nation.tags["Monopoly"][resource_name]
@@ -304,21 +304,19 @@ def nuclear_deterrent(nation: Nation) -> bool:
 
 def strong_research_agreement(nation: Nation) -> bool:
 
-    for alliance in Alliances:
-        if nation.name in alliance.current_members and alliance.type == "Research Agreement":
-            amount, resource_name = alliance.calculate_yield()
-            if amount >= 8:
-                return True
+    for alliance in Alliances.memberships(nation.name, "Research Agreement"):
+        amount, resource_name = alliance.calculate_yield()
+        if amount >= 8:
+            return True
 
     return False
 
 def strong_trade_agreement(nation: Nation) -> bool:
 
-    for alliance in Alliances:
-        if nation.name in alliance.current_members and alliance.type == "Trade Agreement":
-            amount, resource_name = alliance.calculate_yield()
-            if amount >= 24:
-                return True
+    for alliance in Alliances.memberships(nation.name, "Trade Agreement"):
+        amount, resource_name = alliance.calculate_yield()
+        if amount >= 24:
+            return True
 
     return False
 
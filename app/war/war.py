@@ -32,7 +32,9 @@ class War:
 
     @outcome.setter
     def outcome(self, outcome_str: str) -> None:
+        from .wars import Wars
         self._data["outcome"] = outcome_str
+        Wars.reindex()
 
     @property
     def combatants(self) -> dict:
@@ -86,7 +88,7 @@ class War:
         if war_justification_data.looser_penalties is not None:
             looser_nation = Nations.get(winner_combatant_data.target_id)
             war_justification_data.looser_penalties["Expire Turn"] = game.turn + war_justification_data.looser_penalty_duration + 1
-            looser_nation.tags[f"Defeated by {winner_nation} in {self.name}"] = war_justification_data.looser_penalties
+            looser_nation.add_tag(f"Defeated by {winner_nation} in {self.name}", war_justification_data.looser_penalties)
 
         if war_justification_data.winner_becomes_independent:
             winner_nation.status = "Independent Nation"
@@ -103,6 +105,8 @@ class War:
 
     def add_combatant(self, nation: Nation, role: str, target_id: str) -> None:
         
+        from .wars import Wars
+
         combatant_data = {
             "id": nation.id,
             "role": role,
@@ -119,6 +123,7 @@ class War:
         }
 
         self.combatants[nation.id] = combatant_data
+        Wars.index_combatant(self, nation.id)
 
     def get_combatant(self, nation_id: str) -> "Combatant":
         
@@ -181,7 +186,7 @@ class War:
 
                 manage_claims = ManageWarClaims(combatant.name, war_justification)
                 claim_cost, region_claims_list = manage_claims.get_war_claims()
-                if float(combatant_nation.get_stockpile("Political Power")) - claim_cost < 0:
+                if combatant_nation.get_stockpile("Political Power") - claim_cost < 0:
                     combatant_nation.action_log.append(f"Error: Not enough political power for war claims.")
                     continue
                 
@@ -356,7 +361,7 @@ class War:
         attacker_nation = Nations.get(attacker_id)
         defender_nation = Nations.get(defender_id)
         if "Foreign Interference" in attacker_nation.tags and attacker_nation.tags["Foreign Interference"]["Foreign Interference Target"] == defender_nation.name:
-            del attacker_nation.tags["Foreign Interference"]
+            attacker_nation.remove_tag("Foreign Interference")
             if outcome == "Attacker Victory":
                 attacker_nation.update_stockpile("Dollars", 50)
                 attacker_nation.update_stockpile("Research", 20)
@@ -4,6 +4,7 @@ import random
 from dataclasses import dataclass
 from typing import ClassVar, Iterator
 
+from app import storage
 from app.game.games import Games
 from app.nation.nation import Nation
 from .war import War
@@ -14,7 +15,7 @@ class WarsMeta(type):
     
     def __iter__(cls) -> Iterator[War]:
         for war_name in cls._data:
-            yield War(war_name, cls._data[war_name], cls.game_id)
+            yield cls.get(war_name)
 
     def __len__(cls):
         return len(cls._data)
@@ -24,6 +25,9 @@ class Wars(metaclass=WarsMeta):
     
     game_id: ClassVar[str] = None
     _data: ClassVar[dict[str, dict]] = None
+    _instances: ClassVar[dict[str, War]] = {}
+    _active_pairs: ClassVar[dict[frozenset, str]] = {}
+    _active_wars: ClassVar[dict[str, set[str]]] = {}
 
     @classmethod
     def _gamedata_path(cls) -> str:
@@ -41,7 +45,47 @@ class Wars(metaclass=WarsMeta):
         with open(gamedata_path, 'r') as f:
             gamedata_dict = json.load(f)
 
-        cls._data = gamedata_dict["wars"]
+        cls.attach(game_id, gamedata_dict["wars"])
+
+    @classmethod
+    def attach(cls, game_id: str, data: dict) -> None:
+        """
+        Binds this class to wars data that has already been read from gamedata.json.
+        """
+        cls.game_id = game_id
+        cls._data = data
+        cls._instances = {}
+        cls.reindex()
+
+    @classmethod
+    def reindex(cls) -> None:
+        """
+        Rebuilds the lookup tables of ongoing wars from scratch.
+
+        Called whenever a war ends, since another ongoing war may then become the war between a pair of nations.
+        """
+        cls._active_pairs = {}
+        cls._active_wars = {}
+        for war in cls:
+            for nation_id in war.combatants:
+                cls.index_combatant(war, nation_id)
+
+    @classmethod
+    def index_combatant(cls, war: War, nation_id: str) -> None:
+        """
+        Adds a combatant of an ongoing war to the lookup tables.
+
+        Params:
+            war (War): War the nation is fighting in.
+            nation_id (str): Nation ID of the combatant.
+        """
+        if war.outcome != "TBD":
+            return
+
+        for other_id in war.combatants:
+            if other_id != nation_id:
+                cls._active_pairs.setdefault(frozenset((nation_id, other_id)), war.name)
+        cls._active_wars.setdefault(nation_id, set()).add(war.name)
 
     @classmethod
     def save(cls) -> None:
@@ -50,12 +94,10 @@ class Wars(metaclass=WarsMeta):
             raise RuntimeError("Error: Wars has not been loaded.")
         
         gamedata_filepath = f"gamedata/{cls.game_id}/gamedata.json"
-        with open(gamedata_filepath, 'r') as json_file:
-            gamedata_dict = json.load(json_file)
-
+        gamedata_dict = storage.load_json(gamedata_filepath)
         gamedata_dict["wars"] = cls._data
-        with open(gamedata_filepath, 'w') as json_file:
-            json.dump(gamedata_dict, json_file, indent=4)
+        storage.save_json(gamedata_filepath, gamedata_dict)
+        storage.bump_state_version(cls.game_id)
 
     @classmethod
     def names(cls) -> list:
@@ -141,9 +183,16 @@ class Wars(metaclass=WarsMeta):
 
     @classmethod
     def get(cls, war_name: str) -> War:
-        if war_name in cls._data:
-            return War(war_name, cls._data[war_name], cls.game_id)
-        return None
+        
+        if war_name not in cls._data:
+            return None
+        
+        war = cls._instances.get(war_name)
+        if war is None:
+            war = War(war_name, cls._data[war_name], cls.game_id)
+            cls._instances[war_name] = war
+        
+        return war
 
     @classmethod
     def get_war_name(cls, nation1_id: str, nation2_id: str) -> str | None:
@@ -151,24 +200,27 @@ class Wars(metaclass=WarsMeta):
         if nation1_id == nation2_id:
             return None
 
-        for war in cls:
-            if war.outcome == "TBD" and nation1_id in war.combatants and nation2_id in war.combatants:
-                return war.name
-            
-        return None
+        return cls._active_pairs.get(frozenset((nation1_id, nation2_id)))
+
+    @classmethod
+    def get_active_wars(cls, nation_id: str) -> list[War]:
+        """
+        Returns all ongoing wars a nation is fighting in.
+        """
+        return [cls.get(war_name) for war_name in cls._active_wars.get(nation_id, ())]
 
     @classmethod
     def is_at_peace(cls, nation_id: str) -> bool:
-        for war in cls:
-            if war.outcome == "TBD" and nation_id in war.combatants:
-                return False
-        return True
+        return not cls._active_wars.get(nation_id)
 
     @classmethod
     def at_peace_for_x(cls, nation_id: str) -> int:
         
         game = Games.load(cls.game_id)
 
+        if not cls.is_at_peace(nation_id):
+            return 0
+
         last_at_war_turn = -1
         for war in cls:
             if nation_id not in war.combatants:
@@ -301,7 +301,7 @@ def resolve_peace_talk_actions(game_id: str, actions_list: list[HostPeaceTalksAc
                     nation.action_log.append(f"Failed to Host Peace Talks for Truce #{action.truce_id}. Truce has already expired.")
                     break
 
-                if float(nation.get_stockpile("Political Power")) - 5 < 0:
+                if nation.get_stockpile("Political Power") - 5 < 0:
                     nation.action_log.append(f"Failed to Host Peace Talks for Truce #{action.truce_id}. Insufficient political power.")
                     break
 
@@ -330,7 +330,7 @@ def resolve_cure_research_actions(game_id: str, actions_list: list[CureResearchA
             nation.action_log.append(f"{action.action_str} failed. Corresponding event is not active.")
             continue
 
-        if float(nation.get_stockpile("Research")) - action.amount < 0:
+        if nation.get_stockpile("Research") - action.amount < 0:
             nation.action_log.append(f"Failed to spend {action.amount} technology on Cure Research. Insufficient technology.")
             continue
 
@@ -359,7 +359,7 @@ def resolve_cure_fundraise_actions(game_id: str, actions_list: list[CureFundrais
             nation.action_log.append(f"{action.action_str} failed. Corresponding event is not active.")
             continue
 
-        if float(nation.get_stockpile("Dollars")) - action.amount< 0:
+        if nation.get_stockpile("Dollars") - action.amount< 0:
             nation.action_log.append(f"Failed to spend {action.amount} dollars on Fundraise. Insufficient dollars.")
             continue
 
@@ -381,7 +381,7 @@ def resolve_inspect_region_actions(game_id: str, actions_list: list[InspectRegio
             nation.action_log.append(f"{action.action_str} failed. Corresponding event is not active.")
             continue
         
-        if float(nation.get_stockpile("Dollars")) - 5 < 0:
+        if nation.get_stockpile("Dollars") - 5 < 0:
             nation.action_log.append(f"Failed to Inspect {action.target_region}. Insufficient dollars.")
             continue
 
@@ -402,7 +402,7 @@ def resolve_quarantine_create_actions(game_id: str, actions_list: list[Quarantin
             continue
 
         
-        if float(nation.get_stockpile("Political Power")) - 1 < 0:
+        if nation.get_stockpile("Political Power") - 1 < 0:
             nation.action_log.append(f"Failed to quarantine {action.target_region}. Insufficient political power.")
             continue
 
@@ -423,7 +423,7 @@ def resolve_quarantine_end_actions(game_id: str, actions_list: list[QuarantineEn
             nation.action_log.append(f"{action.action_str} failed. Corresponding event is not active.")
             continue
 
-        if float(nation.get_stockpile("Political Power")) - 1 < 0:
+        if nation.get_stockpile("Political Power") - 1 < 0:
             nation.action_log.append(f"Failed to end quarantine {action.target_region}. Insufficient political power.")
             continue
 
@@ -451,7 +451,7 @@ def resolve_open_borders_actions(game_id: str, actions_list: list[BordersOpenAct
             nation.action_log.append(f"{action.action_str} failed. Corresponding event is not active.")
             continue
 
-        if float(nation.get_stockpile("Political Power")) - 10 < 0:
+        if nation.get_stockpile("Political Power") - 10 < 0:
             nation.action_log.append(f"Failed to do Open Borders action. Insufficient political power.")
             continue
         
@@ -480,7 +480,7 @@ def resolve_close_borders_actions(game_id: str, actions_list: list[BordersCloseA
             nation.action_log.append(f"{action.action_str} failed. Corresponding event is not active.")
             continue
 
-        if float(nation.get_stockpile("Political Power")) - 10 < 0:
+        if nation.get_stockpile("Political Power") - 10 < 0:
             nation.action_log.append(f"Failed to do Close Borders action. Insufficient political power.")
             continue
         
@@ -513,7 +513,7 @@ def resolve_outsource_technology_actions(game_id: str, actions_list: list[Outsou
             nation.action_log.append(f"Failed to do Outsource Technology action. You do not have the prerequisite for {action.research_name}.")
             continue
 
-        if float(nation.get_stockpile("Political Power")) -10 < 0:
+        if nation.get_stockpile("Political Power") -10 < 0:
             nation.action_log.append(f"Failed to do Outsource Technology action. Insufficient political power.")
             continue
         
@@ -534,7 +534,7 @@ def resolve_military_reinforcements_actions(game_id: str, actions_list: list[Mil
             nation.action_log.append(f"Failed to do Military Reinforcements. You are not the collaborator.")
             continue
         
-        if float(nation.get_stockpile("Political Power")) -10 < 0:
+        if nation.get_stockpile("Political Power") -10 < 0:
             nation.action_log.append(f"Failed to do Military Reinforcements. Insufficient political power.")
             continue
 
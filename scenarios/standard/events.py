@@ -97,7 +97,7 @@ class Event:
                 vote_count = int(decision_data[0])
                 target_name = " ".join(decision_data[1:])
 
-                if vote_count > float(nation.get_stockpile("Political Power")):
+                if vote_count > nation.get_stockpile("Political Power"):
                     continue
                 try:
                     target_nation = Nations.get(target_name)
@@ -134,7 +134,7 @@ class Event:
                 vote_count = int(decision_data[0])
                 option_name = " ".join(decision_data[1:])
 
-                if vote_count > float(nation.get_stockpile("Political Power")):
+                if vote_count > nation.get_stockpile("Political Power"):
                     continue
                 if option_name not in self.choices:
                     continue
@@ -207,7 +207,7 @@ class Assassination(Event):
                     "Combat Roll Bonus": scapegoat.id,
                     "Expire Turn": self.game.turn + self.duration + 1
                 }
-                nation.tags["Assassination Scapegoat"] = new_tag
+                nation.add_tag("Assassination Scapegoat", new_tag)
                 self.state = 1
                 self.expire_turn = self.game.turn + self.duration + 1
     
@@ -231,7 +231,7 @@ class CorruptionScandal(Event):
             "Political Power Rate": -20,
             "Expire Turn": self.game.turn + self.duration + 1
         }
-        victim_nation.tags["Corruption Scandal"] = new_tag
+        victim_nation.add_tag("Corruption Scandal", new_tag)
 
         self.state = 1
         self.expire_turn = self.game.turn + self.duration + 1
@@ -401,7 +401,7 @@ class DiplomaticSummit(Event):
             }
             for attendee_id in summit_attendance_list:
                 new_tag[f"Cannot Declare War On #{attendee_id}"] = True
-            nation.tags["Summit"] = new_tag
+            nation.add_tag("Summit", new_tag)
         
         self.state = 1
         self.expire_turn = self.game.turn + self.duration + 1
@@ -476,7 +476,7 @@ class ForeignInterference(Event):
                     if resource_name in ["Political Power", "Military Capacity"]:
                         continue
                     new_tag[f"{resource_name} Rate"] = 10
-                nation.tags["Foreign Interference"] = new_tag
+                nation.add_tag("Foreign Interference", new_tag)
             
             elif decision == "Decline":
                 nation.update_stockpile("Political Power", 5)
@@ -574,7 +574,7 @@ class SecurityBreach(Event):
             "Research Rate": -20,
             "Expire Turn": self.game.turn + self.duration + 1
         }
-        victim_nation.tags["Security Breach"] = new_tag
+        victim_nation.add_tag("Security Breach", new_tag)
         
         self.state = 1
         self.expire_turn = self.game.turn + self.duration + 1
@@ -638,7 +638,7 @@ class ObserverStatusInvitation(Event):
                     "Political Power Income": 0.5,
                     "Expire Turn": 99999
                 }
-                nation.tags["Observer Status"] = new_tag
+                nation.add_tag("Observer Status", new_tag)
             
             elif decision == "Decline":
                 valid_research = False
@@ -755,7 +755,7 @@ class ShiftingAttitudes(Event):
                     "Political Power Rate": -20,
                     "Expire Turn": self.game.turn + self.duration + 1
                 }
-                nation.tags["Shifting Attitudes"] = new_tag
+                nation.add_tag("Shifting Attitudes", new_tag)
                 valid_research = False
                 while not valid_research:
                     research_name = input(f"Enter {nation.name} technology decision: ")
@@ -804,7 +804,7 @@ class WidespreadCivilDisorder(Event):
             new_tag = {
                 "Expire Turn": self.game.turn + self.duration + 1
             }
-            nation.tags["Civil Disorder"] = new_tag
+            nation.add_tag("Civil Disorder", new_tag)
 
         self.state = 1
         self.expire_turn = self.game.turn + self.duration + 1
@@ -844,7 +844,7 @@ class Embargo(Event):
         new_tag = {
             "Expire Turn": self.game.turn + self.duration + 1
         }
-        nation.tags["Embargo"] = new_tag
+        nation.add_tag("Embargo", new_tag)
         
         Notifications.add(f"Having received {self.vote_tally[nation_name]} votes, {nation_name} has been embargoed", 3)
         
@@ -883,7 +883,7 @@ class Humiliation(Event):
             "No Agenda Research": True,
             "Expire Turn": self.game.turn + self.duration + 1
         }
-        nation.tags["Humiliation"] = new_tag
+        nation.add_tag("Humiliation", new_tag)
         
         Notifications.add(f"Having received {self.vote_tally[nation_name]} votes, {nation_name} has been humiliated.", 3)
 
@@ -922,7 +922,7 @@ class ForeignInvestment(Event):
             "Market Buy Modifier": 0.2,
             "Expire Turn": self.game.turn + self.duration + 1
         }
-        nation.tags["Foreign Investment"] = new_tag
+        nation.add_tag("Foreign Investment", new_tag)
         
         Notifications.add(f"Having received {self.vote_tally[nation_name]} votes, {nation_name} has recieved the foreign investment.", 3)
 
@@ -962,7 +962,7 @@ class NominateMediator(Event):
             "Truces Extended": [],
             "Expire Turn": self.game.turn + self.duration + 1
         }
-        nation.tags["Mediator"] = new_tag
+        nation.add_tag("Mediator", new_tag)
 
         Notifications.add(f"Having received {self.vote_tally[nation_name]} votes, {nation_name} has been elected Mediator.", 3)
 
@@ -1003,7 +1003,7 @@ class SharedFate(Event):
                     "Alliance Limit Modifier": 1,
                     "Expire Turn": 99999
                 }
-                nation.tags["Shared Fate"] = new_tag
+                nation.add_tag("Shared Fate", new_tag)
             Notifications.add(f"Cooperation won in a {self.vote_tally.get("Cooperation")} - {self.vote_tally.get("Conflict")} decision.", 3)
 
         elif option_name == "Conflict":
@@ -1016,7 +1016,7 @@ class SharedFate(Event):
                     },
                     "Expire Turn": 99999
                 }
-                nation.tags["Shared Fate"] = new_tag
+                nation.add_tag("Shared Fate", new_tag)
             Notifications.add(f"Conflict won in a {self.vote_tally.get("Conflict")} - {self.vote_tally.get("Cooperation")} decision.", 3)
 
         self.state = 1
@@ -1055,7 +1055,7 @@ class ThreatContainment(Event):
             "Trade Fee Modifier": -1,
             "Expire Turn": self.game.turn + self.duration + 1
         }
-        nation.tags["Threat Containment"] = new_tag
+        nation.add_tag("Threat Containment", new_tag)
 
         Notifications.add(f"Having received {self.vote_tally[nation_name]} votes, {nation_name} has been sanctioned.", 3)
 
@@ -1483,7 +1483,7 @@ class FaustianBargain(Event):
         for resource_name in nation._resources:
             if resource_name not in ["Political Power", "Military Capacity"]:
                 new_tag[f"{resource_name} Rate"] = 20
-        nation.tags["Faustian Bargain"] = new_tag
+        nation.add_tag("Faustian Bargain", new_tag)
 
         for alliance in Alliances:
             if nation.name in alliance.current_members:
@@ -1503,7 +1503,7 @@ class FaustianBargain(Event):
         
         # check if collaborator has been defeated (no capital)
         if nation.improvement_counts["Capital"] == 0:
-            del nation.tags["Faustian Bargain"]
+            nation.remove_tag("Faustian Bargain")
             self.state = 0
             Notifications.add(f"{self.name} event has ended.", 3)
             return
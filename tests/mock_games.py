@@ -30,5 +30,9 @@ class GamesMock:
     def load(cls, game_id):
         return Game(game_id, cls._data[game_id])
 
+    @classmethod
+    def attach(cls, game_id, data):
+        cls._data[game_id] = data
+
 fake_games_module.Games = GamesMock
 sys.modules["app.game.games"] = fake_games_module
\ No newline at end of file
@@ -110,17 +110,17 @@ class TestBuild(unittest.TestCase):
         assert f"Built {IMPROVEMENT_NAME} in region {REGION_ID} for 5.0 basic materials." in nation.action_log
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "45.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 45.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_complex(self):
         """
@@ -159,17 +159,17 @@ class TestBuild(unittest.TestCase):
         assert f"Built {IMPROVEMENT_NAME} in region {REGION_ID} for 5.0 advanced metals." in nation.action_log
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "45.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 45.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_bad_region(self):
         """
@@ -342,17 +342,17 @@ class TestBuild(unittest.TestCase):
         assert f"Failed to build {IMPROVEMENT_NAME} in region {REGION_ID}. Insufficient resources." in nation.action_log
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "4.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 4.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_blocked_by_capital(self):
         """
@@ -100,17 +100,17 @@ class TestRegionClaim(unittest.TestCase):
         # check nation
         nation = Nations.get("1")
         assert f"Claimed region {REGION_ID} for 5.00 dollars." in nation.action_log
-        assert nation.get_stockpile("Dollars") == "95.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 95.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_consecutive(self):
         """
@@ -142,17 +142,17 @@ class TestRegionClaim(unittest.TestCase):
         assert f"Claimed region CHICA for 5.00 dollars." in nation.action_log
         assert f"Claimed region PEORI for 5.00 dollars." in nation.action_log
         assert f"Claimed region CHAMP for 5.00 dollars." in nation.action_log
-        assert nation.get_stockpile("Dollars") == "85.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 85.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_encirclement_rule(self):
         """
@@ -201,17 +201,17 @@ class TestRegionClaim(unittest.TestCase):
 
         # check nation
         nation = Nations.get("1")
-        assert nation.get_stockpile("Dollars") == "60.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 60.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_bad_region(self):
         """
@@ -238,17 +238,17 @@ class TestRegionClaim(unittest.TestCase):
         # check nation
         nation = Nations.get("1")
         assert f"Failed to claim {REGION_ID}. This region is already owned by another nation." in nation.action_log
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_blocked_by_shortage(self):
         """
@@ -278,17 +278,17 @@ class TestRegionClaim(unittest.TestCase):
 
         # check nation
         assert f"Failed to claim {REGION_ID}. Insufficient dollars." in nation.action_log
-        assert nation.get_stockpile("Dollars") == "0.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 0.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_blocked_by_adjacency(self):
         """
@@ -315,14 +315,14 @@ class TestRegionClaim(unittest.TestCase):
         # check nation
         nation = Nations.get("1")
         assert f"Failed to claim {REGION_ID}. Region is not adjacent to enough regions under your control." in nation.action_log
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
\ No newline at end of file
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
\ No newline at end of file
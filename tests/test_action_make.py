@@ -109,17 +109,17 @@ class TestMakeMissile(unittest.TestCase):
         assert f"Manufactured {MISSILE_QUANTITY} {MISSILE_NAME} for 3 common metals." in nation.action_log
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "47.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 47.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_make_nuclear(self):
         """
@@ -153,17 +153,17 @@ class TestMakeMissile(unittest.TestCase):
         assert f"Manufactured {MISSILE_QUANTITY} {MISSILE_NAME} for 6 advanced metals, 6 uranium and 6 rare earth elements." in nation.action_log
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "44.00"
-        assert nation.get_stockpile("Uranium") == "44.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "44.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 44.00
+        assert nation.get_stockpile("Uranium") == 44.00
+        assert nation.get_stockpile("Rare Earth Elements") == 44.00
 
     def test_bad_research(self):
         """
@@ -194,17 +194,17 @@ class TestMakeMissile(unittest.TestCase):
         assert f"Failed to make {MISSILE_QUANTITY} {MISSILE_NAME}. You do not have the required research." in nation.action_log
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
     
     def test_blocked_by_shortage(self):
         """
@@ -237,14 +237,14 @@ class TestMakeMissile(unittest.TestCase):
         assert f"Failed to make {MISSILE_QUANTITY} {MISSILE_NAME}. Insufficient resources." in nation.action_log
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "10.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
\ No newline at end of file
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 10.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
\ No newline at end of file
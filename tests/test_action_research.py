@@ -98,17 +98,17 @@ class TestResearch(unittest.TestCase):
         assert f"Researched {RESEARCH_NAME} for 5 technology." in nation.action_log
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "45.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 45.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_complex_tech(self):
         """
@@ -137,17 +137,17 @@ class TestResearch(unittest.TestCase):
         assert f"Researched Power Grid Restoration for 15 technology." in nation.action_log
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "20.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 20.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_simple_agenda(self):
         """
@@ -174,17 +174,17 @@ class TestResearch(unittest.TestCase):
         assert f"Researched {RESEARCH_NAME} for 10 political power." in nation.action_log
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "40.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 40.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_complex_agenda(self):
         """
@@ -216,17 +216,17 @@ class TestResearch(unittest.TestCase):
         assert "Researched Common Ground for 15 political power." in nation.action_log
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "15.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 15.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_bad_research(self):
         """
@@ -252,17 +252,17 @@ class TestResearch(unittest.TestCase):
         assert f"Failed to research {RESEARCH_NAME}. You do not have the prerequisite research." in nation.action_log
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_blocked_by_shortage(self):
         """
@@ -291,14 +291,14 @@ class TestResearch(unittest.TestCase):
         assert f"Failed to research {RESEARCH_NAME}. Not enough technology." in nation.action_log
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "5.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
\ No newline at end of file
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 5.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
\ No newline at end of file
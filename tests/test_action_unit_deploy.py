@@ -65,7 +65,7 @@ class TestDeployUnit(unittest.TestCase):
         # set nation data
         nation = Nations.get("3")
         assert nation.get_used_mc() == 6
-        nation._resources["Military Capacity"]["max"] = "100.00"    # force military capacity limit to be higher
+        nation._resources["Military Capacity"]["max"] = 100.0    # force military capacity limit to be higher
         assert nation.get_max_mc() == 100
         nation.update_stockpile("Dollars", 100)
         nation.update_stockpile("Political Power", 50)
@@ -126,17 +126,17 @@ class TestDeployUnit(unittest.TestCase):
         assert nation.get_used_mc() == 7
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "95.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "45.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 95.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 45.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_xp_transfer(self):
         """
@@ -188,17 +188,17 @@ class TestDeployUnit(unittest.TestCase):
         assert nation.get_used_mc() == 6
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "95.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "45.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 95.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 45.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_enemy_region(self):
         """
@@ -246,17 +246,17 @@ class TestDeployUnit(unittest.TestCase):
         assert nation.get_used_mc() == 6
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_bad_research(self):
         """
@@ -304,17 +304,17 @@ class TestDeployUnit(unittest.TestCase):
         assert nation.get_used_mc() == 6
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_blocked_by_capacity(self):
         """
@@ -345,7 +345,7 @@ class TestDeployUnit(unittest.TestCase):
 
         # configure nation
         nation = Nations.get("3")
-        nation._resources["Military Capacity"]["max"] = "6.00"
+        nation._resources["Military Capacity"]["max"] = 6.0
 
         # resolve deployment actions
         resolve_unit_deployment_actions(GAME_ID, [a1])
@@ -365,17 +365,17 @@ class TestDeployUnit(unittest.TestCase):
         assert nation.get_used_mc() == 6
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "50.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 50.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
 
     def test_blocked_by_shortage(self):
         """
@@ -426,14 +426,14 @@ class TestDeployUnit(unittest.TestCase):
         assert nation.get_used_mc() == 6
 
         # test resources
-        assert nation.get_stockpile("Dollars") == "100.00"
-        assert nation.get_stockpile("Political Power") == "50.00"
-        assert nation.get_stockpile("Research") == "50.00"
-        assert nation.get_stockpile("Food") == "50.00"
-        assert nation.get_stockpile("Coal") == "50.00"
-        assert nation.get_stockpile("Oil") == "50.00"
-        assert nation.get_stockpile("Basic Materials") == "0.00"
-        assert nation.get_stockpile("Common Metals") == "50.00"
-        assert nation.get_stockpile("Advanced Metals") == "50.00"
-        assert nation.get_stockpile("Uranium") == "50.00"
-        assert nation.get_stockpile("Rare Earth Elements") == "50.00"
\ No newline at end of file
+        assert nation.get_stockpile("Dollars") == 100.00
+        assert nation.get_stockpile("Political Power") == 50.00
+        assert nation.get_stockpile("Research") == 50.00
+        assert nation.get_stockpile("Food") == 50.00
+        assert nation.get_stockpile("Coal") == 50.00
+        assert nation.get_stockpile("Oil") == 50.00
+        assert nation.get_stockpile("Basic Materials") == 0.00
+        assert nation.get_stockpile("Common Metals") == 50.00
+        assert nation.get_stockpile("Advanced Metals") == 50.00
+        assert nation.get_stockpile("Uranium") == 50.00
+        assert nation.get_stockpile("Rare Earth Elements") == 50.00
\ No newline at end of file
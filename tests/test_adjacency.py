@@ -0,0 +1,114 @@
+"""
+File: test_adjacency.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests for the compiled map adjacency structure.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import base
+
+from app.region.adjacency import AdjacencyGraph
+
+GRAPH_FILE = "maps/united_states/graph.json"
+
+class TestAdjacencyGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.graph, self.adjacency = AdjacencyGraph.load(GRAPH_FILE)
+
+    def _radius(self, region_id: str, radius: int) -> set:
+        """
+        Plain breadth-first search over the raw graph data to compare against.
+        """
+        visited = {region_id}
+        frontier = {region_id}
+        for _ in range(radius):
+            next_frontier = set()
+            for temp_id in frontier:
+                region_graph = self.graph[temp_id]
+                for adj_id in region_graph.get("adjacencyMap", {}) | region_graph.get("seaRoutes", {}):
+                    if adj_id not in visited:
+                        next_frontier.add(adj_id)
+            visited |= next_frontier
+            frontier = next_frontier
+        return visited
+
+    def test_cached(self):
+        """
+        graph.json should only be compiled once.
+        """
+        graph, adjacency = AdjacencyGraph.load(GRAPH_FILE)
+        assert graph is self.graph
+        assert adjacency is self.adjacency
+
+    def test_adjacent(self):
+        """
+        Neighbours should match the land borders and sea routes in graph.json.
+        """
+        for region_id, region_graph in self.graph.items():
+            land_borders = region_graph.get("adjacencyMap", {})
+            sea_routes = region_graph.get("seaRoutes", {})
+            assert set(self.adjacency.adjacent(region_id)) == set(land_borders) | set(sea_routes)
+
+            i = self.adjacency.index[region_id]
+            for k in range(self.adjacency.offsets[i], self.adjacency.offsets[i + 1]):
+                adj_id = self.adjacency.ids[self.adjacency.neighbours[k]]
+                assert bool(self.adjacency.is_sea_route[k]) == (adj_id not in land_borders)
+
+    def test_within(self):
+        """
+        Radius queries should match a plain breadth-first search.
+        """
+        for region_id in list(self.graph)[::20]:
+            for radius in range(4):
+                assert self.adjacency.within(region_id, radius) == self._radius(region_id, radius)
+
+    def test_distance(self):
+        """
+        Hop distances should be symmetric and match radius queries.
+        """
+        region_id = list(self.graph)[0]
+        for adj_id in self.graph[region_id]["adjacencyMap"]:
+            assert self.adjacency.distance(region_id, adj_id) == 1
+            assert self.adjacency.distance(adj_id, region_id) == 1
+        assert self.adjacency.distance(region_id, region_id) == 0
+        for other_id in self.adjacency.within(region_id, 2) - self.adjacency.within(region_id, 1):
+            assert self.adjacency.distance(region_id, other_id) == 2
+
+    def test_saved_distances(self):
+        """
+        Distances should be saved next to graph.json and rebuilt if graph.json changes.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            graph_filepath = os.path.join(temp_dir, "graph.json")
+            distances_filepath = os.path.join(temp_dir, "distances.json")
+            shutil.copy(GRAPH_FILE, graph_filepath)
+
+            graph, adjacency = AdjacencyGraph.load(graph_filepath)
+            region_id = list(graph)[0]
+            expected = adjacency.within(region_id, 3)
+            assert os.path.exists(distances_filepath)
+
+            # saved distances are reused by a fresh graph
+            reloaded = AdjacencyGraph(graph, graph_filepath, adjacency.graph_hash)
+            assert reloaded.within(region_id, 3) == expected
+
+            # saved distances are ignored if they were built from a different graph.json
+            with open(distances_filepath, 'r') as f:
+                saved = json.load(f)
+            saved["distances"][0] = "00" * len(graph)
+            saved["graphHash"] = "outdated"
+            with open(distances_filepath, 'w') as f:
+                json.dump(saved, f)
+            rebuilt = AdjacencyGraph(graph, graph_filepath, adjacency.graph_hash)
+            assert rebuilt.within(region_id, 3) == expected
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
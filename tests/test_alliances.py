@@ -0,0 +1,88 @@
+"""
+File: test_alliances.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests for the alliance membership lookups in the Alliances class.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import base
+
+from app.scenario.scenario import ScenarioInterface as SD
+from app.alliance.alliances import Alliances
+from app.nation.nations import Nations
+from app.truce.truces import Truces
+
+GAME_ID = "HrQyxUeblAMjTJbTrxsp"
+GAMEDATA_FILE = "tests/mock-files/gamedata.json"
+
+class TestAlliances(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        SD.load(GAME_ID)
+
+    def setUp(self):
+        with patch.object(Alliances, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Alliances.load(GAME_ID)
+        with patch.object(Nations, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Nations.load(GAME_ID)
+        with patch.object(Truces, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Truces.load(GAME_ID)
+
+    def test_ended_alliance(self):
+        """
+        Members of an alliance that has ended should not be allied.
+        """
+        assert not Alliances.are_allied("Nation C", "Nation D")
+        assert Alliances.allies("Nation C") == []
+
+    def test_create(self):
+        """
+        Founding members of a new alliance should be allied with each other.
+        """
+        Alliances.create("Test Defense Pact", "Defense Pact", ["Nation C", "Nation D"])
+
+        assert Alliances.are_allied("Nation C", "Nation D")
+        assert Alliances.are_allied("Nation D", "Nation C")
+        assert not Alliances.are_allied("Nation A", "Nation C")
+        assert Alliances.allies("Nation C") == ["4"]
+        assert Alliances.allies("Nation C", "Defense Pact") == ["4"]
+        assert Alliances.allies("Nation C", "Trade Agreement") == []
+
+    def test_add_and_remove_member(self):
+        """
+        Alliance lookups should follow nations joining and leaving.
+        """
+        Alliances.create("Test Defense Pact", "Defense Pact", ["Nation C", "Nation D"])
+        alliance = Alliances.get("Test Defense Pact")
+
+        alliance.add_member("Nation B")
+        assert Alliances.are_allied("Nation B", "Nation C")
+        assert sorted(Alliances.allies("Nation C")) == ["2", "4"]
+
+        alliance.remove_member("Nation C")
+        assert not Alliances.are_allied("Nation B", "Nation C")
+        assert Alliances.are_allied("Nation B", "Nation D")
+        assert Alliances.allies("Nation C") == []
+
+    def test_shared_alliances(self):
+        """
+        Nations in two alliances together should stay allied until they share none.
+        """
+        Alliances.create("Test Defense Pact", "Defense Pact", ["Nation C", "Nation D"])
+        Alliances.create("Test Research Agreement", "Research Agreement", ["Nation C", "Nation D"])
+
+        Alliances.get("Test Defense Pact").end()
+        assert Alliances.are_allied("Nation C", "Nation D")
+        assert Alliances.allies("Nation C", "Defense Pact") == []
+        assert [alliance.name for alliance in Alliances.memberships("Nation C")] == ["Test Research Agreement"]
+
+        Alliances.get("Test Research Agreement").end()
+        assert not Alliances.are_allied("Nation C", "Nation D")
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+File: test_game_archive.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests for the per-game archive used by the archived games page.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import base
+
+from app.game.game_archive import GameArchive
+
+def game_record(name: str, number: int) -> dict:
+    return {"Name": name, "Number": number, "Statistics": {"Game End Turn": 20}, "Player Data": {}}
+
+class TestGameArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.legacy_file = os.path.join(self.temp_dir, "game_records.json")
+        self.patches = [
+            patch.object(GameArchive, "ARCHIVE_DIRECTORY", os.path.join(self.temp_dir, "game_records")),
+            patch.object(GameArchive, "LEGACY_FILEPATH", self.legacy_file),
+            patch.object(GameArchive, "PAGE_SIZE", 2),
+            patch.object(GameArchive, "_index_cache", None)
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def test_migrate_legacy_file(self):
+        records = {f"game{i}": game_record(f"Game {i}", i) for i in [2, 1, 3]}
+        with open(self.legacy_file, 'w') as f:
+            json.dump(records, f)
+
+        assert GameArchive.count() == 3
+        assert dict(GameArchive.items()) == records
+        assert [game_id for game_id, record in GameArchive.items()] == ["game1", "game2", "game3"]
+
+    def test_add(self):
+        GameArchive.add("game1", game_record("Alpha", 1))
+        GameArchive.add("game2", game_record("Bravo", 2))
+        assert [entry["id"] for entry in GameArchive.index()] == ["game2", "game1"]
+
+        # archiving a game again replaces its record without adding another index entry
+        GameArchive.add("game1", game_record("Alpha Renamed", 1))
+        assert GameArchive.count() == 2
+        assert GameArchive.load("game1")["Name"] == "Alpha Renamed"
+
+    def test_interrupted_append(self):
+        GameArchive.add("game1", game_record("Alpha", 1))
+        with open(GameArchive._index_path(), 'a') as f:
+            f.write('{"id":"gam')
+        assert [entry["id"] for entry in GameArchive.index()] == ["game1"]
+
+        GameArchive.add("game2", game_record("Bravo", 2))
+        assert [entry["id"] for entry in GameArchive.index()] == ["game2", "game1"]
+
+    def test_interrupted_add(self):
+        """
+        Archiving a game again after it failed before its index line was added must add the missing line.
+        """
+        with patch.object(GameArchive, "_index_line", side_effect=OSError):
+            with self.assertRaises(OSError):
+                GameArchive.add("game1", game_record("Alpha", 1))
+        assert GameArchive.count() == 0
+
+        GameArchive.add("game1", game_record("Alpha", 1))
+        assert [entry["id"] for entry in GameArchive.index()] == ["game1"]
+
+    def test_pages(self):
+        for i in range(1, 6):
+            GameArchive.add(f"game{i}", game_record(f"Game {i}", i))
+
+        records, page_count = GameArchive.page(1)
+        assert list(records) == ["game5", "game4"]
+        assert page_count == 3
+
+        records, page_count = GameArchive.page(3)
+        assert list(records) == ["game1"]
+
+        records, page_count = GameArchive.page(4)
+        assert records == {}
+
+        # only the records on the requested page are read
+        with patch.object(GameArchive, "load", wraps=GameArchive.load) as load:
+            GameArchive.page(2)
+        assert [call.args[0] for call in load.call_args_list] == ["game3", "game2"]
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
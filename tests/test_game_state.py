@@ -0,0 +1,71 @@
+"""
+File: test_game_state.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests that GameState shares a single read of gamedata.json with every dataclass and writes it back in one pass.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import base
+
+from app.scenario.scenario import ScenarioInterface as SD
+from app.alliance.alliances import Alliances
+from app.game.game_state import GameState
+from app.nation.nations import Nations
+from app.notifications import Notifications
+from app.truce.truces import Truces
+from app.war.wars import Wars
+
+GAME_ID = "HrQyxUeblAMjTJbTrxsp"
+GAMEDATA_FILE = "tests/mock-files/gamedata.json"
+
+class TestGameState(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        SD.load(GAME_ID)
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_file = os.path.join(self.temp_dir, "gamedata.json")
+        shutil.copy(GAMEDATA_FILE, self.temp_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_load_shares_data(self):
+        with patch.object(GameState, "_gamedata_path", return_value=self.temp_file):
+            GameState.load(GAME_ID)
+
+        assert Alliances._data is GameState._data["alliances"]
+        assert Nations._data is GameState._data["nations"]
+        assert Notifications._data is GameState._data["notifications"]
+        assert Truces._data is GameState._data["truces"]
+        assert Wars._data is GameState._data["wars"]
+        assert Nations.game_id == GAME_ID
+
+        alliance = Alliances.get("Test Trade Agreement")
+        assert alliance.type == "Trade Agreement"
+        assert Nations.get("1").name == "Nation A"
+
+    def test_save_single_pass(self):
+        with patch.object(GameState, "_gamedata_path", return_value=self.temp_file):
+            GameState.load(GAME_ID)
+            Nations.get("1").name = "Renamed Nation"
+            Notifications.initialize(GAME_ID)
+            Notifications.add("Test notification.", 1)
+            GameState.save()
+
+        with open(self.temp_file, 'r') as f:
+            gamedata_dict = json.load(f)
+
+        assert gamedata_dict["nations"]["1"]["nationName"] == "Renamed Nation"
+        assert gamedata_dict["notifications"] == [[1, "Test notification."]]
+        assert list(gamedata_dict.keys()) == ["alliances", "nations", "notifications", "truces", "wars"]
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+File: test_game_summaries.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests for the games page summaries that are saved at the end of each turn.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import base
+
+from app.scenario.scenario import ScenarioInterface as SD
+from app.game.game_summaries import GameSummaries
+from app.nation.nations import Nations
+
+GAME_ID = "HrQyxUeblAMjTJbTrxsp"
+GAMEDATA_FILE = "tests/mock-files/gamedata.json"
+
+class TestGameSummaries(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        SD.load(GAME_ID)
+
+    def setUp(self):
+        with patch.object(Nations, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Nations.load(GAME_ID)
+        self.temp_dir = tempfile.mkdtemp()
+        self.summary_path = os.path.join(self.temp_dir, "summary.json")
+        self.path_patch = patch.object(GameSummaries, "_summary_path", return_value=self.summary_path)
+        self.path_patch.start()
+        GameSummaries._cache.clear()
+
+    def tearDown(self):
+        self.path_patch.stop()
+        GameSummaries._cache.clear()
+        shutil.rmtree(self.temp_dir)
+
+    def test_build(self):
+        for nation_id, score in {"1": 0, "2": 2, "3": 0, "4": 1}.items():
+            Nations.get(nation_id).score = score
+        summary = GameSummaries.build(GAME_ID)
+
+        assert summary["title"] == f"""<a href="/{GAME_ID}">test</a>"""
+        assert summary["status"] == "Turn 33"
+        
+        # nations with a score come first, highest score first, then the rest by name
+        assert [row[0] for row in summary["playerdata"]] == ["Nation B", "Nation D", "Nation A", "Nation C"]
+        assert summary["playerdata"][2] == ["Nation A", 0, "Diplomatic - Republic", """<a href="profile/010">eve</a>""", "#0096ff", "#0096ff"]
+
+    def test_load_reads_saved_summary(self):
+        saved = GameSummaries.update(GAME_ID)
+        assert os.path.exists(self.summary_path)
+
+        # the games page must not need the nations of the game
+        with patch.object(Nations, "load", side_effect=AssertionError("nations loaded")), \
+             patch.object(GameSummaries, "build", side_effect=AssertionError("summary rebuilt")):
+            assert GameSummaries.load(GAME_ID) == saved
+            assert GameSummaries.load(GAME_ID) is GameSummaries.load(GAME_ID)
+
+    def test_load_missing_summary(self):
+        summary = GameSummaries.load(GAME_ID)
+        assert summary["status"] == "Turn 33"
+        assert os.path.exists(self.summary_path)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+File: test_improvement_yields.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests that ImprovementYields calculates the improvement yields recorded in tests/mock-files/improvement_yields.json.
+The recorded yields were calculated by the per region implementation ImprovementYields replaced and only list non-zero yields.
+"""
+
+import json
+import unittest
+from unittest.mock import patch
+
+import base
+
+from app.scenario.scenario import ScenarioInterface as SD
+from app.checks import economic_helpers
+from app.checks.improvement_yields import ImprovementYields
+from app.game.games import Games
+from app.nation.nations import Nations
+from app.region.regions import Regions
+
+GAME_ID = "HrQyxUeblAMjTJbTrxsp"
+GAMEDATA_FILE = "tests/mock-files/gamedata.json"
+REGDATA_FILE = "tests/mock-files/regdata.json"
+YIELDS_FILE = "tests/mock-files/improvement_yields.json"
+
+class TestImprovementYields(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        SD.load(GAME_ID)
+        with open(YIELDS_FILE, 'r') as json_file:
+            cls.expected_yields = json.load(json_file)
+
+    def setUp(self):
+        with patch.object(Regions, "_regdata_path", return_value=str(REGDATA_FILE)):
+            Regions.initialize(GAME_ID)
+        with patch.object(Nations, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Nations.load(GAME_ID)
+        self.active_events = Games._data[GAME_ID]["activeEvents"]
+
+    def tearDown(self):
+        Games._data[GAME_ID]["activeEvents"] = self.active_events
+
+    def assert_expected_yields(self, case: str):
+        yield_dicts = {nation.name: economic_helpers.create_player_yield_dict(nation) for nation in Nations}
+        improvement_yields = ImprovementYields(GAME_ID, yield_dicts)
+
+        calculated = {}
+        for region in Regions:
+            if region.data.owner_id in ["0", "99"] or region.improvement.name is None:
+                continue
+            nation = Nations.get(region.data.owner_id)
+            final_yields = improvement_yields.calculate(region, nation)
+            calculated[region.id] = {resource_name: amount for resource_name, amount in final_yields.items() if amount != 0}
+
+        assert calculated == self.expected_yields[case]
+
+    def test_default(self):
+        self.assert_expected_yields("default")
+
+    def test_modifiers(self):
+        """
+        Central Banks, capital boosts, tags, and capital resources should all be applied the same way.
+        """
+        nation = Nations.get("3")
+        nation.add_tag("Test Tag A", {
+            "Capital Boost": True,
+            "Improvement Income": {"Industrial Zone": {"Basic Materials": 1}, "Capital": {"Coal": 2}},
+            "Improvement Income Multiplier": {"Industrial Zone": {"Basic Materials": 0.1}}
+        })
+        nation.add_tag("Test Tag B", {
+            "Improvement Income Multiplier": {"Industrial Zone": {"Basic Materials": -0.35}, "Research Laboratory": {"Research": 0.15}}
+        })
+        nation.add_tech("Coal Mining")
+
+        central_banks = 0
+        for region in Regions:
+            if region.data.owner_id in ["3", "4"] and region.improvement.name == "Industrial Zone" and central_banks < 4:
+                region.improvement.set("Central Bank", starting_health=99)
+                Nations.get(region.data.owner_id).improvement_counts["Central Bank"] += 1
+                central_banks += 1
+            if region.improvement.name == "Capital":
+                region.data.resource = "Coal"
+
+        self.assert_expected_yields("modifiers")
+
+    def test_pandemic(self):
+        Games._data[GAME_ID]["activeEvents"] = {"Pandemic": {}}
+        for i, region in enumerate(Regions):
+            region.data.infection = i % 7
+            region.data.quarantine = i % 3 == 0
+
+        self.assert_expected_yields("pandemic")
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+File: test_income_breakdown.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests for recording and displaying where the income of a nation came from.
+"""
+
+import unittest
+
+import base
+
+from app.nation.income_breakdown import IncomeBreakdown
+
+RESOURCES = ["Dollars", "Political Power", "Research", "Food", "Coal", "Energy", "Military Capacity"]
+
+class TestIncomeBreakdown(unittest.TestCase):
+
+    def test_records(self):
+        income_details = IncomeBreakdown()
+        income_details.add("improvement", "Coal Mine", "Coal", 1.5)
+        income_details.add("improvement", "Coal Mine", "Coal", 1.4999999)
+        income_details.add("improvement", "Coal Mine", "Coal", 0.75)
+        income_details.add("upkeep", None, "Food", -2)
+
+        assert income_details.records() == [
+            ("improvement", "Coal Mine", "Coal", 1.5, 2),
+            ("improvement", "Coal Mine", "Coal", 0.75, 1),
+            ("upkeep", None, "Food", -2, 1)
+        ]
+        assert income_details.records("Food") == [("upkeep", None, "Food", -2, 1)]
+
+    def test_sections(self):
+        income_details = IncomeBreakdown()
+        for resource_name in RESOURCES:
+            income_details.set_total(resource_name, 0.0)
+        income_details.set_total("Coal", 3.75)
+        income_details.set_total("Political Power", 1.25)
+        income_details.add("improvement", "Coal Mine", "Coal", 1.5)
+        income_details.add("improvement", "Coal Mine", "Coal", 1.5)
+        income_details.add("improvement", "Research Facility", "Research", 2)
+        income_details.add("rate", None, "Coal", 0.75)
+        income_details.add("tag", "Embargo", "Coal", -1)
+        income_details.add("war", None, "Political Power", 0.5)
+        income_details.add("ranking", "from economic power", "Political Power", 0.25, first=True)
+        income_details.add("energy upkeep", None, "Energy", -1.25)
+
+        assert income_details.sections(RESOURCES) == {
+            "dollars": ["+0.00 Dollars"],
+            "political-power": ["+1.25 Political Power", "+0.25 from economic power", "+0.5 from winning a war"],
+            "research": ["+0.00 Research", "+2.00 from Research Facilities"],
+            "coal": ["+3.75 Coal", "+1.50 from Coal Mines [2x]", "+0.75 from income rate.", "-1.00 from Embargo."],
+            "energy": ["+0.00 Energy", "-1.25 from energy upkeep costs."],
+            "military-capacity": ["+0.00 Military Capacity"]
+        }
+
+    def test_legacy(self):
+        """
+        Income details saved as text by older versions should still be shown until they are replaced.
+        """
+        income_details = IncomeBreakdown(["<section> +1.00 Dollars", "+1.00 from Settlements", "<section> +0.00 Energy"])
+        assert income_details.records() == []
+        assert income_details.sections(RESOURCES) == {"dollars": ["+1.00 Dollars", "+1.00 from Settlements"], "energy": ["+0.00 Energy"]}
+
+        income_details.add("improvement", "Settlement", "Dollars", 1)
+        assert income_details.data == {"totals": {}, "records": [["improvement", "Settlement", "Dollars", 1, 1]]}
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
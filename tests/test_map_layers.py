@@ -0,0 +1,97 @@
+"""
+File: test_map_layers.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests for the region labels used to color map images.
+"""
+
+import random
+import tempfile
+import unittest
+
+import base
+
+from PIL import Image, ImageDraw
+
+from app.map_layers import RegionLabels
+
+CELL_SIZE = 5
+COLUMNS = 20
+ROWS = 15
+
+class TestRegionLabels(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Builds a grid of 300 regions separated by black borders, enough regions to need a second plane.
+        """
+        width = COLUMNS * CELL_SIZE + 1
+        height = ROWS * CELL_SIZE + 1
+        self.image = Image.new("RGBA", (width, height), (255, 255, 255, 255))
+        draw = ImageDraw.Draw(self.image)
+        for x in range(0, width, CELL_SIZE):
+            draw.line([(x, 0), (x, height - 1)], fill=(0, 0, 0, 255))
+        for y in range(0, height, CELL_SIZE):
+            draw.line([(0, y), (width - 1, y)], fill=(0, 0, 0, 255))
+
+        self.seeds = {}
+        for row in range(ROWS):
+            for column in range(COLUMNS):
+                self.seeds[f"R{row}-{column}"] = [(column * CELL_SIZE + 2, row * CELL_SIZE + 2)]
+
+        rng = random.Random(0)
+        self.colors = {}
+        for region_id in self.seeds:
+            if rng.random() < 0.7:
+                self.colors[region_id] = (rng.randint(1, 255), rng.randint(1, 255), rng.randint(1, 255), 255)
+
+    def _floodfill(self) -> Image.Image:
+        expected = self.image.copy()
+        for region_id, color in self.colors.items():
+            for coords in self.seeds[region_id]:
+                ImageDraw.floodfill(expected, coords, color, border=(0, 0, 0, 255))
+        return expected
+
+    def test_colorize(self):
+        """
+        Coloring with labels should match floodfilling each region.
+        """
+        labels = RegionLabels.build(self.image, self.seeds)
+        assert len(labels.planes) == 2
+
+        result = self.image.copy()
+        result.alpha_composite(labels.colorize(self.colors))
+        assert result.tobytes() == self._floodfill().tobytes()
+
+    def test_boxes(self):
+        """
+        Each region should know the area it covers.
+        """
+        labels = RegionLabels.build(self.image, self.seeds)
+        assert labels.boxes["R0-0"] == [1, 1, CELL_SIZE, CELL_SIZE]
+        assert labels.boxes["R2-3"] == [3 * CELL_SIZE + 1, 2 * CELL_SIZE + 1, 4 * CELL_SIZE, 3 * CELL_SIZE]
+
+    def test_colorize_box(self):
+        """
+        Coloring part of the map should match the same part of a full coloring.
+        """
+        labels = RegionLabels.build(self.image, self.seeds)
+        box = (12, 7, 63, 40)
+        assert labels.colorize(self.colors, box).tobytes() == labels.colorize(self.colors).crop(box).tobytes()
+
+    def test_save_and_load(self):
+        """
+        Labels should come back the same after being saved.
+        """
+        labels = RegionLabels.build(self.image, self.seeds)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            metadata = labels.save(temp_dir, "regions")
+            loaded = RegionLabels.load(temp_dir, "regions", metadata)
+
+        assert loaded.region_ids == labels.region_ids
+        assert loaded.boxes == labels.boxes
+        assert loaded.colorize(self.colors).tobytes() == labels.colorize(self.colors).tobytes()
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
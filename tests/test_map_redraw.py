@@ -0,0 +1,256 @@
+"""
+File: test_map_redraw.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests that redrawing only the changed parts of the maps gives the same images as drawing them from scratch.
+Map and sprite images are not stored in the repository so simple stand-ins are generated for the test.
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import base
+
+from PIL import Image, ImageDraw
+
+from app import storage
+from app.scenario.scenario import ScenarioInterface as SD
+from app.map import GameMaps
+from app.map_layers import MapLayers, SpriteAtlas
+from app.map_tiles import MapTiles
+from app.nation.nations import Nations
+from app.region.regions import Regions
+
+GAME_ID = "HrQyxUeblAMjTJbTrxsp"
+GAMEDATA_FILE = "tests/mock-files/gamedata.json"
+REGDATA_FILE = "tests/mock-files/regdata.json"
+MAP_SIZE = (5600, 3600)
+
+def create_test_images(directory: str) -> None:
+    """
+    Generates stand-in map layers and sprites. Every region seed gets its own small outlined box.
+    """
+
+    rng = random.Random(0)
+    
+    def sprite(filepath: str, size: tuple) -> None:
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        image = Image.new("RGBA", size, (rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255), 255))
+        ImageDraw.Draw(image).rectangle([0, 0, size[0] - 1, size[1] - 1], outline=(0, 0, 0, 255))
+        image.putpixel((size[0] // 2, size[1] // 2), (0, 0, 0, 0))
+        image.save(filepath)
+
+    resources = os.path.join(directory, "image_resources")
+    os.makedirs(resources)
+    main = Image.new("RGBA", MAP_SIZE, (255, 255, 255, 255))
+    magnified = Image.new("RGBA", MAP_SIZE, (0, 0, 0, 0))
+    draw_main = ImageDraw.Draw(main)
+    draw_magnified = ImageDraw.Draw(magnified)
+    for region in Regions:
+        seeds = [tuple(coords) for coords in region.graph.additional_region_coordinates]
+        if region.graph.improvement_coordinates is not None and not region.graph.is_magnified:
+            seeds.append((region.graph.improvement_coordinates[0] + 25, region.graph.improvement_coordinates[1] + 25))
+        for x, y in seeds:
+            draw_main.rectangle([x - 6, y - 6, x + 6, y + 6], outline=(0, 0, 0, 255))
+        if region.graph.is_magnified:
+            x, y = region.graph.improvement_coordinates
+            draw_magnified.rectangle([x + 10, y + 10, x + 90, y + 40], outline=(0, 0, 0, 255), fill=(255, 255, 255, 128), width=2)
+    main.save(os.path.join(resources, "main.png"))
+    magnified.save(os.path.join(resources, "magnified.png"))
+    Image.new("RGBA", MAP_SIZE, (40, 90, 160, 255)).save(os.path.join(resources, "background.png"))
+    text = Image.new("RGBA", MAP_SIZE, (0, 0, 0, 0))
+    ImageDraw.Draw(text).text((500, 500), "TEXT", fill=(0, 0, 0, 255))
+    text.save(os.path.join(resources, "text.png"))
+
+    sprites = os.path.join(directory, "sprites")
+    sprite(os.path.join(sprites, "nuke.png"), (50, 50))
+    for improvement_name, improvement_data in SD.improvements:
+        sprite(os.path.join(sprites, "improvements", f"{improvement_name.lower()}.png"), (50, 50))
+        for health in range(improvement_data.health + 1):
+            sprite(os.path.join(sprites, "health", f"{health}-{improvement_data.health}.png"), (74, 8))
+    for unit_name, unit_data in SD.units:
+        sprite(os.path.join(sprites, "units", f"{unit_name.lower()}.png"), (32, 24))
+    for name in ["back", "back_1", "back_2", "back_3"]:
+        sprite(os.path.join(sprites, "units", f"{name}.png"), (50, 50))
+    sprite(os.path.join(sprites, "units", "back_symb.png"), (32, 24))
+
+class TestMapRedraw(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        SD.load(GAME_ID)
+        with patch.object(Regions, "_regdata_path", return_value=str(REGDATA_FILE)):
+            Regions.initialize(GAME_ID)
+        cls.temp_dir = tempfile.mkdtemp()
+        create_test_images(cls.temp_dir)
+        cls.patches = [
+            patch.object(MapLayers, "_image_resources_path", return_value=os.path.join(cls.temp_dir, "image_resources")),
+            patch.object(GameMaps, "_sprite_images_path", return_value=os.path.join(cls.temp_dir, "sprites")),
+        ]
+        for p in cls.patches:
+            p.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        for p in cls.patches:
+            p.stop()
+        MapLayers._cache.clear()
+        SpriteAtlas._cache.clear()
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        with patch.object(Regions, "_regdata_path", return_value=str(REGDATA_FILE)):
+            Regions.initialize(GAME_ID)
+        with patch.object(Nations, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Nations.load(GAME_ID)
+        GameMaps._rasters.clear()
+        self.game_images = tempfile.mkdtemp()
+        self.images_patch = patch.object(GameMaps, "_game_images_path", return_value=self.game_images)
+        self.images_patch.start()
+
+    def tearDown(self):
+        self.images_patch.stop()
+        GameMaps._rasters.clear()
+        shutil.rmtree(self.game_images)
+
+    def _make_changes(self) -> set[str]:
+        region_ids = Regions.ids()
+        
+        changed = Regions.load(region_ids[10])
+        changed.data.owner_id = "1" if changed.data.owner_id != "1" else "2"
+        
+        changed = Regions.load(region_ids[40])
+        changed.unit.set("Infantry", "Test Infantry", 12, "2")
+        
+        changed = Regions.load(region_ids[80])
+        changed.improvement.set("Military Base")
+        changed.improvement.health = 1
+
+        changed = Regions.load(region_ids[120])
+        changed.data.fallout = 2
+
+        return {region_ids[10], region_ids[40], region_ids[80], region_ids[120]}
+
+    def _update(self, *, export=False) -> GameMaps:
+        """
+        Updates the maps. Writing the images is slow so it is skipped unless the test reads them back.
+        """
+        maps = GameMaps(GAME_ID)
+        if export:
+            maps.update_all()
+        else:
+            with patch.object(GameMaps, "export"):
+                maps.update_all()
+        return maps
+
+    def _full_render(self) -> GameMaps:
+        maps = GameMaps(GAME_ID)
+        maps.load_layers()
+        maps.render_all()
+        return maps
+
+    def _assert_same_maps(self, maps: GameMaps, expected: GameMaps) -> None:
+        assert maps.main_map.tobytes() == expected.main_map.tobytes()
+        assert maps.resource_map.tobytes() == expected.resource_map.tobytes()
+        assert maps.control_map.tobytes() == expected.control_map.tobytes()
+
+    def test_redraw(self):
+        """
+        Changed regions should be marked and redrawn, giving the same maps as a full render.
+        """
+        self._update()
+
+        changed_region_ids = self._make_changes()
+        assert Regions._redraws == changed_region_ids
+
+        with patch.object(GameMaps, "redraw", autospec=True, side_effect=GameMaps.redraw) as redraw:
+            maps = self._update()
+        assert redraw.called
+        self._assert_same_maps(maps, self._full_render())
+
+    def test_redraw_from_files(self):
+        """
+        Previous maps should be read back from disk if they are not cached.
+        """
+        self._update(export=True)
+        GameMaps._rasters.clear()
+        self._make_changes()
+
+        maps = self._update()
+        self._assert_same_maps(maps, self._full_render())
+
+    def test_deferred_redraw(self):
+        """
+        Changes saved without updating the maps should be redrawn by the next update.
+        """
+        self._update()
+        self._make_changes()
+        GameMaps.defer_redraw(GAME_ID, Regions.take_redraws())
+
+        maps = self._update()
+        self._assert_same_maps(maps, self._full_render())
+
+    def test_deferred_during_update(self):
+        """
+        Changes deferred while an update is drawing the maps should be redrawn by the next update.
+        """
+        self._update()
+        self._make_changes()
+        deferred = Regions.take_redraws()
+
+        redraw = GameMaps.redraw
+        def defer_while_drawing(maps, boxes):
+            GameMaps.defer_redraw(GAME_ID, deferred)
+            return redraw(maps, boxes)
+        with patch.object(GameMaps, "redraw", autospec=True, side_effect=defer_while_drawing):
+            self._update()
+        render_state = storage.load_json(os.path.join(self.game_images, "render_state.json"))
+        assert render_state["pendingOffset"] == 0
+
+        maps = self._update()
+        self._assert_same_maps(maps, self._full_render())
+        render_state = storage.load_json(os.path.join(self.game_images, "render_state.json"))
+        assert render_state["pendingOffset"] == GameMaps.pending_redraws_end(GAME_ID) > 0
+
+    def test_sprites_loaded_once(self):
+        """
+        Sprites and unit badges should be reused by later renders instead of being opened and drawn again.
+        """
+        self._make_changes()
+        self._full_render()
+        
+        with patch("app.map_layers.Image.open", side_effect=AssertionError("sprite opened again")), \
+             patch("app.map_layers.ImageDraw.floodfill", side_effect=AssertionError("badge drawn again")):
+            self._full_render()
+
+        sprites = SpriteAtlas.load(os.path.join(self.temp_dir, "sprites"))
+        badge = sprites.unit_badge("Infantry", 1, "#0096ff", "Test Infantry", "1-1-1")
+        assert sprites.unit_badge("Infantry", 1, "#0096ff", "Test Infantry", "1-1-1") is badge
+        assert sprites.unit_badge("Infantry", 1, "#5bb000", "Test Infantry", "1-1-1") is not badge
+
+    def test_export_settings(self):
+        """
+        All three maps should be exported with the configured PNG settings.
+        """
+        maps = self._full_render()
+        with patch.object(GameMaps, "PNG_COMPRESS_LEVEL", 1), patch("app.map.storage.save_image") as save_image, \
+             patch.object(MapTiles, "update", autospec=True) as update_tiles:
+            maps.export()
+
+        assert save_image.call_count == 3
+        assert {call.args[0] for call in save_image.call_args_list} == {
+            maps._main_map_filepath(),
+            os.path.join(self.game_images, "resourcemap.png"),
+            os.path.join(self.game_images, "controlmap.png")
+        }
+        for call in save_image.call_args_list + update_tiles.call_args_list:
+            assert call.kwargs == {"compress_level": 1, "optimize": False}
+        assert {call.args[0].name for call in update_tiles.call_args_list} == {"mainmap", "resourcemap", "controlmap"}
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
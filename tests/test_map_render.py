@@ -0,0 +1,135 @@
+"""
+File: test_map_render.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests for the background map rendering queue. Jobs run on threads here rather than worker processes and the maps themselves are not drawn.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import base
+
+from app.scenario.scenario import ScenarioInterface as SD
+from app import map_render
+from app.map import GameMaps
+from app.map_render import MapRenderer
+from app.nation.nations import Nations
+from app.region.regions import Regions
+
+GAME_ID = "HrQyxUeblAMjTJbTrxsp"
+GAMEDATA_FILE = "tests/mock-files/gamedata.json"
+REGDATA_FILE = "tests/mock-files/regdata.json"
+
+class TestMapRender(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        SD.load(GAME_ID)
+
+    def setUp(self):
+        with patch.object(Regions, "_regdata_path", return_value=str(REGDATA_FILE)):
+            Regions.initialize(GAME_ID)
+        with patch.object(Nations, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Nations.load(GAME_ID)
+        
+        self.game_images = tempfile.mkdtemp()
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.patches = [
+            patch.object(GameMaps, "_game_images_path", return_value=self.game_images),
+            patch.object(MapRenderer, "_get_executor", return_value=self.executor)
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        self.executor.shutdown()
+        for p in self.patches:
+            p.stop()
+        MapRenderer._queued.clear()
+        MapRenderer._running.clear()
+        shutil.rmtree(self.game_images)
+
+    def test_snapshot(self):
+        """
+        Jobs should get a copy of the game state and take over the regions marked for redraw.
+        """
+        region_id = Regions.ids()[0]
+        region = Regions.load(region_id)
+        region.data.owner_id = "1"
+        
+        job = MapRenderer.snapshot(GAME_ID)
+        region.data.owner_id = "2"
+
+        assert job["regions"][region_id]["regionData"]["ownerID"] == "1"
+        assert job["redraws"] == [region_id]
+        assert Regions.take_redraws() == {region_id}
+
+    def test_render_maps(self):
+        """
+        The worker should draw the maps from the snapshot rather than whatever state it last had.
+        """
+        region_id = Regions.ids()[0]
+        Regions.load(region_id).data.owner_id = "1"
+        job = MapRenderer.snapshot(GAME_ID)
+        Regions.load(region_id).data.owner_id = "2"
+
+        seen = {}
+        def update_all(maps):
+            seen["owner"] = Regions.load(region_id).data.owner_id
+            seen["redraws"] = set(Regions._redraws)
+
+        with patch.object(GameMaps, "update_all", autospec=True, side_effect=update_all):
+            map_render.render_maps(job)
+
+        assert seen == {"owner": "1", "redraws": {region_id}}
+        assert MapRenderer.status(GAME_ID)["state"] == "ready"
+
+    def test_failed_render(self):
+        job = MapRenderer.snapshot(GAME_ID)
+        with patch.object(GameMaps, "update_all", side_effect=ValueError("bad map")):
+            with self.assertRaises(ValueError):
+                map_render.render_maps(job)
+
+        status = MapRenderer.status(GAME_ID)
+        assert status["state"] == "failed"
+        assert "bad map" in status["error"]
+
+    def test_jobs_run_in_order(self):
+        """
+        Jobs for the same game should run one at a time in the order they were submitted.
+        """
+        release = threading.Event()
+        finished = threading.Event()
+        order = []
+        def render_maps(job):
+            release.wait(5)
+            order.append(job["submitted"])
+            if len(order) == 3:
+                finished.set()
+
+        with patch.object(map_render, "render_maps", side_effect=render_maps):
+            for i in range(3):
+                with patch.object(map_render, "datetime") as mock_datetime:
+                    mock_datetime.now.return_value.isoformat.return_value = str(i)
+                    MapRenderer.submit(GAME_ID)
+            
+            status = MapRenderer.status(GAME_ID)
+            assert status["state"] == "rendering"
+            assert status["queued"] == 2
+            
+            release.set()
+            finished.wait(5)
+            self.executor.shutdown(wait=True)
+
+        assert order == ["0", "1", "2"]
+        assert MapRenderer.status(GAME_ID) == {"state": "idle"}
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
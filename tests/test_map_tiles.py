@@ -0,0 +1,79 @@
+"""
+File: test_map_tiles.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests for cutting exported maps into tiles.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import base
+
+from PIL import Image, ImageDraw
+
+from app import storage
+from app.map import GameMaps
+from app.map_tiles import MapTiles
+
+GAME_ID = "HrQyxUeblAMjTJbTrxsp"
+
+class TestMapTiles(unittest.TestCase):
+
+    def setUp(self):
+        self.game_images = tempfile.mkdtemp()
+        self.images_patch = patch.object(GameMaps, "_game_images_path", return_value=self.game_images)
+        self.images_patch.start()
+        self.tiles = MapTiles(GAME_ID, "mainmap")
+        
+        self.image = Image.new("RGBA", (1000, 600), (40, 90, 160, 255))
+        ImageDraw.Draw(self.image).ellipse([100, 100, 900, 500], fill=(255, 0, 0, 255))
+
+    def tearDown(self):
+        self.images_patch.stop()
+        shutil.rmtree(self.game_images)
+
+    def _read_tile(self, zoom: int, x: int, y: int) -> Image.Image:
+        with Image.open(self.tiles.tile_filepath(zoom, x, y)) as tile:
+            return tile.convert("RGBA")
+
+    def test_pyramid(self):
+        self.tiles.update(self.image)
+
+        assert self.tiles.metadata() == {"width": 1000, "height": 600, "tileSize": 256, "maxZoom": 2}
+        assert sorted(os.listdir(os.path.join(self.tiles.tiles_filepath, "2"))) == sorted(f"{x}_{y}.png" for x in range(4) for y in range(3))
+        assert os.listdir(os.path.join(self.tiles.tiles_filepath, "0")) == ["0_0.png"]
+        
+        # full resolution tiles are plain crops, edge tiles are cut short
+        assert self._read_tile(2, 1, 1).tobytes() == self.image.crop((256, 256, 512, 512)).tobytes()
+        assert self._read_tile(2, 3, 2).size == (1000 - 768, 600 - 512)
+        assert self._read_tile(0, 0, 0).size == (250, 150)
+
+        with Image.open(self.tiles.preview_filepath) as preview:
+            assert preview.size == (MapTiles.PREVIEW_WIDTH, 614)
+
+    def test_only_changed_tiles_written(self):
+        self.tiles.update(self.image)
+        
+        ImageDraw.Draw(self.image).rectangle([10, 10, 20, 20], fill=(0, 0, 0, 255))
+        with patch("app.map_tiles.storage.save_image", wraps=storage.save_image) as save_image:
+            self.tiles.update(self.image, [(10, 10, 21, 21)])
+
+        written = sorted(os.path.relpath(call.args[0], self.tiles.tiles_filepath) for call in save_image.call_args_list)
+        assert written == ["0/0_0.png", "1/0_0.png", "2/0_0.png", "preview.png"]
+        assert self._read_tile(2, 0, 0).tobytes() == self.image.crop((0, 0, 256, 256)).tobytes()
+
+    def test_size_change_rebuilds(self):
+        self.tiles.update(self.image)
+        self.tiles.update(self.image.resize((300, 200)), [(0, 0, 1, 1)])
+
+        assert self.tiles.metadata()["maxZoom"] == 1
+        assert not os.path.exists(os.path.join(self.tiles.tiles_filepath, "2"))
+        assert sorted(os.listdir(os.path.join(self.tiles.tiles_filepath, "1"))) == ["0_0.png", "1_0.png"]
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
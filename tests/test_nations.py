@@ -0,0 +1,99 @@
+"""
+File: test_nations.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests for Nation object caching and the id/name lookups in the Nations class.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import base
+
+from app.scenario.scenario import ScenarioInterface as SD
+from app.nation.nations import Nations
+
+GAME_ID = "HrQyxUeblAMjTJbTrxsp"
+GAMEDATA_FILE = "tests/mock-files/gamedata.json"
+
+class TestNations(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        SD.load(GAME_ID)
+
+    def setUp(self):
+        with patch.object(Nations, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Nations.load(GAME_ID)
+
+    def test_identity(self):
+        """
+        The same Nation object should be returned no matter how it is looked up.
+        """
+        nation = Nations.get("1")
+        assert Nations.get("1") is nation
+        assert Nations.get("Nation A") is nation
+        assert Nations.get("nation a") is nation
+        assert next(iter(Nations)) is nation
+
+    def test_rename(self):
+        nation = Nations.get("2")
+        nation.name = "Renamed Nation"
+        assert Nations.get("renamed nation") is nation
+        with self.assertRaises(Exception):
+            Nations.get("Nation B")
+
+    def test_elimination(self):
+        assert len(Nations) == 4
+        nation = Nations.get("3")
+        nation.status = "Eliminated"
+        assert len(Nations) == 3
+        assert nation not in list(Nations)
+        assert Nations.get("3") is nation
+
+    def test_create(self):
+        Nations.create("5", "014")
+        assert len(Nations) == 5
+        assert Nations.get("5").player_id == "014"
+
+    def test_resources_are_numbers(self):
+        """
+        Resources saved as formatted strings by older versions are converted to numbers when loaded.
+        """
+        nation = Nations.get("1")
+        assert nation._resources["Dollars"] == {"stored": 100.0, "income": 5.0, "grossIncome": 5.0, "max": 100, "rate": 100}
+        assert nation.get_used_mc() == 0.0
+        assert nation.get_max_mc() == 0.0
+
+        nation.update_stockpile("Dollars", -2.345)
+        assert nation.get_stockpile("Dollars") == 97.66
+        nation.update_stockpile("Dollars", 1000)
+        assert nation.get_stockpile("Dollars") == 100
+        nation.update_max("Dollars", 20)
+        assert nation.get_max("Dollars") == 120
+
+    def test_modifiers(self):
+        """
+        Modifiers should be compiled from research and tags and rebuilt when either changes.
+        """
+        nation = Nations.get("1")
+        assert nation.modifiers is nation.modifiers
+        assert nation.modifiers.market_buy_rate == 1.0 - 0.2
+        assert nation.modifiers.alliance_limit == 3
+        assert nation.get_rate("Dollars") == 100
+
+        modifiers = nation.modifiers
+        nation.add_tag("Test Tag", {"Market Buy Modifier": 0.1, "Dollars Rate": 20, "Combat Roll Bonus": "2", "Expire Turn": 99})
+        assert nation.modifiers is not modifiers
+        assert nation.modifiers.market_buy_rate == 1.0 - 0.2 - 0.1
+        assert nation.modifiers.combat_roll_bonus == {"2": 1}
+        assert nation.get_rate("Dollars") == 120
+
+        nation.add_tech("Improved Logistics")
+        assert nation.modifiers.market_buy_rate == 1.0 - 0.2 - 0.1 - 0.2
+        assert nation.modifiers.trade_fee_index == 4
+
+        nation.remove_tag("Test Tag")
+        assert nation.modifiers.combat_roll_bonus == {}
+        assert nation.get_rate("Dollars") == 100
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+File: test_page_cache.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests that game pages are cached until the state of their game is saved again.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import base
+
+from flask import Flask
+
+from app import storage
+from app.page_cache import PageCache, cached_game_page
+
+GAME_ID = "HrQyxUeblAMjTJbTrxsp"
+
+class TestPageCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.version_patch = patch.object(storage, "state_version_path", side_effect=lambda game_id: os.path.join(self.temp_dir, game_id, "state_version.json"))
+        self.version_patch.start()
+        os.makedirs(os.path.join(self.temp_dir, GAME_ID))
+        PageCache.clear()
+
+        self.builds = []
+        app = Flask(__name__)
+
+        @app.route('/<full_game_id>/player<int:player_id>')
+        @cached_game_page
+        def player_page(full_game_id, player_id):
+            self.builds.append(player_id)
+            return f"{full_game_id} player {player_id} build {len(self.builds)}"
+        
+        self.client = app.test_client()
+
+    def tearDown(self):
+        self.version_patch.stop()
+        PageCache.clear()
+        shutil.rmtree(self.temp_dir)
+
+    def test_state_version(self):
+        assert storage.state_version(GAME_ID) == 0
+        storage.bump_state_version(GAME_ID)
+        storage.bump_state_version(GAME_ID)
+        assert storage.state_version(GAME_ID) == 2
+
+        # games without files are skipped
+        storage.bump_state_version("missing")
+        assert not os.path.exists(os.path.join(self.temp_dir, "missing"))
+
+    def test_page_cached_until_save(self):
+        first = self.client.get(f"/{GAME_ID}/player1")
+        second = self.client.get(f"/{GAME_ID}/player1")
+        assert first.data == second.data
+        assert first.headers["ETag"] == second.headers["ETag"]
+        assert "no-cache" in first.headers["Cache-Control"]
+        assert self.builds == [1]
+
+        # each set of url arguments is its own page
+        self.client.get(f"/{GAME_ID}/player2")
+        assert self.builds == [1, 2]
+
+        storage.bump_state_version(GAME_ID)
+        third = self.client.get(f"/{GAME_ID}/player1")
+        assert third.headers["ETag"] != first.headers["ETag"]
+        assert self.builds == [1, 2, 1]
+
+    def test_not_modified(self):
+        first = self.client.get(f"/{GAME_ID}/player1")
+        repeat = self.client.get(f"/{GAME_ID}/player1", headers={"If-None-Match": first.headers["ETag"]})
+        assert repeat.status_code == 304
+        assert repeat.data == b""
+
+        storage.bump_state_version(GAME_ID)
+        stale = self.client.get(f"/{GAME_ID}/player1", headers={"If-None-Match": first.headers["ETag"]})
+        assert stale.status_code == 200
+
+    def test_etag_stable(self):
+        """
+        Other worker processes and restarts of the site must send the same ETag, unless the site code changed.
+        """
+        first = self.client.get(f"/{GAME_ID}/player1")
+        PageCache.clear()
+        repeat = self.client.get(f"/{GAME_ID}/player1", headers={"If-None-Match": first.headers["ETag"]})
+        assert repeat.status_code == 304
+
+        with patch.object(PageCache, "CODE_VERSION", "updated"):
+            updated = self.client.get(f"/{GAME_ID}/player1", headers={"If-None-Match": first.headers["ETag"]})
+        assert updated.status_code == 200
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
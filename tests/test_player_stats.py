@@ -0,0 +1,101 @@
+"""
+File: test_player_stats.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests for the player statistics used by the leaderboard and profile pages.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import base
+
+from app.game.game_archive import GameArchive
+from app.player_stats import PlayerStats
+
+def game_record(name: str, number: int, started: str, ended: str, players: dict) -> dict:
+    player_data = {}
+    for profile_id, (gov, fp, score, victory) in players.items():
+        player_data[profile_id] = {"Nation Name": f"Nation {profile_id}", "Color": "#ffffff", "Government": gov, "Foreign Policy": fp, "Score": score, "Victory": victory}
+    return {"Name": name, "Number": number, "Statistics": {"Game Started": started, "Game Ended": ended}, "Player Data": player_data}
+
+GAME_RECORDS = {
+    "game1": game_record("Alpha", 1, "01/05/2025", "03/01/2025", {
+        "001": ("Republic", "Diplomatic", 3, 1),
+        "002": ("Monarchy", "Isolationist", 1, 0)
+    }),
+    "game2": game_record("Bravo", 2, "02/10/2025", "04/20/2025", {
+        "001": ("Monarchy", "Diplomatic", 2, 0),
+        "002": ("Monarchy", "Commercial", 2, 0),
+        "003": ("Republic", "Imperialist", 1, 0)
+    }),
+    "game3": game_record("Test Game", 3, "12/01/2024", "12/02/2024", {
+        "003": ("Theocracy", "Imperialist", 3, 1)
+    })
+}
+
+class TestPlayerStats(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.patches = [
+            patch.object(PlayerStats, "STATS_FILEPATH", os.path.join(self.temp_dir, "player_stats.json")),
+            patch.object(PlayerStats, "_cache", None),
+            patch.object(GameArchive, "ARCHIVE_DIRECTORY", os.path.join(self.temp_dir, "game_records")),
+            patch.object(GameArchive, "LEGACY_FILEPATH", os.path.join(self.temp_dir, "game_records.json")),
+            patch.object(GameArchive, "_index_cache", None)
+        ]
+        for p in self.patches:
+            p.start()
+        for game_id, record in GAME_RECORDS.items():
+            GameArchive.add(game_id, record)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def test_totals(self):
+        stats = PlayerStats.get("001")
+        assert (stats["wins"], stats["score"], stats["games"], stats["draws"], stats["losses"]) == (1, 5, 2, 1, 0)
+        assert stats["governments"] == {"Republic": 1, "Monarchy": 1}
+        assert (stats["firstGame"], stats["lastGame"]) == ("01/05/2025", "04/20/2025")
+
+        # test games do not count towards the leaderboard
+        stats = PlayerStats.get("003")
+        assert (stats["wins"], stats["score"], stats["games"], stats["draws"], stats["losses"]) == (0, 1, 1, 1, 0)
+        assert stats["firstGame"] == "12/01/2024"
+
+        assert PlayerStats.get("999")["games"] == 0
+
+    def test_leaderboard(self):
+        assert PlayerStats.leaderboard() == [["001", 1, 5, 2.5, 2], ["002", 0, 3, 1.5, 2], ["003", 0, 1, 1.0, 1]]
+        assert [PlayerStats.rank(profile_id) for profile_id in ["001", "002", "003", "999"]] == [1, 2, 3, 0]
+
+    def test_add_game(self):
+        """
+        Adding games one at a time should give the same totals as rebuilding from the archive.
+        """
+        game4_record = game_record("Charlie", 4, "05/01/2025", "06/01/2025", {
+            "002": ("Republic", "Commercial", 3, 1),
+            "004": ("Republic", "Diplomatic", 0, 0)
+        })
+
+        PlayerStats.rebuild()
+        PlayerStats.add_game("game4", game4_record)
+        PlayerStats.add_game("game4", game4_record)
+        added, ranks = PlayerStats._load_data()
+
+        GameArchive.add("game4", game4_record)
+        PlayerStats.rebuild()
+        rebuilt, ranks = PlayerStats._load_data()
+
+        assert added == rebuilt
+        assert PlayerStats.rank("002") == 1
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+File: test_region_income.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests that income updates only recalculate regions that changed and still give the same results as a full recalculation.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import base
+
+from app.scenario.scenario import ScenarioInterface as SD
+from app.alliance.alliances import Alliances
+from app.checks.region_income import RegionIncome
+from app.checks.update_income import UpdateIncomeProcess
+from app.game.games import Games
+from app.nation.nations import Nations
+from app.region.regions import Regions
+from app.war.wars import Wars
+
+GAME_ID = "HrQyxUeblAMjTJbTrxsp"
+GAMEDATA_FILE = "tests/mock-files/gamedata.json"
+REGDATA_FILE = "tests/mock-files/regdata.json"
+
+class TestRegionIncome(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        SD.load(GAME_ID)
+
+        with patch.object(Alliances, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Alliances.load(GAME_ID)
+
+        with patch.object(Wars, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Wars.load(GAME_ID)
+
+    def setUp(self):
+        with patch.object(Regions, "_regdata_path", return_value=str(REGDATA_FILE)):
+            Regions.initialize(GAME_ID)
+        with patch.object(Nations, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Nations.load(GAME_ID)
+        self.active_events = Games._data[GAME_ID]["activeEvents"]
+
+    def tearDown(self):
+        Games._data[GAME_ID]["activeEvents"] = self.active_events
+
+    def run_income(self) -> dict:
+        UpdateIncomeProcess(GAME_ID).run()
+        return {nation.id: (nation.income_details.data, nation.stats.regions_owned, nation.stats.regions_occupied) for nation in Nations}
+
+    def assert_matches_full_update(self):
+        """
+        Runs an income update and checks it against one that recalculates every region.
+        """
+        results = self.run_income()
+        RegionIncome.reset()
+        assert self.run_income() == results
+
+    def test_unchanged(self):
+        self.run_income()
+        with patch.object(RegionIncome, "_calculate") as calculate:
+            self.run_income()
+            calculate.assert_not_called()
+
+    def test_region_changes(self):
+        self.run_income()
+
+        region = Regions.load("NTHWY")
+        region.data.owner_id = "4"
+        for region in Regions:
+            if region.data.owner_id == "3" and region.improvement.name == "Industrial Zone":
+                region.improvement.set("Central Bank", starting_health=99)
+                Nations.get("3").improvement_counts["Central Bank"] += 1
+                break
+
+        with patch.object(RegionIncome, "_calculate", wraps=RegionIncome._calculate) as calculate:
+            self.run_income()
+            assert 0 < calculate.call_count < len(Regions)
+
+        self.assert_matches_full_update()
+
+    def test_nation_changes(self):
+        self.run_income()
+
+        nation = Nations.get("4")
+        nation.add_tag("Test Tag", {"Capital Boost": True, "Improvement Income": {"Industrial Zone": {"Basic Materials": 1}}})
+        self.assert_matches_full_update()
+
+        nation.add_tech("Coal Mining")
+        self.assert_matches_full_update()
+
+    def test_pandemic(self):
+        self.run_income()
+
+        Games._data[GAME_ID]["activeEvents"] = {"Pandemic": {}}
+        Regions.load("NTHWY").data.infection = 3
+        self.assert_matches_full_update()
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""
+File: test_regions_save.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests that saving regions only rewrites the chunks holding regions that changed.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import base
+
+from app import storage
+from app.scenario.scenario import ScenarioInterface as SD
+from app.region.regions import Regions
+
+GAME_ID = "HrQyxUeblAMjTJbTrxsp"
+REGDATA_FILE = "tests/mock-files/regdata.json"
+
+class TestRegionsSave(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.regdata_file = os.path.join(self.temp_dir, "regdata.json")
+        shutil.copy(REGDATA_FILE, self.regdata_file)
+        self.patches = [
+            patch.object(Regions, "_regdata_path", return_value=self.regdata_file),
+            patch.object(Regions, "_chunks_path", return_value=os.path.join(self.temp_dir, "regdata")),
+            patch.object(storage, "bump_state_version")
+        ]
+        for p in self.patches:
+            p.start()
+        SD.load(GAME_ID)
+        Regions.initialize(GAME_ID)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def test_migrate_to_chunks(self):
+        with open(REGDATA_FILE, 'r') as f:
+            regdata = json.load(f)
+
+        Regions.save()
+        assert not os.path.exists(self.regdata_file)
+        assert len(os.listdir(os.path.join(self.temp_dir, "regdata"))) == Regions.REGION_CHUNKS + 1
+
+        Regions.initialize(GAME_ID)
+        assert Regions._data == regdata
+
+    def test_changed_regions(self):
+        Regions.save()
+
+        region = Regions.load("NTHWY")
+        region.unit.health = 2
+        region.data.infection = 1
+        region.improvement.countdown = 4
+        region.data.owner_id = region.data.owner_id    # unchanged values do not count
+        assert Regions._changed == {"NTHWY"}
+
+        with patch.object(storage, "save_json", wraps=storage.save_json) as save_json:
+            Regions.save()
+        saved_files = [call.args[0] for call in save_json.call_args_list]
+        assert saved_files == [Regions._chunk_path(Regions._chunk_of("NTHWY"), 2), Regions._chunk_index_path()]
+        assert Regions._changed == set()
+
+        Regions.initialize(GAME_ID)
+        region = Regions.load("NTHWY")
+        assert (region.unit.health, region.data.infection, region.improvement.countdown) == (2, 1, 4)
+
+    def test_failed_save(self):
+        """
+        A save that fails after writing some of its chunks must leave the previous save intact.
+        """
+        Regions.save()
+        with open(REGDATA_FILE, 'r') as f:
+            regdata = json.load(f)
+
+        changed_ids = {}
+        for region_id in regdata:
+            changed_ids.setdefault(Regions._chunk_of(region_id), region_id)
+        for region_id in list(changed_ids.values())[:4]:
+            Regions.load(region_id).data.infection = 5
+
+        saved_files = []
+        def fail_on_third_write(filepath, data, **kwargs):
+            if len(saved_files) == 2:
+                raise OSError("disk full")
+            saved_files.append(filepath)
+            return storage.save_json(filepath, data, **kwargs)
+        with patch.object(storage, "save_json", side_effect=fail_on_third_write):
+            with self.assertRaises(OSError):
+                Regions.save()
+
+        Regions.initialize(GAME_ID)
+        assert Regions._data == regdata
+
+        # the next save only keeps the chunks it points to and those of the save before it
+        Regions.load("NTHWY").data.infection = 5
+        Regions.save()
+        Regions.initialize(GAME_ID)
+        assert Regions.load("NTHWY").data.infection == 5
+        assert sum(1 for region in Regions if region.data.infection == 5) == 1
+        assert len(os.listdir(os.path.join(self.temp_dir, "regdata"))) == Regions.REGION_CHUNKS + 2
+
+    def test_unnumbered_chunks(self):
+        """
+        Games saved before chunk files were numbered by save are still read, and are switched over on their next save.
+        """
+        with open(REGDATA_FILE, 'r') as f:
+            regdata = json.load(f)
+        chunks_path = os.path.join(self.temp_dir, "regdata")
+        os.makedirs(chunks_path)
+        for chunk in range(Regions.REGION_CHUNKS):
+            storage.save_json(os.path.join(chunks_path, f"{chunk}.json"), {region_id: region_data for region_id, region_data in regdata.items() if Regions._chunk_of(region_id) == chunk})
+        storage.save_json(os.path.join(chunks_path, "chunks.json"), {"chunks": Regions.REGION_CHUNKS})
+        os.remove(self.regdata_file)
+
+        Regions.initialize(GAME_ID)
+        assert Regions._data == regdata
+
+        Regions.load("NTHWY").data.infection = 5
+        Regions.save()
+        Regions.initialize(GAME_ID)
+        assert Regions.load("NTHWY").data.infection == 5
+
+    def test_nothing_changed(self):
+        Regions.save()
+        with patch.object(storage, "save_json") as save_json:
+            Regions.save()
+        save_json.assert_not_called()
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+File: test_shortages.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests that resource shortages remove consumers until the shortage is resolved.
+"""
+
+import random
+import unittest
+from unittest.mock import patch
+
+import base
+
+from app.scenario.scenario import ScenarioInterface as SD
+from app.checks import resolve_shortages
+from app.nation.nations import Nations
+from app.notifications import Notifications
+from app.region.regions import Regions
+
+GAME_ID = "HrQyxUeblAMjTJbTrxsp"
+GAMEDATA_FILE = "tests/mock-files/gamedata.json"
+REGDATA_FILE = "tests/mock-files/regdata.json"
+
+class TestShortages(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        SD.load(GAME_ID)
+
+    def setUp(self):
+        with patch.object(Regions, "_regdata_path", return_value=str(REGDATA_FILE)):
+            Regions.initialize(GAME_ID)
+        with patch.object(Nations, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Nations.load(GAME_ID)
+        with patch.object(Notifications, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Notifications.load(GAME_ID)
+
+    def unit_regions(self, nation_id: str) -> dict[str, str]:
+        # only infantry is counted in the unit totals of nation C in the mock game
+        return {region.id: region.unit.name for region in Regions if region.unit.name == "Infantry" and region.unit.owner_id == nation_id}
+
+    def resolve_food_shortage(self, seed: int) -> dict[str, str]:
+        self.setUp()
+        nation = Nations.get("3")
+        nation.update_stockpile("Food", -1 * nation.get_stockpile("Food") - 0.6)
+        resolve_shortages.resolve_resource_shortages(random.Random(seed))
+        return self.unit_regions("3")
+
+    def test_food_shortage(self):
+        """
+        Nation C has no food to spare, units should be removed until its food stockpile is no longer negative.
+        """
+        unit_regions = self.unit_regions("3")
+        unit_counts = dict(Nations.get("3").unit_counts)
+
+        remaining = self.resolve_food_shortage(1)
+        nation = Nations.get("3")
+        removed = {region_id: unit_name for region_id, unit_name in unit_regions.items() if region_id not in remaining}
+
+        assert removed and remaining.items() <= unit_regions.items()
+        assert nation.get_stockpile("Food") >= 0
+        for unit_name, count in unit_counts.items():
+            assert nation.unit_counts[unit_name] == count - list(removed.values()).count(unit_name)
+        shortage_strs = [string for priority, string in Notifications if "food shortages" in string]
+        for region_id, unit_name in removed.items():
+            assert f"{nation.name} lost a {unit_name} in {region_id} due to food shortages." in shortage_strs
+
+    def test_seeded(self):
+        """
+        The same seed should always remove the same units, and every infantry unit should be removable.
+        """
+        assert self.resolve_food_shortage(7) == self.resolve_food_shortage(7)
+
+        removed = set()
+        for seed in range(30):
+            removed.update(set(self.unit_regions("3")) - set(self.resolve_food_shortage(seed)))
+        self.setUp()
+        assert removed == set(self.unit_regions("3"))
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+File: test_storage.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests for the game file storage helpers.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import base
+
+from PIL import Image
+
+from app import storage
+
+REGDATA_FILE = "tests/mock-files/regdata.json"
+
+class TestStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_file = os.path.join(self.temp_dir, "regdata.json")
+        shutil.copy(REGDATA_FILE, self.temp_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_round_trip(self):
+        data = storage.load_json(self.temp_file)
+        storage.save_json(self.temp_file, data)
+        assert storage.load_json(self.temp_file) == data
+
+    def test_compact_smaller_than_pretty(self):
+        data = storage.load_json(self.temp_file)
+        pretty_file = os.path.join(self.temp_dir, "pretty.json")
+        storage.save_json(self.temp_file, data)
+        storage.save_json(pretty_file, data, pretty=True)
+        assert os.path.getsize(self.temp_file) < os.path.getsize(pretty_file)
+
+    def test_failed_write_keeps_original(self):
+        """
+        A write that fails partway through must leave the original file and no temporary files behind.
+        """
+        with open(self.temp_file, 'r') as f:
+            original = f.read()
+
+        with self.assertRaises(TypeError):
+            storage.save_json(self.temp_file, {"a": 1, "b": object()})
+
+        with open(self.temp_file, 'r') as f:
+            assert f.read() == original
+        assert os.listdir(self.temp_dir) == ["regdata.json"]
+
+    def test_permissions(self):
+        """
+        Replacing a file must keep its permissions, and new files get the usual permissions rather than owner only.
+        """
+        os.chmod(self.temp_file, 0o644)
+        storage.save_json(self.temp_file, storage.load_json(self.temp_file))
+        assert os.stat(self.temp_file).st_mode & 0o777 == 0o644
+
+        new_file = os.path.join(self.temp_dir, "new.json")
+        with patch.object(storage, "_umask", 0o022):
+            storage.save_json(new_file, {})
+            storage.save_image(os.path.join(self.temp_dir, "0.png"), Image.new("RGBA", (4, 4)))
+        assert os.stat(new_file).st_mode & 0o777 == 0o644
+        assert os.stat(os.path.join(self.temp_dir, "0.png")).st_mode & 0o777 == 0o644
+
+    def test_json_lines_after(self):
+        """
+        Each read should only return complete lines added since the previous read.
+        """
+        log_file = os.path.join(self.temp_dir, "log.jsonl")
+        storage.append_line(log_file, '["a"]')
+        entries, offset = storage.load_json_lines_after(log_file, 0)
+        assert entries == [["a"]]
+
+        end = os.path.getsize(log_file)
+        storage.append_line(log_file, '["b"]')
+        assert storage.load_json_lines_after(log_file, offset, end) == ([], offset)
+        with open(log_file, 'a') as f:
+            f.write('["c"')
+        entries, offset = storage.load_json_lines_after(log_file, offset)
+        assert entries == [["b"]]
+        with open(log_file, 'a') as f:
+            f.write(']\n')
+        assert storage.load_json_lines_after(log_file, offset)[0] == [["c"]]
+
+    def test_export_pretty(self):
+        export_file = os.path.join(self.temp_dir, "export", "regdata.json")
+        storage.export_pretty(self.temp_file, export_file)
+        with open(export_file, 'r') as f:
+            assert json.load(f) == storage.load_json(self.temp_file)
+
+    def test_save_image(self):
+        image_file = os.path.join(self.temp_dir, "0.png")
+        storage.save_image(image_file, Image.new("RGBA", (4, 4), (255, 0, 0, 255)))
+        with Image.open(image_file) as image:
+            assert image.getpixel((0, 0)) == (255, 0, 0, 255)
+
+        with self.assertRaises(TypeError):
+            storage.save_image(image_file, Image.new("RGBA", (4, 4)), compress_level="bad")
+
+        with Image.open(image_file) as image:
+            assert image.getpixel((0, 0)) == (255, 0, 0, 255)
+        assert sorted(os.listdir(self.temp_dir)) == ["0.png", "regdata.json"]
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""
+File: test_turn_journal.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests that the game history can rebuild the state of a game after any recorded turn.
+"""
+
+import copy
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import base
+
+from app import storage
+from app.scenario.scenario import ScenarioInterface as SD
+from app.game.games import Games
+from app.game.game_state import GameState
+from app.game.game_summaries import GameSummaries
+from app.game.turn_journal import TurnJournal
+from app.nation.nations import Nations
+from app.notifications import Notifications
+from app.region.regions import Regions
+
+GAME_ID = "HrQyxUeblAMjTJbTrxsp"
+GAMEDATA_FILE = "tests/mock-files/gamedata.json"
+REGDATA_FILE = "tests/mock-files/regdata.json"
+
+class TestTurnJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.gamedata_file = os.path.join(self.temp_dir, "gamedata.json")
+        self.regdata_file = os.path.join(self.temp_dir, "regdata.json")
+        shutil.copy(GAMEDATA_FILE, self.gamedata_file)
+        shutil.copy(REGDATA_FILE, self.regdata_file)
+        self.game_data = copy.deepcopy(Games._data[GAME_ID])
+        self.patches = [
+            patch.object(GameState, "_gamedata_path", return_value=self.gamedata_file),
+            patch.object(Regions, "_regdata_path", return_value=self.regdata_file),
+            patch.object(Regions, "_chunks_path", return_value=os.path.join(self.temp_dir, "regdata")),
+            patch.object(TurnJournal, "_history_path", return_value=os.path.join(self.temp_dir, "history")),
+            patch.object(TurnJournal, "SNAPSHOT_INTERVAL", 3),
+            patch.object(Games, "save", create=True),
+            patch.object(GameSummaries, "update"),
+            patch.object(storage, "bump_state_version")
+        ]
+        for p in self.patches:
+            p.start()
+        SD.load(GAME_ID)
+        GameState.load(GAME_ID)
+        Regions.initialize(GAME_ID)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        Games._data[GAME_ID] = self.game_data
+        shutil.rmtree(self.temp_dir)
+
+    def play_turns(self, count: int) -> list[dict]:
+        """
+        Records a few turns with changes to the game, nations, notifications, and regions. Returns the state after each one.
+        """
+
+        states = []
+        for i in range(count):
+            journal = TurnJournal(GAME_ID)
+            game = Games.load(GAME_ID)
+            game.turn += 1
+            Nations.get("1").name = f"Nation A {i}"
+            Nations.get("2").tags[f"Tag {i}"] = {"Expire Turn": 99}
+            Nations.get("2").tags.pop(f"Tag {i - 1}", None)
+            Notifications.initialize(GAME_ID)
+            Notifications.add(f"Turn {game.turn}", 1)
+            Regions.load("NTHWY").unit.health = i + 1
+            journal.commit()
+            states.append(TurnJournal.current_state(GAME_ID))
+        return states
+
+    def test_materialize(self):
+        before = TurnJournal.current_state(GAME_ID)
+        states = self.play_turns(7)
+
+        entries = TurnJournal.entries(GAME_ID)
+        assert [entry["entry"] for entry in entries] == list(range(8))
+        assert [entry["turn"] for entry in entries] == list(range(33, 41))
+        assert sorted(os.listdir(os.path.join(self.temp_dir, "history", "snapshots"))) == ["0.json", "3.json", "6.json"]
+
+        assert TurnJournal.materialize(GAME_ID, 0) == before
+        for i, state in enumerate(states):
+            assert TurnJournal.materialize(GAME_ID, i + 1) == state
+
+        assert TurnJournal.entry_at_turn(GAME_ID, 35) == 2
+        with self.assertRaises(ValueError):
+            TurnJournal.entry_at_turn(GAME_ID, 10)
+
+    def test_rollback(self):
+        states = self.play_turns(5)
+
+        TurnJournal.rollback(GAME_ID, 35)
+        assert TurnJournal.current_state(GAME_ID) == states[1]
+        assert Nations.get("1").name == "Nation A 1"
+        assert [entry["entry"] for entry in TurnJournal.entries(GAME_ID)] == [0, 1, 2]
+        assert sorted(os.listdir(os.path.join(self.temp_dir, "history", "snapshots"))) == ["0.json"]
+
+        # the restored files are the ones loaded next time
+        GameState.load(GAME_ID)
+        Regions.initialize(GAME_ID)
+        assert TurnJournal.current_state(GAME_ID) == states[1]
+
+        # history continues from the restored turn
+        self.play_turns(2)
+        assert [entry["turn"] for entry in TurnJournal.entries(GAME_ID)] == [33, 34, 35, 36, 37]
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""
+File: test_wars.py
+Author: Ian Hampton
+Created Date: 17th October 2026
+
+Tests for the ongoing war lookups in the Wars class.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import base
+
+from app.scenario.scenario import ScenarioInterface as SD
+from app.alliance.alliances import Alliances
+from app.nation.nations import Nations
+from app.truce.truces import Truces
+from app.war.wars import Wars
+
+GAME_ID = "HrQyxUeblAMjTJbTrxsp"
+GAMEDATA_FILE = "tests/mock-files/gamedata.json"
+
+class TestWars(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        SD.load(GAME_ID)
+
+    def setUp(self):
+        with patch.object(Alliances, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Alliances.load(GAME_ID)
+        with patch.object(Nations, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Nations.load(GAME_ID)
+        with patch.object(Truces, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Truces.load(GAME_ID)
+        with patch.object(Wars, "_gamedata_path", return_value=str(GAMEDATA_FILE)):
+            Wars.load(GAME_ID)
+
+    def test_create(self):
+        """
+        A new war should be found from either side and both nations should no longer be at peace.
+        """
+        Wars.create("3", "4", "Animosity")
+
+        war_name = Wars.get_war_name("3", "4")
+        assert war_name is not None
+        assert Wars.get_war_name("4", "3") == war_name
+        assert Wars.get(war_name) is Wars.get(war_name)
+        assert not Wars.is_at_peace("3")
+        assert not Wars.is_at_peace("4")
+        assert [war.name for war in Wars.get_active_wars("3")] == [war_name]
+
+    def test_add_combatant(self):
+        """
+        A nation that joins an ongoing war should be at war with every other combatant.
+        """
+        Wars.create("3", "4", "Animosity")
+        war = Wars.get(Wars.get_war_name("3", "4"))
+
+        war.add_combatant(Nations.get("1"), "Secondary Attacker", "TBD")
+        assert Wars.get_war_name("1", "4") == war.name
+        assert Wars.get_war_name("1", "3") == war.name
+        assert not Wars.is_at_peace("1")
+
+    def test_war_ends(self):
+        """
+        Nations should return to peace once their war is over.
+        """
+        Wars.create("3", "4", "Animosity")
+        war = Wars.get(Wars.get_war_name("3", "4"))
+
+        war.outcome = "White Peace"
+        assert Wars.get_war_name("3", "4") is None
+        assert Wars.is_at_peace("3")
+        assert Wars.is_at_peace("4")
+        assert Wars.get_active_wars("3") == []
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file